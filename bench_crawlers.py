@@ -0,0 +1,240 @@
+"""
+리뷰 크롤러 처리량 벤치마크
+replay_server 로 캡처 페이지를 재생하여 Coupang(main3, 동기)과 AsyncCoupangCrawler(optm)를 측정
+
+측정 항목: pages/s, reviews/s, 페이지 지연 p50/p99 (재시도 포함), 페이지당 CPU 시간
+(재생 서버는 별도 프로세스에서 실행되므로 CPU 시간에 포함되지 않음, 비동기 크롤러는 파싱 프로세스 풀 포함)
+
+사용법: python bench_crawlers.py [--crawler sync|async|both] [--products 4] [--pages 20]
+        [--latency 0.05-0.2] [--error-rate 0.02] [--block-rate 0.01]
+        [--page-delay 0-0] [--max-concurrent 80] [--batch-size 5]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import resource
+import shutil
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+from replay_server import REVIEW_PATH, STATS_PATH, start_in_process
+
+PAGE_SIZE = 5
+
+
+def parse_range(value: str) -> Tuple[float, float]:
+    """"0.05-0.2" -> (0.05, 0.2), "0.1" -> (0.1, 0.1)"""
+    low, _, high = value.partition("-")
+    return float(low), float(high or low)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def cpu_time(children: bool = False) -> float:
+    """현재 프로세스(및 종료된 자식 프로세스)의 user + system CPU 시간"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def server_stats(base_url: str) -> Dict:
+    with urllib.request.urlopen(base_url + STATS_PATH, timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+@contextlib.contextmanager
+def quiet(verbose: bool):
+    """크롤러 로그 출력 억제 (출력 비용 자체는 측정에 포함)"""
+    if verbose:
+        yield
+    else:
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            yield
+
+
+class BenchResult:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.pages = 0
+        self.reviews = 0
+        self.latencies: List[float] = []
+        self.elapsed = 0.0
+        self.cpu = 0.0
+        self.requests: Dict = {}
+
+    def report(self) -> None:
+        elapsed = max(self.elapsed, 1e-9)
+        print("-" * 60)
+        print(f"[{self.name}]")
+        print(f"페이지: {self.pages}개 / 리뷰: {self.reviews}개 / 소요: {self.elapsed:.2f}초")
+        print(f"처리량: {self.pages / elapsed:8.2f} pages/s  {self.reviews / elapsed:8.2f} reviews/s")
+        print(f"페이지 지연: p50 {percentile(self.latencies, 50) * 1000:.0f}ms / "
+              f"p99 {percentile(self.latencies, 99) * 1000:.0f}ms")
+        print(f"CPU: {self.cpu / max(self.pages, 1) * 1000:.1f}ms/page (총 {self.cpu:.2f}초)")
+        if self.requests:
+            print(f"서버 응답: 요청 {self.requests.get('requests', 0)}건 / 200 {self.requests.get('200', 0)}건 "
+                  f"(빈 페이지 {self.requests.get('empty', 0)}건) / 403 {self.requests.get('403', 0)}건 / "
+                  f"503 {self.requests.get('503', 0)}건")
+
+
+def bench_sync(base_url: str, args) -> BenchResult:
+    """main3.Coupang: 상품을 순서대로, 페이지를 하나씩 fetch (리뷰 저장/체크포인트 flush 포함)"""
+    from main3 import Coupang, SaveData
+
+    result = BenchResult("Coupang (main3, 동기)")
+    with quiet(args.verbose):
+        crawler = Coupang()
+        crawler.base_review_url = base_url + REVIEW_PATH
+        crawler.page_delay_min, crawler.page_delay_max = args.page_delay
+        crawler.delay_min, crawler.delay_max = args.retry_delay
+
+        before = server_stats(base_url)
+        cpu_started = cpu_time()
+        started = time.perf_counter()
+        for product in range(args.products):
+            sd = SaveData(file_suffix=f"_bench_{product}")
+            crawler.page_title = None
+            crawler.title = f"bench {product}"
+            for page in range(1, args.pages + 1):
+                payload = {
+                    "productId": str(1000 + product), "page": page, "size": PAGE_SIZE,
+                    "sortBy": "ORDER_SCORE_ASC", "ratings": "", "q": "", "viRoleCode": 2, "ratingSummary": True,
+                }
+                rows_before = sd.writer.row_count
+                page_started = time.perf_counter()
+                if crawler.fetch(payload=payload, sd=sd):
+                    result.pages += 1
+                result.latencies.append(time.perf_counter() - page_started)
+                sd.flush()
+                result.reviews += sd.writer.row_count - rows_before
+            sd.writer.close()
+        result.elapsed = time.perf_counter() - started
+        result.cpu = cpu_time() - cpu_started
+        crawler.session_pool.close_all()
+
+    after = server_stats(base_url)
+    result.requests = {key: after.get(key, 0) - before.get(key, 0) for key in ('requests', '200', 'empty', '403', '503')}
+    return result
+
+
+async def _run_async(base_url: str, args, result: BenchResult) -> None:
+    from optm import AsyncCoupangCrawler, SaveData
+
+    crawler = AsyncCoupangCrawler(max_concurrent=args.max_concurrent, parse_workers=args.parse_workers)
+    crawler.base_review_url = base_url + REVIEW_PATH
+    crawler.page_delay_range = args.page_delay
+    crawler.batch_size = args.batch_size
+
+    # 페이지별 지연 측정 (요청 + 재시도 + 파싱, 취소된 투기적 요청은 제외)
+    fetch_and_parse_page = crawler.fetch_and_parse_page
+
+    async def timed_fetch(session, payload, page_num, product_title):
+        page_started = time.perf_counter()
+        parsed = await fetch_and_parse_page(session, payload, page_num, product_title)
+        result.latencies.append(time.perf_counter() - page_started)
+        if parsed and parsed[0]:
+            result.pages += 1
+        return parsed
+
+    crawler.fetch_and_parse_page = timed_fetch
+
+    await crawler.parse_stage.start()
+    await crawler.get_session()
+    try:
+        async def crawl(product: int) -> int:
+            sd = SaveData(file_suffix=f"_bench_{product}")
+            return await crawler.crawl_product_pages_batch(
+                str(2000 + product), f"bench {product}", sd, review_count=args.pages * PAGE_SIZE)
+
+        # 상품 슬롯 수만큼 동시에 진행 (start_async 와 같은 방식)
+        semaphore = asyncio.Semaphore(crawler.max_products_in_flight)
+
+        async def limited(product: int) -> int:
+            async with semaphore:
+                return await crawl(product)
+
+        totals = await asyncio.gather(*[limited(product) for product in range(args.products)])
+        result.reviews = sum(totals)
+    finally:
+        await crawler.close_session()
+        await crawler.parse_stage.close()
+
+
+def bench_async(base_url: str, args) -> BenchResult:
+    """optm.AsyncCoupangCrawler: 상품 슬롯 + 페이지 파이프라인 + 파싱 프로세스 풀"""
+    result = BenchResult("AsyncCoupangCrawler (optm, 비동기)")
+    with quiet(args.verbose):
+        before = server_stats(base_url)
+        cpu_started = cpu_time() + cpu_time(children=True)
+        started = time.perf_counter()
+        asyncio.run(_run_async(base_url, args, result))
+        result.elapsed = time.perf_counter() - started
+        # 파싱 프로세스 풀은 종료 후 회수되므로 자식 프로세스 CPU 시간에 포함됨
+        result.cpu = cpu_time() + cpu_time(children=True) - cpu_started
+
+    after = server_stats(base_url)
+    result.requests = {key: after.get(key, 0) - before.get(key, 0) for key in ('requests', '200', 'empty', '403', '503')}
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="리뷰 크롤러 오프라인 처리량 벤치마크")
+    parser.add_argument("--crawler", choices=("sync", "async", "both"), default="both")
+    parser.add_argument("--html", nargs="+", default=["html.txt"], help="재생할 캡처 페이지")
+    parser.add_argument("--products", type=int, default=4)
+    parser.add_argument("--pages", type=int, default=20, help="상품당 리뷰 페이지 수")
+    parser.add_argument("--latency", type=parse_range, default=(0.05, 0.2), help="서버 응답 지연 (초, 예: 0.05-0.2)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율")
+    parser.add_argument("--block-rate", type=float, default=0.0, help="403 응답 비율")
+    parser.add_argument("--page-delay", type=parse_range, default=(0.0, 0.0), help="페이지 간 대기 (초)")
+    parser.add_argument("--retry-delay", type=parse_range, default=(1.0, 2.0), help="동기 크롤러 재시도 대기 (초)")
+    parser.add_argument("--max-concurrent", type=int, default=80)
+    parser.add_argument("--batch-size", type=int, default=5, help="비동기 크롤러 상품당 페이지 워커 수")
+    parser.add_argument("--parse-workers", type=int, default=None)
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그 출력")
+    args = parser.parse_args(argv)
+    html_paths = [os.path.abspath(path) for path in args.html]
+
+    server, base_url = start_in_process(
+        pages=html_paths, latency=args.latency, error_rate=args.error_rate,
+        block_rate=args.block_rate, review_count=args.pages * PAGE_SIZE, page_size=PAGE_SIZE,
+    )
+
+    # 결과 파일/체크포인트/캐시는 임시 디렉터리에 기록
+    workdir = tempfile.mkdtemp(prefix="bench_crawlers_")
+    original_dir = os.getcwd()
+    os.chdir(workdir)
+
+    print("=" * 60)
+    print(f"🧪 재생 서버: {base_url} (지연 {args.latency[0]}-{args.latency[1]}초, "
+          f"503 {args.error_rate:.0%}, 403 {args.block_rate:.0%})")
+    print(f"📦 상품 {args.products}개 x {args.pages}페이지, 페이지 간 대기 {args.page_delay[0]}-{args.page_delay[1]}초")
+
+    try:
+        results = []
+        if args.crawler in ("sync", "both"):
+            results.append(bench_sync(base_url, args))
+        if args.crawler in ("async", "both"):
+            results.append(bench_async(base_url, args))
+        for result in results:
+            result.report()
+        print("=" * 60)
+    finally:
+        os.chdir(original_dir)
+        shutil.rmtree(workdir, ignore_errors=True)
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
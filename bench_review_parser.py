@@ -0,0 +1,107 @@
+"""
+리뷰 파서 벤치마크
+기존 BeautifulSoup(html.parser) + select_one 방식과 review_parser(lxml) 방식 비교
+
+사용법: python bench_review_parser.py [html 파일] [반복 횟수]
+"""
+
+import re
+import sys
+import time
+
+from bs4 import BeautifulSoup as bs
+
+from review_parser import parse_reviews
+
+
+def parse_reviews_legacy(html: str, title: str) -> list:
+    """기존 Coupang.fetch / extract_review_data 파싱 로직 (비교 기준)"""
+    soup = bs(html, "html.parser")
+    reviews = []
+    for article in soup.select("article.sdp-review__article__list"):
+        review_date_elem = article.select_one("div.sdp-review__article__list__info__product-info__reg-date")
+        user_name_elem = article.select_one("span.sdp-review__article__list__info__user__name")
+        rating_elem = article.select_one("div.sdp-review__article__list__info__product-info__star-orange")
+        if rating_elem and rating_elem.get("data-rating"):
+            try:
+                rating = int(rating_elem.get("data-rating"))
+            except (ValueError, TypeError):
+                rating = 0
+        else:
+            rating = 0
+        prod_name_elem = article.select_one("div.sdp-review__article__list__info__product-info__name")
+        headline_elem = article.select_one("div.sdp-review__article__list__headline")
+        review_content_elem = article.select_one(
+            "div.sdp-review__article__list__review__content.js_reviewArticleContent"
+        )
+        if not review_content_elem:
+            review_content_elem = article.select_one("div.sdp-review__article__list__review > div")
+        if review_content_elem:
+            review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
+        else:
+            review_content = "등록된 리뷰내용이 없습니다"
+        answer_elem = article.select_one("span.sdp-review__article__list__survey__row__answer")
+        seller_name_elem = article.select_one("div.sdp-review__article__list__info__product-info__seller_name")
+        helpful_count_elem = article.select_one("span.js_reviewArticleHelpfulCount")
+        review_images = article.select("div.sdp-review__article__list__attachment__list img")
+
+        reviews.append({
+            "title": title,
+            "prod_name": prod_name_elem.text.strip() if prod_name_elem else "-",
+            "review_date": review_date_elem.text.strip() if review_date_elem else "-",
+            "user_name": user_name_elem.text.strip() if user_name_elem else "-",
+            "rating": rating,
+            "headline": headline_elem.text.strip() if headline_elem else "등록된 헤드라인이 없습니다",
+            "review_content": review_content,
+            "answer": answer_elem.text.strip() if answer_elem else "맛 평가 없음",
+            "helpful_count": helpful_count_elem.text.strip() if helpful_count_elem else "0",
+            "seller_name": seller_name_elem.text.replace("판매자: ", "").strip() if seller_name_elem else "-",
+            "image_count": len(review_images),
+        })
+    return reviews
+
+
+def bench(func, html, repeat: int) -> float:
+    """평균 실행 시간(ms) 측정"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html, "bench")
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    file_path = sys.argv[1] if len(sys.argv) > 1 else "html.txt"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    legacy = parse_reviews_legacy(html, "bench")
+    fast = parse_reviews(html, "bench")
+
+    print("=" * 50)
+    print(f"📄 입력 파일: {file_path} ({len(html):,} 문자)")
+    print(f"🔁 반복 횟수: {repeat}회")
+    print(f"📝 추출 리뷰 수: 기존 {len(legacy)}개 / lxml {len(fast)}개")
+
+    if legacy != fast:
+        print("❌ 추출 결과가 일치하지 않습니다.")
+        for old, new in zip(legacy, fast):
+            for key in old:
+                if old[key] != new.get(key):
+                    print(f"  {key}: {old[key]!r} != {new.get(key)!r}")
+        sys.exit(1)
+    print("✅ 추출 결과 일치")
+
+    legacy_ms = bench(parse_reviews_legacy, html, repeat)
+    fast_ms = bench(parse_reviews, html, repeat)
+
+    print("-" * 50)
+    print(f"기존 (bs4 + html.parser): {legacy_ms:8.2f} ms/page")
+    print(f"lxml (review_parser)    : {fast_ms:8.2f} ms/page")
+    print(f"속도 향상: {legacy_ms / fast_ms:.1f}배")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+REVIEW_DATE_RE = re.compile(r'(\d{4})\D+(\d{1,2})\D+(\d{1,2})')
+
+
+def atomic_write_json(path: str, data) -> None:
+    """임시 파일에 기록 후 교체 (저장 중 중단되어도 기존 파일 유지)"""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_json(path: str, default, label: str):
+    """JSON 상태 파일 로드 (없거나 손상되면 default)"""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[WARNING] {label} 파일을 읽을 수 없어 새로 시작합니다: {e}")
+        return default
+
+
+def parse_review_date(value):
+    """"2025.05.26" / "2025-5-26" -> date (형식이 다르거나 "-" 이면 None)"""
+    match = REVIEW_DATE_RE.search(str(value or ""))
+    if not match:
+        return None
+    try:
+        return datetime.date(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+
+def review_fingerprint(review: dict) -> str:
+    """작성일자 + 구매자명 + 헤드라인 해시 (리뷰 식별용)"""
+    key = "\t".join(str(review.get(field, "")) for field in ("review_date", "user_name", "headline"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+class ReviewCursor:
+    """최신순으로 수집 중인 상품 1개의 증분 크롤링 상태
+
+    filter() 에 페이지 순서대로 리뷰를 넘기면 저장된 high-water mark 날짜보다 오래된 리뷰를
+    만나는 순간 reached 가 True 가 되고, 그 이후 리뷰는 걸러낸다.
+    기준 날짜와 같은 날의 리뷰는 저장된 지문(그날 수집한 리뷰 전체)으로 이미 수집한 리뷰만 제외한다.
+    """
+
+    def __init__(self, product_code: str, mark=None) -> None:
+        self.product_code = str(product_code)
+        self.mark = mark or {}
+
+        self.known = set(self.mark.get("fingerprints", []))
+        self.mark_date = self.mark.get("review_date")
+        self.mark_day = parse_review_date(self.mark_date)
+        self.reached = False
+        self.new_count = 0
+        # 이번 실행에서 처음 본 가장 최신 날짜와 그날 리뷰의 지문 (최신순)
+        self.newest_date = None
+        self.newest_day = None
+        self.newest = []
+
+    def filter(self, reviews: list) -> list:
+        """새 리뷰만 반환 (기준 날짜보다 오래된 리뷰를 만나면 reached 설정 후 중단)"""
+        if self.reached:
+            return []
+
+        new_reviews = []
+        for review in reviews:
+            fingerprint = review_fingerprint(review)
+            review_date = review.get("review_date", "-")
+            day = parse_review_date(review_date)
+            if self.mark_day and day and day < self.mark_day:
+                self.reached = True
+                break
+            if fingerprint in self.known:
+                if not self.mark_day:
+                    # 기준 날짜를 알 수 없으면(이전 형식) 지문 일치 지점에서 중단
+                    self.reached = True
+                    break
+                continue  # 기준 날짜와 같은 날 이미 수집한 리뷰
+
+            new_reviews.append(review)
+            if day and (self.newest_day is None or day > self.newest_day):
+                self.newest_date, self.newest_day, self.newest = review_date, day, []
+            if day and day == self.newest_day:
+                self.newest.append(fingerprint)
+
+        self.new_count += len(new_reviews)
+        return new_reviews
+
+    def describe(self) -> str:
+        if not self.mark:
+            return "저장된 기준점 없음 - 전체 수집"
+        return f"기준점 {self.mark_date} 이후 리뷰만 수집 (마지막 갱신 {self.mark.get('updated_at', '-')})"
+
+
+class ReviewStateStore:
+    """상품별 high-water mark 저장소 (JSON 파일, 원자적 교체 저장)
+
+    {상품코드: {"review_date": 가장 최신 작성일자,
+               "fingerprints": 그 날짜에 수집한 리뷰 지문 전체,
+               "updated_at": 갱신 시각}}
+    """
+
+    def __init__(self, path: str = "crawl_state.json") -> None:
+        self.path = path
+        self.marks = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        self.marks = load_json(self.path, {}, "증분 크롤링 상태")
+        if self.marks:
+            print(f"[INFO] 증분 크롤링 상태 로드: {len(self.marks)}개 상품 ({self.path})")
+
+    def begin(self, product_code) -> ReviewCursor:
+        """상품 크롤링 시작 시 현재 기준점으로 커서 생성"""
+        return ReviewCursor(product_code, self.marks.get(str(product_code)))
+
+    def commit(self, cursor: ReviewCursor) -> None:
+        """상품 크롤링 완료 후 기준점 갱신 (날짜가 있는 새 리뷰가 없으면 변경 없음)"""
+        if cursor.newest_day is None:
+            return
+        if cursor.mark_day and cursor.newest_day < cursor.mark_day:
+            return
+
+        fingerprints = list(cursor.newest)
+        if cursor.newest_day == cursor.mark_day:
+            # 같은 날 새 리뷰가 추가된 경우 기존 지문과 합침
+            seen = set(fingerprints)
+            fingerprints += [fp for fp in cursor.mark.get("fingerprints", []) if fp not in seen]
+
+        with self._lock:
+            self.marks[cursor.product_code] = {
+                "review_date": cursor.newest_date,
+                "fingerprints": fingerprints,
+                "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            atomic_write_json(self.path, self.marks)
+
+
+class CrawlCheckpoint:
+    """상품별 진행 상태 체크포인트 (JSON 파일, 원자적 교체 저장)
+
+    {상품코드: {"status": "in_progress" | "done" | "failed",
+               "last_page": 첫 페이지부터 빠짐없이 저장(또는 빈 페이지 확인)된 마지막 페이지,
+               "title": 저널/엑셀 파일명에 쓰인 상품명,
+               "file_suffix": 파일명 접미사,
+               "reviews": last_page 까지 저장된 리뷰 수 (재개 시 저널을 이 길이로 되돌림),
+               "failed_pages": 요청에 실패한 페이지 (다음 실행에서 첫 실패 페이지부터 재개),
+               "updated_at": 갱신 시각}}
+
+    페이지 단위 기록은 해당 페이지 리뷰가 저널에 fsync 된 뒤에만, 요청에 성공했거나 빈 페이지로
+    확인된 페이지에 대해서만 호출해야 한다. 실행이 끝까지 완료되면 complete_run() 으로 정리한다.
+    """
+
+    def __init__(self, path: str = "crawl_checkpoint.json") -> None:
+        self.path = path
+        self.products = load_json(path, {}, "크롤링 체크포인트")
+        self._lock = threading.Lock()
+
+    def has_progress(self) -> bool:
+        return bool(self.products)
+
+    def describe(self) -> str:
+        counts = {}
+        for entry in self.products.values():
+            counts[entry.get("status")] = counts.get(entry.get("status"), 0) + 1
+        return (f"완료 {counts.get('done', 0)}개, 진행 중 {counts.get('in_progress', 0)}개, "
+                f"실패 {counts.get('failed', 0)}개")
+
+    def get(self, product_code):
+        return self.products.get(str(product_code))
+
+    def is_done(self, product_code) -> bool:
+        entry = self.get(product_code)
+        return bool(entry) and entry.get("status") == "done"
+
+    def resume_point(self, product_code):
+        """진행 중이던 상품이면 (다음 페이지, 체크포인트 항목), 아니면 (1, None)"""
+        entry = self.get(product_code)
+        if entry and entry.get("status") == "in_progress" and entry.get("last_page", 0) > 0:
+            return entry["last_page"] + 1, entry
+        return 1, None
+
+    def record_page(self, product_code, page_num: int, title=None,
+                    file_suffix: str = "", reviews: int = 0) -> None:
+        """페이지 저장 완료 기록"""
+        self._update(product_code, status="in_progress", last_page=page_num,
+                     title=title, file_suffix=file_suffix, reviews=reviews)
+
+    def finish(self, product_code, success: bool, reviews: int = 0, failed_pages=()) -> None:
+        """상품 완료 기록 (실패한 상품은 다음 실행에서 다시 시도)
+
+        요청에 실패한 페이지가 있으면 완료로 기록하지 않고 진행 중으로 남겨,
+        다음 실행에서 첫 실패 페이지(last_page 다음)부터 다시 수집한다.
+        """
+        if success and failed_pages:
+            print(f"[WARNING] 요청 실패 페이지 {len(failed_pages)}개 {sorted(failed_pages)[:10]} - "
+                  f"다음 실행에서 {min(failed_pages)}페이지부터 다시 수집합니다.")
+            self._update(product_code, status="in_progress", failed_pages=sorted(failed_pages))
+            return
+        self._update(product_code, status="done" if success else "failed", reviews=reviews, failed_pages=[])
+
+    def complete_run(self) -> None:
+        """실행이 끝까지 완료되면 완료/실패 상품 기록을 정리
+
+        다음 실행(일일 증분 갱신 포함)은 모든 상품을 다시 크롤링하고,
+        실패 페이지가 남아 진행 중인 상품만 이어서 수집한다.
+        """
+        with self._lock:
+            self.products = {code: entry for code, entry in self.products.items()
+                             if entry.get("status") == "in_progress"}
+            if self.products:
+                atomic_write_json(self.path, self.products)
+            elif os.path.exists(self.path):
+                os.remove(self.path)
+
+    def reset(self) -> None:
+        """체크포인트 초기화 (처음부터 다시 크롤링)"""
+        with self._lock:
+            self.products = {}
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _update(self, product_code, **fields) -> None:
+        with self._lock:
+            entry = self.products.setdefault(str(product_code), {})
+            entry.update(fields)
+            entry["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            atomic_write_json(self.path, self.products)
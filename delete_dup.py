@@ -1,7 +1,12 @@
 import json
+import sys
+import time
 from typing import List, Dict, Any
+import numpy as np
 import pandas as pd
 
+from product_data import ProductData, parse_float, parse_int
+
 
 def remove_duplicate_product_ids(data: List[Dict[str, Any]], keep_strategy: str = 'first') -> List[Dict[str, Any]]:
     """
@@ -26,7 +31,7 @@ def remove_duplicate_product_ids(data: List[Dict[str, Any]], keep_strategy: str
         unique_products = []
 
         for product in data:
-            product_id = product.get('product_id')
+            product_id = product_id_of(product)
             if product_id not in seen_ids:
                 seen_ids.add(product_id)
                 unique_products.append(product)
@@ -39,7 +44,7 @@ def remove_duplicate_product_ids(data: List[Dict[str, Any]], keep_strategy: str
         unique_products = []
 
         for product in reversed(data):
-            product_id = product.get('product_id')
+            product_id = product_id_of(product)
             if product_id not in seen_ids:
                 seen_ids.add(product_id)
                 unique_products.append(product)
@@ -52,7 +57,7 @@ def remove_duplicate_product_ids(data: List[Dict[str, Any]], keep_strategy: str
 
         # product_id별로 그룹화
         for product in data:
-            product_id = product.get('product_id')
+            product_id = product_id_of(product)
             if product_id not in product_groups:
                 product_groups[product_id] = []
             product_groups[product_id].append(product)
@@ -70,42 +75,33 @@ def remove_duplicate_product_ids(data: List[Dict[str, Any]], keep_strategy: str
         return unique_products
 
 
+def product_id_of(product) -> Any:
+    return product.product_id if isinstance(product, ProductData) else product.get('product_id')
+
+
+def numeric_field(product, typed_field: str, raw_field: str, parse, default):
+    """ProductData 는 추출 시 변환해 둔 값을 그대로, dict 는 표시용 문자열("2,690")을 변환하여 사용"""
+    if isinstance(product, ProductData):
+        value = getattr(product, typed_field)
+    else:
+        value = parse(product.get(raw_field))
+    return default if value is None else value
+
+
 def select_best_product(products: List[Dict[str, Any]], strategy: str) -> Dict[str, Any]:
-    """여러 제품 중에서 전략에 따라 최적의 제품을 선택"""
+    """여러 제품 중에서 전략에 따라 최적의 제품을 선택 (dict 또는 ProductData)"""
 
     if strategy == 'highest_rating':
         # 평점이 높은 순으로 정렬
-        def get_rating(product):
-            try:
-                return float(product.get('rating', '0'))
-            except (ValueError, TypeError):
-                return 0
-
-        return max(products, key=get_rating)
+        return max(products, key=lambda p: numeric_field(p, 'rating_value', 'rating', parse_float, 0))
 
     elif strategy == 'most_reviews':
         # 리뷰 수가 많은 순으로 정렬
-        def get_review_count(product):
-            try:
-                review_count = product.get('review_count', '0')
-                # 숫자에서 쉼표 제거
-                return int(review_count.replace(',', ''))
-            except (ValueError, TypeError, AttributeError):
-                return 0
-
-        return max(products, key=get_review_count)
+        return max(products, key=lambda p: numeric_field(p, 'review_count_value', 'review_count', parse_int, 0))
 
     elif strategy == 'lowest_price':
-        # 가격이 낮은 순으로 정렬
-        def get_price(product):
-            try:
-                price = product.get('price', '0')
-                # 쉼표 제거하고 숫자만 추출
-                return int(price.replace(',', ''))
-            except (ValueError, TypeError, AttributeError):
-                return float('inf')  # 가격 정보가 없으면 무한대로 설정
-
-        return min(products, key=get_price)
+        # 가격이 낮은 순으로 정렬 (가격 정보가 없으면 무한대로 설정)
+        return min(products, key=lambda p: numeric_field(p, 'price_value', 'price', parse_int, float('inf')))
 
     else:
         # 기본값: 첫 번째 항목 반환
@@ -130,36 +126,122 @@ def analyze_duplicates(data: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+STRATEGIES = ['first', 'last', 'highest_rating', 'most_reviews', 'lowest_price']
+
+
+def build_product_frame(data: List[Dict[str, Any]]) -> pd.DataFrame:
+    """중복 제거에 필요한 컬럼만 열 형태로 적재하고 숫자 필드를 한 번에 정규화
+
+    - _group: product_id 그룹 번호 (처음 등장한 순서, None 도 하나의 그룹)
+    - _rating / _reviews: 변환 실패 시 0
+    - _price: 변환 실패 시 inf (select_best_product 와 같은 기준)
+    """
+    df = pd.DataFrame.from_records(data, columns=['product_id', 'rating', 'review_count', 'price'])
+    codes, _ = pd.factorize(df['product_id'], use_na_sentinel=False)
+
+    def to_number(column: pd.Series, default: float, strip_commas: bool = True) -> np.ndarray:
+        # 숫자 문자열의 쉼표 제거 후 벡터화 변환 (변환 불가/누락은 default)
+        text = column.astype(str)
+        if strip_commas:
+            text = text.str.replace(',', '', regex=False)
+        try:
+            # 모든 값이 숫자인 경우의 빠른 경로
+            values = text.astype(float)
+        except ValueError:
+            values = pd.to_numeric(text, errors='coerce')
+        return values.fillna(default).to_numpy(dtype=float)
+
+    return pd.DataFrame({
+        '_group': codes,
+        '_rating': to_number(df['rating'], 0, strip_commas=False),
+        '_reviews': to_number(df['review_count'], 0),
+        '_price': to_number(df['price'], np.inf),
+    })
+
+
+def dedup_indices(frame: pd.DataFrame, strategies: List[str] = STRATEGIES) -> Dict[str, np.ndarray]:
+    """모든 전략의 유지할 행 번호를 한 번에 계산 (그룹 번호는 한 번만 계산하여 공유)
+
+    각 전략은 (그룹, 기준값, 원래 순서) 정렬 후 그룹별 첫 행을 고르는 벡터 연산이며,
+    기존 remove_duplicate_product_ids 와 같은 항목/순서를 반환한다.
+    """
+    groups = frame['_group'].to_numpy()
+    position = np.arange(len(frame))
+    sort_keys = {
+        'highest_rating': -frame['_rating'].to_numpy(),
+        'most_reviews': -frame['_reviews'].to_numpy(),
+        'lowest_price': frame['_price'].to_numpy(),
+    }
+
+    result = {}
+    for strategy in strategies:
+        if strategy == 'last':
+            keep = ~pd.Series(groups).duplicated(keep='last').to_numpy()
+            result[strategy] = position[keep]
+            continue
+
+        if strategy in sort_keys:
+            order = np.lexsort((position, sort_keys[strategy], groups))
+        else:
+            # 'first' 및 알 수 없는 전략: 첫 번째 항목 유지
+            order = np.lexsort((position, groups))
+        sorted_groups = groups[order]
+        is_head = np.empty(len(order), dtype=bool)
+        is_head[:1] = True
+        is_head[1:] = sorted_groups[1:] != sorted_groups[:-1]
+        # 그룹 번호 순서 = product_id 첫 등장 순서
+        result[strategy] = order[is_head]
+
+    return result
+
+
+def write_json_records(path: str, data: List[Dict[str, Any]], indices) -> int:
+    """선택된 항목을 JSON 배열로 한 줄에 하나씩 스트리밍 저장"""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for i in indices:
+            f.write(',\n' if count else '\n')
+            f.write(json.dumps(data[i], ensure_ascii=False))
+            count += 1
+        f.write('\n]\n')
+    return count
+
+
 # 사용 예시
-def main():
+def main(input_path: str = '홈플래닛_products_20250603_180442.json', output_prefix: str = 'homeplanet_products'):
     # JSON 파일 읽기
-    with open('홈플래닛_products_20250603_180442.json', 'r', encoding='utf-8') as f:
+    with open(input_path, 'r', encoding='utf-8') as f:
         products_data = json.load(f)
 
+    start_time = time.time()
+    frame = build_product_frame(products_data)
+    group_sizes = np.bincount(frame['_group'].to_numpy()) if len(frame) else np.array([], dtype=int)
+
     print("=== 중복 분석 ===")
-    duplicate_analysis = analyze_duplicates(products_data)
-    print(f"전체 제품 수: {duplicate_analysis['total_products']}")
-    print(f"고유 product_id 수: {duplicate_analysis['unique_product_ids']}")
-    print(f"중복된 product_id 수: {duplicate_analysis['duplicate_product_ids']}")
+    print(f"전체 제품 수: {len(frame)}")
+    print(f"고유 product_id 수: {len(group_sizes)}")
+    print(f"중복된 product_id 수: {int((group_sizes > 1).sum())}")
 
-    if duplicate_analysis['duplicates_detail']:
+    duplicated_groups = np.flatnonzero(group_sizes > 1)
+    if len(duplicated_groups):
         print("\n중복된 product_id들:")
-        for pid, count in duplicate_analysis['duplicates_detail'].items():
-            print(f"  {pid}: {count}개")
+        first_rows = dedup_indices(frame, ['first'])['first']
+        for group in duplicated_groups:
+            pid = products_data[first_rows[group]].get('product_id')
+            print(f"  {pid}: {group_sizes[group]}개")
 
-    # 여러 전략으로 중복 제거
-    strategies = ['first', 'last', 'highest_rating', 'most_reviews', 'lowest_price']
+    # 모든 전략을 한 번에 계산 후 전략별로 스트리밍 저장
+    kept = dedup_indices(frame, STRATEGIES)
+    print(f"\n[INFO] 전략 {len(STRATEGIES)}개 계산 완료 ({time.time() - start_time:.2f}초)")
 
-    for strategy in strategies:
+    for strategy in STRATEGIES:
         print(f"\n=== {strategy} 전략으로 중복 제거 ===")
-
-        cleaned_data = remove_duplicate_product_ids(products_data, strategy)
-        print(f"중복 제거 후 제품 수: {len(cleaned_data)}")
+        print(f"중복 제거 후 제품 수: {len(kept[strategy])}")
 
         # 결과 저장
-        output_filename = f'homeplanet_products_dedup_{strategy}.json'
-        with open(output_filename, 'w', encoding='utf-8') as f:
-            json.dump(cleaned_data, f, ensure_ascii=False, indent=2)
+        output_filename = f'{output_prefix}_dedup_{strategy}.json'
+        write_json_records(output_filename, products_data, kept[strategy])
 
         print(f"저장 완료: {output_filename}")
 
@@ -177,4 +259,5 @@ def remove_duplicates_with_pandas(data: List[Dict[str, Any]], keep: str = 'first
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # 사용법: python delete_dup.py [입력 JSON] [출력 파일 접두사]
+    main(*sys.argv[1:3])
\ No newline at end of file
@@ -1,7 +1,5 @@
 from bs4 import BeautifulSoup as bs
 from pathlib import Path
-from openpyxl import Workbook
-from fake_useragent import UserAgent
 from requests.exceptions import RequestException, Timeout, ConnectTimeout, ReadTimeout
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -18,183 +16,182 @@ import sys
 import random
 import itertools
 import json
+import threading
+from collections import deque
+from contextlib import contextmanager
 from urllib.parse import urlencode
 
+from crawl_state import CrawlCheckpoint, ReviewStateStore
+from page_planner import PagePlanner
+from proxy_health import run_health_check
+from proxy_perf import ProxyPerfStore
+from proxy_quarantine import ProxyQuarantine
+from review_parser import parse_reviews_with_total
+from review_writer import StreamingReviewWriter
+from session_pool import ProxySessionPool
+from ua_pool import UAPool, is_windows_ua
+
 
 class NonWindowsUserAgent:
-    """Windows를 제외한 User-Agent 생성기 (fake_useragent 기반)"""
+    """Windows를 제외한 User-Agent 생성기 (fake_useragent 기반)
 
-    def __init__(self):
-        self.ua = UserAgent()
-        self.max_attempts = 20  # 최대 시도 횟수
+    시작 시 1회 구성한 UAPool(디스크 캐시)에서 O(1) 랜덤 선택하며,
+    UA 별 sec-ch-ua-platform / sec-ch-ua-mobile 값도 미리 계산되어 있다.
+    """
 
-        # Windows 관련 키워드들
-        self.windows_keywords = [
-            'Windows NT', 'Win32', 'Win64', 'WOW64', 'Windows 10', 'Windows 11',
-            'Windows 7', 'Windows 8', 'Microsoft Windows', 'win32', 'win64'
-        ]
+    def __init__(self):
+        self.pool = UAPool.shared()
 
     def _is_windows_ua(self, user_agent):
         """User-Agent가 Windows인지 확인"""
-        if not user_agent:
-            return True
-
-        user_agent_lower = user_agent.lower()
-        return any(keyword.lower() in user_agent_lower for keyword in self.windows_keywords)
-
-    def _get_non_windows_ua(self, ua_type='random'):
-        """Windows가 아닌 User-Agent를 가져오기"""
-        for attempt in range(self.max_attempts):
-            try:
-                if ua_type == 'chrome':
-                    user_agent = self.ua.chrome
-                elif ua_type == 'firefox':
-                    user_agent = self.ua.firefox
-                elif ua_type == 'safari':
-                    user_agent = self.ua.safari
-                else:
-                    user_agent = self.ua.random
+        return is_windows_ua(user_agent)
 
-                if not self._is_windows_ua(user_agent):
-                    print(f"[DEBUG] User-Agent 선택 성공 (시도 {attempt + 1}회): {user_agent[:50]}...")
-                    return user_agent
-                else:
-                    print(f"[DEBUG] Windows UA 감지, 재시도 중... (시도 {attempt + 1}/{self.max_attempts})")
-
-            except Exception as e:
-                print(f"[WARNING] User-Agent 생성 오류 (시도 {attempt + 1}): {e}")
-                continue
-
-        # 모든 시도가 실패한 경우 안전한 Mac UA 반환
-        print(f"[WARNING] {self.max_attempts}회 시도 후에도 적절한 UA를 찾지 못했습니다. 기본 Mac UA 사용")
-        return "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    def pick(self, ua_type='random'):
+        """(User-Agent, sec-ch-ua-platform, sec-ch-ua-mobile) 랜덤 선택"""
+        return self.pool.pick(ua_type)
 
     @property
     def random(self):
         """랜덤한 Non-Windows User-Agent 반환"""
-        return self._get_non_windows_ua('random')
+        return self.pool.pick('random')[0]
 
     @property
     def chrome(self):
         """Chrome Non-Windows User-Agent 반환"""
-        return self._get_non_windows_ua('chrome')
+        return self.pool.pick('chrome')[0]
 
     @property
     def firefox(self):
         """Firefox Non-Windows User-Agent 반환"""
-        return self._get_non_windows_ua('firefox')
+        return self.pool.pick('firefox')[0]
 
     @property
     def safari(self):
         """Safari Non-Windows User-Agent 반환"""
-        return self._get_non_windows_ua('safari')
+        return self.pool.pick('safari')[0]
 
     def get_mobile_ua(self):
         """모바일 전용 User-Agent 반환"""
-        for attempt in range(self.max_attempts):
-            try:
-                # 모바일 브라우저 위주로 시도
-                browser_types = ['chrome', 'safari', 'random']
-                ua_type = random.choice(browser_types)
-
-                user_agent = self._get_non_windows_ua(ua_type)
-
-                # 모바일 키워드가 있는지 확인
-                mobile_keywords = ['Mobile', 'Android', 'iPhone', 'iPad']
-                if any(keyword in user_agent for keyword in mobile_keywords):
-                    return user_agent
-
-            except Exception as e:
-                print(f"[WARNING] 모바일 UA 생성 오류: {e}")
-                continue
-
-        # 실패 시 안전한 Android UA 반환
-        return "Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+        return self.pool.pick('mobile')[0]
 
     def get_desktop_ua(self):
         """데스크톱 전용 User-Agent 반환 (Mac 위주)"""
-        for attempt in range(self.max_attempts):
-            try:
-                user_agent = self._get_non_windows_ua('random')
-
-                # 데스크톱이면서 모바일이 아닌 것
-                if 'Macintosh' in user_agent and 'Mobile' not in user_agent:
-                    return user_agent
-
-            except Exception as e:
-                print(f"[WARNING] 데스크톱 UA 생성 오류: {e}")
-                continue
-
-        # 실패 시 안전한 Mac UA 반환
-        return "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15"
+        return self.pool.pick('desktop')[0]
 
 
 class ProxyRotator:
-    def __init__(self, proxy_list=None):
+    def __init__(self, proxy_list=None, perf_store=None, health_results=None):
         """
         프록시 로테이터 초기화
         proxy_list: ['ip:port:username:password', ...] 형태의 프록시 리스트
+        perf_store: 실행 간 공유되는 프록시 성능 기록 (ProxyPerfStore, 없으면 메모리에서만 관리)
+        health_results: 헬스 체크 결과 {프록시: ProxyCheck} (측정 응답 시간을 초기 점수에 반영)
         """
         self.proxy_list = proxy_list if proxy_list else []
-        self.proxy_cycle = itertools.cycle(self.proxy_list) if self.proxy_list else None
+        self.perf_store = perf_store
+        if self.perf_store and self.proxy_list:
+            # 이전 실행에서 빠르고 안정적이었던 프록시부터 사용
+            self.perf_store.load(self.proxy_list)
+            if health_results:
+                self.perf_store.seed_health(health_results)
+            self.proxy_list = sorted(self.proxy_list, key=self.perf_store.score, reverse=True)
+        # 순환 대기열: 격리된 프록시는 꺼낼 때 버리고, 격리 해제 시 대기열에 없으면 맨 뒤에 다시 추가
+        self.rotation = deque(self.proxy_list)
+        self.queued = set(self.rotation)  # 순환 대기열에 들어 있는 프록시 (중복 추가 방지)
         self.current_proxy = None
-        self.failed_proxies = set()
+        self.current_failed = False  # 현재 프록시가 선택 이후 실패했는지 (다음 요청부터 교체)
+        self.current_uses = 0  # 현재 프록시로 보낸 요청 수 (sticky 모드 요청 상한용)
+        self.failed_proxies = set()  # 현재 격리 중인 프록시
+        self.quarantine = ProxyQuarantine()
         self.proxy_failure_count = {}  # 프록시별 실패 횟수 추적
-        self.max_failures_per_proxy = 3  # 프록시당 최대 실패 허용 횟수
+        self.max_failures_per_proxy = 3  # 격리 전 프록시당 최대 실패 허용 횟수
+
+    def readmit_expired(self):
+        """쿨다운이 끝난 프록시를 순환 대기열에 복귀 (한 번 더 실패하면 더 긴 쿨다운으로 재격리)"""
+        for proxy in self.quarantine.release_expired():
+            self.failed_proxies.discard(proxy)
+            self.proxy_failure_count[proxy] = self.max_failures_per_proxy - 1
+            # 격리 중 아직 꺼내지지 않아 대기열에 남아 있으면 그 자리에서 다시 사용됨
+            if proxy not in self.queued:
+                self.queued.add(proxy)
+                self.rotation.append(proxy)
+            print(f"[PROXY] 격리 해제: {proxy.split(':')[0]}")
 
     def get_next_proxy(self):
-        """다음 프록시를 반환"""
-        if not self.proxy_cycle:
+        """다음 프록시를 반환 (모두 격리 중이면 가장 빨리 풀리는 프록시를 기다림)"""
+        if not self.proxy_list:
             return None
 
-        # 사용 가능한 프록시를 찾을 때까지 순환
-        attempts = 0
-        max_attempts = len(self.proxy_list) * 2  # 무한 루프 방지
+        while True:
+            self.readmit_expired()
 
-        while attempts < max_attempts:
-            proxy = next(self.proxy_cycle)
+            while self.rotation:
+                proxy = self.rotation.popleft()
+                if proxy in self.failed_proxies:
+                    self.queued.discard(proxy)
+                    continue  # 격리 중 - 해제될 때 다시 추가됨
 
-            # 완전히 실패한 프록시가 아니라면 사용
-            if proxy not in self.failed_proxies:
+                self.rotation.append(proxy)
                 self.current_proxy = proxy
+                self.current_failed = False
+                self.current_uses = 0
                 proxy_ip = proxy.split(':')[0]
                 failure_count = self.proxy_failure_count.get(proxy, 0)
                 print(f"[PROXY] 현재 사용 중인 프록시: {proxy_ip} (실패 횟수: {failure_count})")
                 return proxy
 
-            attempts += 1
-
-        # 모든 프록시가 완전히 실패했다면 실패 목록을 초기화
-        if len(self.failed_proxies) == len(self.proxy_list):
-            print("[WARNING] 모든 프록시가 실패했습니다. 실패 목록과 카운터를 초기화합니다.")
-            self.failed_proxies.clear()
-            self.proxy_failure_count.clear()
+            wait = self.quarantine.next_release_in()
+            if wait is None:
+                return None
+            print(f"[WARNING] 모든 프록시가 격리 중입니다. {wait:.0f}초 후 첫 프록시가 복귀합니다.")
+            time.sleep(wait + 0.1)
 
-            # 첫 번째 프록시 반환
-            if self.proxy_list:
-                self.current_proxy = self.proxy_list[0]
-                proxy_ip = self.current_proxy.split(':')[0]
-                print(f"[PROXY] 초기화 후 사용 중인 프록시: {proxy_ip}")
-                return self.current_proxy
+    def get_sticky_proxy(self, max_uses):
+        """현재 프록시를 max_uses 회까지 계속 사용 (선택 이후 실패, 격리, 상한 도달 시 새 프록시 선택)
 
-        return None
+        sticky 모드(옵션)에서만 사용: 연속 요청이 같은 프록시(세션 풀의 같은 세션)로 가도록 하여 연결을 재사용
+        """
+        proxy = self.current_proxy
+        if (not proxy or self.current_failed or proxy in self.failed_proxies
+                or self.current_uses >= max_uses):
+            proxy = self.get_next_proxy()
+        self.current_uses += 1
+        return proxy
 
     def mark_proxy_failed(self, proxy):
-        """프록시를 실패로 표시 (누적 실패 관리)"""
+        """프록시를 실패로 표시 (누적 실패 관리, 최대 실패 횟수 도달 시 격리)"""
+        if proxy == self.current_proxy:
+            self.current_failed = True
+        if self.perf_store:
+            self.perf_store.record_failure(proxy)
+        if proxy in self.failed_proxies:
+            return
+
         if proxy not in self.proxy_failure_count:
             self.proxy_failure_count[proxy] = 0
 
         self.proxy_failure_count[proxy] += 1
         proxy_ip = proxy.split(':')[0]
 
-        # 최대 실패 횟수에 도달하면 완전히 제거
+        # 최대 실패 횟수에 도달하면 쿨다운 동안 격리 (격리될수록 쿨다운 증가)
         if self.proxy_failure_count[proxy] >= self.max_failures_per_proxy:
             self.failed_proxies.add(proxy)
-            print(f"[WARNING] 프록시 완전 실패로 제거: {proxy_ip} ({self.proxy_failure_count[proxy]}회 실패)")
+            cooldown = self.quarantine.quarantine(proxy)
+            print(f"[WARNING] 프록시 격리: {proxy_ip} ({self.proxy_failure_count[proxy]}회 실패, "
+                  f"{cooldown:.0f}초 후 복귀)")
         else:
             print(
                 f"[WARNING] 프록시 일시 실패: {proxy_ip} ({self.proxy_failure_count[proxy]}/{self.max_failures_per_proxy} 실패)")
 
+    def mark_proxy_success(self, proxy, response_time=None):
+        """프록시 요청 성공 기록 (성능 기록 저장소에 응답 시간 반영)"""
+        if not proxy:
+            return
+        self.proxy_failure_count[proxy] = 0
+        self.quarantine.forgive(proxy)
+        if self.perf_store:
+            self.perf_store.record_success(proxy, response_time)
+
     def get_available_proxy_count(self):
         """사용 가능한 프록시 개수 반환"""
         if not self.proxy_list:
@@ -223,11 +220,22 @@ class ProxyRotator:
 
 
 class ChromeDriver:
-    def __init__(self, proxy_rotator=None) -> None:
+    """필요할 때만 시작하는 Selenium Chrome 드라이버
+
+    - 생성 시에는 브라우저를 띄우지 않고, get_driver() / use() 로 처음 필요할 때 시작
+    - 한 번 시작한 드라이버는 상품이 바뀌어도 재사용
+    - 마지막 사용 후 idle_timeout 초 동안 쓰이지 않으면 자동 종료 (다음 사용 시 다시 시작)
+    """
+
+    def __init__(self, proxy_rotator=None, idle_timeout: float = 300) -> None:
         self.proxy_rotator = proxy_rotator
         self.ua = NonWindowsUserAgent()  # Windows 제외 User-Agent 사용
-        self.set_options()
-        self.set_driver()
+        self.idle_timeout = idle_timeout
+        self.driver = None
+        self.last_used = 0.0
+        self._in_use = 0
+        self._idle_timer = None
+        self._lock = threading.RLock()
 
     def set_options(self) -> None:
         self.options = Options()
@@ -264,16 +272,71 @@ class ChromeDriver:
                     print(f"[DEBUG] Selenium 프록시 설정: {ip}:{port}")
 
     def set_driver(self) -> None:
+        started = time.time()
         self.driver = webdriver.Chrome(options=self.options)
         # WebDriver 탐지 방지
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        print(f"[INFO] Chrome 드라이버 시작 ({time.time() - started:.1f}초)")
+
+    def get_driver(self):
+        """드라이버 반환 (없으면 시작). 사용 중 종료되지 않게 하려면 use() 를 사용"""
+        with self._lock:
+            if self.driver is None:
+                self.set_options()
+                self.set_driver()
+            self.last_used = time.time()
+            self._schedule_idle_check(self.idle_timeout)
+            return self.driver
+
+    @contextmanager
+    def use(self):
+        """with 블록 동안 드라이버를 사용 (블록 실행 중에는 유휴 종료하지 않음)"""
+        with self._lock:
+            driver = self.get_driver()
+            self._in_use += 1
+        try:
+            yield driver
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                self.last_used = time.time()
+
+    def _schedule_idle_check(self, delay: float) -> None:
+        if not self.idle_timeout:
+            return
+        if self._idle_timer:
+            self._idle_timer.cancel()
+        self._idle_timer = threading.Timer(delay, self._idle_check)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _idle_check(self) -> None:
+        with self._lock:
+            if self.driver is None:
+                return
+            idle = time.time() - self.last_used
+            if self._in_use or idle < self.idle_timeout:
+                self._schedule_idle_check(max(1.0, self.idle_timeout - idle))
+                return
+            print(f"[INFO] Chrome 드라이버 {self.idle_timeout:.0f}초 미사용으로 종료")
+            self.quit()
+
+    def quit(self) -> None:
+        """드라이버 종료 (다음 get_driver() 호출 시 다시 시작)"""
+        with self._lock:
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception as e:
+                    print(f"[WARNING] Chrome 드라이버 종료 중 오류: {e}")
+                self.driver = None
 
     def refresh_with_new_proxy(self):
-        """새로운 프록시로 드라이버 재시작"""
-        if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
-        self.set_options()
-        self.set_driver()
+        """새로운 프록시로 드라이버 재시작 (다음 사용 시 새 프록시로 시작)"""
+        self.quit()
 
 
 class URLManager:
@@ -363,10 +426,15 @@ class Coupang:
         return bs(resp.text, "html.parser")
 
     def __del__(self) -> None:
-        if hasattr(self, 'ch') and self.ch.driver:
-            self.ch.driver.quit()
-
-    def __init__(self, proxy_list=None) -> None:
+        if hasattr(self, 'session_pool'):
+            self.session_pool.close_all()
+        if getattr(self, 'proxy_perf', None):
+            self.proxy_perf.close()
+        if hasattr(self, 'ch'):
+            self.ch.quit()
+
+    def __init__(self, proxy_list=None, incremental: bool = False, health_results=None,
+                 sticky_proxy_pages: int = 0) -> None:
         self.base_review_url: str = "https://www.coupang.com/vp/product/reviews"
         self.retries = 8  # 재시도 횟수 줄임
         self.delay_min = 2.0  # 최소 딜레이 증가
@@ -382,7 +450,11 @@ class Coupang:
         self.long_wait_max = 420  # 긴 대기 시간 줄임 (7분)
 
         # 프록시 로테이터 초기화
-        self.proxy_rotator = ProxyRotator(proxy_list)
+        # 프록시 성능 기록 (optm 비동기 크롤러와 같은 파일을 공유, 실행 간 유지)
+        self.proxy_perf = ProxyPerfStore() if proxy_list else None
+        self.proxy_rotator = ProxyRotator(proxy_list, self.proxy_perf, health_results)
+        if self.proxy_perf:
+            print(f"[INFO] 프록시 성능 기록 ({self.proxy_perf.path}): {self.proxy_perf.describe()}")
 
         # Windows 제외 User-Agent 초기화
         self.ua = NonWindowsUserAgent()
@@ -407,11 +479,31 @@ class Coupang:
         # 쿠키 저장용 세션
         self.session = rq.Session()
 
+        # 프록시별 세션 풀 (커넥션 재사용, 쿠키 jar 공유)
+        # 요청마다 프록시를 바꾸므로 한 바퀴 돌기 전에 LRU 로 밀려나지 않도록 프록시 수만큼 유지
+        # (실제로 열려 있는 세션 수는 idle_timeout 으로 제한)
+        self.session_pool = ProxySessionPool(cookies=self.session.cookies,
+                                             max_sessions=max(32, len(self.proxy_rotator.proxy_list)))
+
+        # 0 이면 요청마다 새 프록시 (기본), N 이면 프록시 하나로 최대 N회 요청 후 교체 (실패 시 즉시 교체)
+        self.sticky_proxy_pages = sticky_proxy_pages
+
         # 헤더에 랜덤 User-Agent 적용
         self.update_headers()
 
+        # 브라우저는 필요한 단계에서만 시작 (리뷰 수집은 requests 만 사용)
         self.ch = ChromeDriver(self.proxy_rotator)
         self.page_title = None
+        self.review_total_count = None
+
+        # 증분 크롤링: 최신순으로 수집하고 상품별 기준점(high-water mark) 이후 리뷰만 저장
+        self.incremental = incremental
+        self.state_store = ReviewStateStore(os.path.join("Coupang-reviews", "crawl_state.json")) if incremental else None
+        self.review_cursor = None
+        self.page_confirmed_empty = False  # 마지막 fetch 가 정상 응답의 빈 페이지였는지 (체크포인트 기록용)
+
+        # 상품별 진행 상태 체크포인트 (중단 후 재시작 시 이어서 크롤링)
+        self.checkpoint = CrawlCheckpoint(os.path.join("Coupang-reviews", "crawl_checkpoint.json"))
 
         # v1.6: URL 매니저 초기화
         self.url_manager = URLManager()
@@ -419,26 +511,12 @@ class Coupang:
     def get_realistic_headers(self):
         """실제 브라우저와 유사한 헤더 생성 (Windows 제외)"""
         headers = self.base_headers.copy()
-        user_agent = self.ua.random
-        headers["user-agent"] = user_agent
 
-        # User-Agent에 따라 플랫폼 정보 조정
-        if 'iPhone' in user_agent or 'iPad' in user_agent:
-            headers["sec-ch-ua-platform"] = '"iOS"'
-            headers["sec-ch-ua-mobile"] = "?1" if 'iPhone' in user_agent else "?0"
-        elif 'Android' in user_agent:
-            headers["sec-ch-ua-platform"] = '"Android"'
-            headers["sec-ch-ua-mobile"] = "?1"
-        elif 'Macintosh' in user_agent or 'Mac OS X' in user_agent:
-            headers["sec-ch-ua-platform"] = '"macOS"'
-            headers["sec-ch-ua-mobile"] = "?0"
-        elif 'Linux' in user_agent and 'Android' not in user_agent:
-            headers["sec-ch-ua-platform"] = '"Linux"'
-            headers["sec-ch-ua-mobile"] = "?0"
-        else:
-            # 기본값은 macOS로 설정 (Windows 방지)
-            headers["sec-ch-ua-platform"] = '"macOS"'
-            headers["sec-ch-ua-mobile"] = "?0"
+        # User-Agent와 플랫폼 정보(UA 풀에서 미리 계산된 값)
+        user_agent, platform, mobile = self.ua.pick()
+        headers["user-agent"] = user_agent
+        headers["sec-ch-ua-platform"] = platform
+        headers["sec-ch-ua-mobile"] = mobile
 
         # 랜덤 요소 추가
         if random.choice([True, False]):
@@ -457,23 +535,27 @@ class Coupang:
         self.headers = self.get_realistic_headers()
         print(f"[DEBUG] 헤더 User-Agent 업데이트: {self.headers['user-agent'][:70]}...")
 
-    def get_session_with_proxy(self):
-        """프록시가 적용된 requests 세션 반환"""
-        session = rq.Session()
-        session.headers.update(self.headers)
+    def get_session_with_proxy(self, new_proxy: bool = False):
+        """프록시가 적용된 requests 세션 반환 (프록시별 풀에서 재사용)
 
-        # 더 현실적인 타임아웃 설정
-        session.timeout = (10, 30)  # 연결 타임아웃 10초, 읽기 타임아웃 30초
+        기본은 요청마다 새 프록시. sticky_proxy_pages 가 설정되면 new_proxy 가 아닌 요청은
+        현재 프록시를 실패하거나 상한에 도달할 때까지 계속 사용 (상품 시작(세션 예열) 시에는 새 프록시)
+        """
+        proxy = None
+        proxy_dict = None
 
         if self.proxy_rotator and self.proxy_rotator.proxy_list:
-            proxy = self.proxy_rotator.get_next_proxy()
+            if self.sticky_proxy_pages and not new_proxy:
+                proxy = self.proxy_rotator.get_sticky_proxy(self.sticky_proxy_pages)
+            else:
+                proxy = self.proxy_rotator.get_next_proxy()
             if proxy:
                 proxy_dict = self.proxy_rotator.get_proxy_dict(proxy)
                 if proxy_dict:
-                    session.proxies.update(proxy_dict)
                     print(f"[DEBUG] 요청에 프록시 적용: {proxy}")
 
-        return session
+        # 쿠키 jar 는 self.session 과 참조로 공유되므로 별도 복사가 필요 없음
+        return self.session_pool.get(proxy if proxy_dict else None, proxy_dict, self.headers)
 
     def warm_up_session(self, prod_code):
         """세션을 예열하여 쿠팡 사이트와의 연결을 설정"""
@@ -482,15 +564,14 @@ class Coupang:
 
             # 메인 페이지 먼저 방문
             main_url = "https://www.coupang.com"
-            session = self.get_session_with_proxy()
+            session = self.get_session_with_proxy(new_proxy=True)
 
             # 메인 페이지 방문
             resp = session.get(main_url, timeout=15)
             if resp.status_code == 200:
                 print("[DEBUG] 메인 페이지 방문 성공")
 
-                # 쿠키 업데이트
-                self.session.cookies.update(resp.cookies)
+                # 쿠키는 공유 jar 에 자동 반영됨
 
                 # 잠시 대기
                 time.sleep(random.uniform(2, 4))
@@ -501,7 +582,6 @@ class Coupang:
 
                 if resp2.status_code == 200:
                     print("[DEBUG] 상품 페이지 방문 성공")
-                    self.session.cookies.update(resp2.cookies)
                     return True
 
         except Exception as e:
@@ -554,6 +634,8 @@ class Coupang:
         print(f"[INFO] 총 {total_urls}개 상품을 순차적으로 크롤링합니다.")
         print(f"[INFO] 각 상품당 최대 {self.max_pages}페이지까지 크롤링합니다.")
         print(f"[INFO] 연속 5번 리뷰 없음 감지시 다음 상품으로 진행합니다.")
+        if self.incremental:
+            print(f"[INFO] 증분 크롤링 모드: 최신순으로 수집하며 이미 수집한 리뷰에 도달하면 다음 상품으로 진행합니다.")
 
         # 프록시 사용 정보 출력
         if self.proxy_rotator and self.proxy_rotator.proxy_list:
@@ -562,10 +644,20 @@ class Coupang:
 
         print("=" * 70)
 
+        # 이전 실행 체크포인트 확인 (완료된 상품은 건너뛰고, 진행 중이던 상품은 마지막 페이지 다음부터 재개)
+        if self.checkpoint.has_progress():
+            print(f"[INFO] 이전 실행 체크포인트 발견: {self.checkpoint.describe()}")
+            resume = input("이전 진행 상황에서 이어서 크롤링하시겠습니까? (Y/n): ").lower().strip()
+            if resume == 'n':
+                self.checkpoint.reset()
+                print("[INFO] 체크포인트를 초기화하고 처음부터 크롤링합니다.")
+
         # 전체 통계
         total_success_products = 0
         total_failed_products = 0
+        total_skipped_products = 0
         overall_start_time = time.time()
+        interrupted = False
 
         # URL별 크롤링 실행
         while True:
@@ -573,6 +665,11 @@ class Coupang:
             if not url:
                 break
 
+            if self.checkpoint.is_done(self.get_product_code(url=url.split('#')[0])):
+                total_skipped_products += 1
+                print(f"[INFO] 이전 실행에서 완료된 상품 건너뜀: {url}")
+                continue
+
             current_progress, total_progress = self.url_manager.get_current_progress()
             print(f"\n{'=' * 20} 상품 {current_progress}/{total_progress} {'=' * 20}")
             print(f"[INFO] 현재 상품 URL: {url}")
@@ -588,6 +685,7 @@ class Coupang:
 
             except KeyboardInterrupt:
                 print(f"\n[INFO] 사용자에 의해 중단되었습니다.")
+                interrupted = True
                 print(f"[INFO] 진행률: {current_progress - 1}/{total_progress} 완료")
                 break
             except Exception as e:
@@ -601,6 +699,16 @@ class Coupang:
                 print(f"[INFO] 다음 상품까지 {delay:.1f}초 대기...")
                 time.sleep(delay)
 
+        # 모든 상품을 처리했으면 체크포인트 정리 (다음 실행은 처음부터, 실패 페이지가 남은 상품만 이어서 수집)
+        if not interrupted:
+            self.checkpoint.complete_run()
+
+        # 프록시별 세션/브라우저 정리 및 성능 기록 저장
+        self.session_pool.close_all()
+        self.ch.quit()
+        if self.proxy_perf:
+            self.proxy_perf.flush()
+
         # 전체 결과 요약
         overall_end_time = time.time()
         total_elapsed = overall_end_time - overall_start_time
@@ -611,13 +719,15 @@ class Coupang:
         print(f"총 상품 수: {total_urls}개")
         print(f"성공한 상품: {total_success_products}개")
         print(f"실패한 상품: {total_failed_products}개")
+        if total_skipped_products:
+            print(f"건너뛴 상품 (이전 실행에서 완료): {total_skipped_products}개")
         print(f"성공률: {(total_success_products / total_urls * 100):.1f}%")
         print(f"총 소요 시간: {total_elapsed / 60:.1f}분")
         print(f"📁 결과 파일들은 'Coupang-reviews' 폴더에서 확인하세요.")
         print("=" * 70)
 
-    def crawl_single_product(self, url: str) -> bool:
-        """단일 상품 크롤링"""
+    def crawl_single_product(self, url: str, review_count=None) -> bool:
+        """단일 상품 크롤링 (review_count: 상품 목록에서 알려진 리뷰 수, 없으면 첫 페이지에서 확인)"""
         if '#' in url:
             url = url.split('#')[0]
             print(f"[DEBUG] URL fragment 제거: {url}")
@@ -628,8 +738,20 @@ class Coupang:
         # 세션 예열
         self.warm_up_session(prod_code)
 
-        # 상품별 SaveData 인스턴스 생성
-        sd = SaveData()
+        # 체크포인트에 진행 중으로 남은 상품이면 마지막 저장 페이지 다음부터 같은 저널에 이어서 기록
+        start_page, resume_entry = self.checkpoint.resume_point(prod_code)
+
+        # 상품별 SaveData 인스턴스 생성 (증분 모드는 기존 결과 파일을 덮어쓰지 않도록 실행 시각 접미사 사용)
+        if resume_entry:
+            file_suffix = resume_entry.get("file_suffix") or ""
+        else:
+            file_suffix = time.strftime("_신규_%Y%m%d_%H%M%S") if self.incremental else ""
+        sd = SaveData(file_suffix=file_suffix, resume=resume_entry is not None,
+                      resume_rows=resume_entry.get("reviews") if resume_entry else None)
+
+        self.review_cursor = self.state_store.begin(prod_code) if self.incremental else None
+        if self.review_cursor:
+            print(f"[INFO] 증분 크롤링: {self.review_cursor.describe()}")
 
         try:
             self.title = self.get_product_title(prod_code=prod_code)
@@ -639,20 +761,33 @@ class Coupang:
             self.title = "상품명 미확인"
 
         self.page_title = None  # 페이지 타이틀 초기화
+        self.review_total_count = None
         success_count = 0
-        current_page = 1
-        consecutive_empty_pages = 0
+        current_page = start_page
+        if resume_entry:
+            self.page_title = resume_entry.get("title")
+            print(f"[INFO] 체크포인트에서 재개: {start_page}페이지부터 (저장된 리뷰 {resume_entry.get('reviews', 0)}개)")
+            # 다시 요청한 페이지가 모두 비어도 기존 저널로 xlsx 를 만들 수 있도록 미리 열어 둠
+            if self.page_title:
+                sd.writer.open(self.page_title)
+        failed_pages = []  # 요청에 실패한 페이지 (빈 페이지로 확인된 페이지는 제외)
         max_empty_pages = 5  # v1.6: 연속 빈 페이지 허용 횟수 (5번 연속 리뷰 없음시 다음 상품으로)
         proxy_change_attempts = 0
+        consecutive_failed_pages = 0
 
         product_start_time = time.time()
 
-        while consecutive_empty_pages < max_empty_pages and current_page <= self.max_pages:
+        # 리뷰 수로 요청할 페이지 수를 미리 계산 (리뷰 수를 모르면 연속 빈 페이지 규칙으로 종료)
+        planner = PagePlanner(page_size=5, max_pages=self.max_pages,
+                              max_empty_pages=max_empty_pages, review_count=review_count)
+        print(f"[INFO] 페이지 계획: {planner.describe()}")
+
+        while not planner.finished and current_page <= planner.last_page:
             payload = {
                 "productId": prod_code,
                 "page": current_page,
                 "size": 5,
-                "sortBy": "ORDER_SCORE_ASC",
+                "sortBy": "DATE_DESC" if self.incremental else "ORDER_SCORE_ASC",
                 "ratings": "",
                 "q": "",
                 "viRoleCode": 2,
@@ -661,16 +796,45 @@ class Coupang:
 
             result = self.fetch(payload=payload, sd=sd)
 
+            # 리뷰 페이지의 전체 리뷰 수가 상품 목록 값과 다르면 계획 갱신
+            if self.review_total_count is not None and self.review_total_count != planner.review_count:
+                planner.set_review_count(self.review_total_count)
+                print(f"[INFO] 페이지 계획 갱신: {planner.describe()}")
+
+            if not result and not self.page_confirmed_empty:
+                # 요청 실패 (네트워크 오류/차단/재시도 초과) - 빈 페이지로 집계하지 않고 다른 프록시로 같은 페이지 재시도
+                if (self.proxy_rotator and
+                        self.proxy_rotator.current_proxy and
+                        proxy_change_attempts < 3 and
+                        self.proxy_rotator.get_available_proxy_count() > 1):
+                    print(f"[INFO] 페이지 {current_page} 요청 실패 - 다른 프록시로 재시도 ({proxy_change_attempts + 1}/3)")
+                    self.proxy_rotator.mark_proxy_failed(self.proxy_rotator.current_proxy)
+                    proxy_change_attempts += 1
+                    continue
+
+                # 재시도도 실패하면 실패 페이지로 남기고 다음 페이지로 (다음 실행에서 이 페이지부터 다시 수집)
+                print(f"[WARNING] 페이지 {current_page} 요청 실패 - 실패 페이지로 기록")
+                failed_pages.append(current_page)
+                consecutive_failed_pages += 1
+                proxy_change_attempts = 0
+                current_page += 1
+                if consecutive_failed_pages >= max_empty_pages:
+                    print(f"[WARNING] 연속 {consecutive_failed_pages}페이지 요청 실패 - 이 상품은 다음 실행에서 이어서 수집")
+                    break
+                continue
+
+            consecutive_failed_pages = 0
+            planner.record(current_page, result)
+
             if result:
                 success_count += 1
-                consecutive_empty_pages = 0
                 proxy_change_attempts = 0
             else:
-                consecutive_empty_pages += 1
-                print(f"[WARNING] 페이지 {current_page}에서 리뷰를 찾을 수 없습니다. ({consecutive_empty_pages}/{max_empty_pages})")
+                print(f"[WARNING] 페이지 {current_page}에서 리뷰를 찾을 수 없습니다. ({planner.consecutive_empty_pages}/{max_empty_pages})")
 
                 # 연속 빈 페이지가 2개 이상이고 프록시를 사용 중이라면 프록시 상태 체크
-                if (consecutive_empty_pages >= 2 and
+                if (not planner.finished and
+                        planner.consecutive_empty_pages >= 2 and
                         self.proxy_rotator and
                         self.proxy_rotator.current_proxy and
                         proxy_change_attempts < 3):
@@ -683,29 +847,55 @@ class Coupang:
                         print(f"[INFO] 페이지 {current_page} 다른 프록시로 재시도...")
                         continue
 
+            # 페이지 리뷰를 디스크에 기록한 뒤 체크포인트 갱신 (재시작 시 다음 페이지부터 재개)
+            # 요청 실패 페이지가 생기면 그 이후로는 갱신하지 않음 (다음 실행에서 실패 페이지부터 다시 수집)
+            if not failed_pages and sd.flush():
+                self.checkpoint.record_page(prod_code, current_page, title=self.page_title,
+                                            file_suffix=file_suffix, reviews=sd.writer.row_count)
+
             current_page += 1
 
-            if result and consecutive_empty_pages == 0:
+            # 증분 모드: 이미 수집한 리뷰에 도달하면 이후 페이지는 요청하지 않음
+            if self.review_cursor and self.review_cursor.reached:
+                print(f"[INFO] 이미 수집한 리뷰에 도달 - 증분 크롤링 종료")
+                break
+
+            if result and planner.consecutive_empty_pages == 0:
                 short_delay = random.uniform(1.0, 3.0)
                 time.sleep(short_delay)
 
+        # 이전 실행에서 저장한 리뷰가 있으면 재개한 페이지가 모두 비어도 성공으로 처리
+        success = success_count > 0 or sd.writer.row_count > 0
+
+        # 상품 완료 시 저널을 xlsx 로 한 번에 변환 (실패 페이지가 있으면 다음 실행에서 이어서 기록하도록 저널 보존)
+        sd.close(keep_journal=success and bool(failed_pages))
+        self.checkpoint.finish(prod_code, success, reviews=sd.writer.row_count, failed_pages=failed_pages)
+
+        if self.review_cursor:
+            print(f"[INFO] 새 리뷰: {self.review_cursor.new_count}개")
+            # 실패 페이지가 있으면 기준점을 옮기지 않음 (다음 실행에서 해당 페이지 리뷰를 다시 수집)
+            if success and not failed_pages:
+                self.state_store.commit(self.review_cursor)
+            self.review_cursor = None
+
         product_end_time = time.time()
         product_elapsed = product_end_time - product_start_time
 
         # 상품별 결과 출력
         print(f"\n[PRODUCT SUMMARY] 상품 '{self.title}' 크롤링 완료")
         print(f"[INFO] 성공 페이지: {success_count}개 (총 {current_page - 1}페이지 시도)")
+        if failed_pages:
+            print(f"[WARNING] 요청 실패 페이지: {len(failed_pages)}개")
         print(f"[INFO] 소요 시간: {product_elapsed / 60:.1f}분")
 
-        if consecutive_empty_pages >= max_empty_pages:
-            print(f"[INFO] 연속 {max_empty_pages}번 빈 페이지로 인해 다음 상품으로 진행")
-        elif current_page > self.max_pages:
-            print(f"[INFO] 최대 페이지 수({self.max_pages})에 도달하여 완료")
+        if planner.stop_reason:
+            print(f"[INFO] 페이지 탐색 종료: {planner.stop_reason}")
 
-        return success_count > 0
+        return success
 
     def fetch(self, payload: dict, sd) -> bool:
         now_page: int = payload["page"]
+        self.page_confirmed_empty = False
         print(f"\n[INFO] Start crawling page {now_page} ...")
         attempt: int = 0
         proxy_attempts: int = 0
@@ -718,11 +908,11 @@ class Coupang:
                     self.update_headers()
 
                 session = self.get_session_with_proxy()
-                session.cookies.update(self.session.cookies)
                 session.headers.update({
                     "Referer": f"https://www.coupang.com/vp/products/{payload['productId']}"
                 })
 
+                request_started = time.time()
                 resp = session.get(
                     url=self.base_review_url,
                     params=payload,
@@ -743,18 +933,18 @@ class Coupang:
                     continue
 
                 html = resp.text
-                soup = bs(html, "html.parser")
+                reviews, total_count = parse_reviews_with_total(html)
+                if total_count is not None:
+                    self.review_total_count = total_count
 
                 if self.page_title is None:
-                    first_review = soup.select_one("article.sdp-review__article__list")
-                    if first_review:
-                        title_elem = first_review.select_one("div.sdp-review__article__list__info__product-info__name")
-                        self.page_title = title_elem.text.strip() if title_elem else self.title
+                    # 첫 리뷰의 구매상품명을 페이지 타이틀로 사용
+                    if reviews and reviews[0]["prod_name"] != "-":
+                        self.page_title = reviews[0]["prod_name"]
                     else:
                         self.page_title = self.title
 
-                articles = soup.select("article.sdp-review__article__list")
-                article_length = len(articles)
+                article_length = len(reviews)
 
                 if article_length == 0:
                     print(f"[WARNING] 페이지 {now_page}에서 리뷰를 찾을 수 없습니다.")
@@ -798,92 +988,25 @@ class Coupang:
                             time.sleep(long_delay)
                             continue
 
+                    # 정상 응답에 리뷰가 없는 페이지 (차단 감지 시에는 요청 실패로 처리)
+                    self.page_confirmed_empty = now_page != 1 or not is_blocked
                     return False
 
                 print(f"[SUCCESS] 페이지 {now_page}에서 {article_length}개 리뷰 발견")
-
-                # 리뷰 데이터 처리
-                for idx in range(article_length):
-                    dict_data: dict[str, str | int] = dict()
-
-                    review_date_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__info__product-info__reg-date"
-                    )
-                    review_date = review_date_elem.text.strip() if review_date_elem else "-"
-
-                    user_name_elem = articles[idx].select_one(
-                        "span.sdp-review__article__list__info__user__name"
-                    )
-                    user_name = user_name_elem.text.strip() if user_name_elem else "-"
-
-                    rating_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__info__product-info__star-orange"
-                    )
-                    if rating_elem and rating_elem.get("data-rating"):
-                        try:
-                            rating = int(rating_elem.get("data-rating"))
-                        except (ValueError, TypeError):
-                            rating = 0
-                    else:
-                        rating = 0
-
-                    prod_name_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__info__product-info__name"
-                    )
-                    prod_name = prod_name_elem.text.strip() if prod_name_elem else "-"
-
-                    headline_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__headline"
-                    )
-                    headline = headline_elem.text.strip() if headline_elem else "등록된 헤드라인이 없습니다"
-
-                    review_content_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__review__content.js_reviewArticleContent"
-                    )
-                    if review_content_elem:
-                        review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
-                    else:
-                        review_content_elem = articles[idx].select_one(
-                            "div.sdp-review__article__list__review > div"
-                        )
-                        if review_content_elem:
-                            review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
-                        else:
-                            review_content = "등록된 리뷰내용이 없습니다"
-
-                    answer_elem = articles[idx].select_one(
-                        "span.sdp-review__article__list__survey__row__answer"
-                    )
-                    answer = answer_elem.text.strip() if answer_elem else "맛 평가 없음"
-
-                    helpful_count_elem = articles[idx].select_one("span.js_reviewArticleHelpfulCount")
-                    helpful_count = helpful_count_elem.text.strip() if helpful_count_elem else "0"
-
-                    seller_name_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__info__product-info__seller_name"
-                    )
-                    if seller_name_elem:
-                        seller_name = seller_name_elem.text.replace("판매자: ", "").strip()
-                    else:
-                        seller_name = "-"
-
-                    review_images = articles[idx].select("div.sdp-review__article__list__attachment__list img")
-                    image_count = len(review_images)
-
-                    dict_data["title"] = self.page_title
-                    dict_data["prod_name"] = prod_name
-                    dict_data["review_date"] = review_date
-                    dict_data["user_name"] = user_name
-                    dict_data["rating"] = rating
-                    dict_data["headline"] = headline
-                    dict_data["review_content"] = review_content
-                    dict_data["answer"] = answer
-                    dict_data["helpful_count"] = helpful_count
-                    dict_data["seller_name"] = seller_name
-                    dict_data["image_count"] = image_count
-
+                if self.proxy_rotator and self.proxy_rotator.current_proxy:
+                    self.proxy_rotator.mark_proxy_success(self.proxy_rotator.current_proxy,
+                                                          time.time() - request_started)
+
+                # 증분 모드: 이미 수집한 리뷰 이후는 저장하지 않음
+                if self.review_cursor:
+                    reviews = self.review_cursor.filter(reviews)
+                    print(f"[INFO] 새 리뷰 {len(reviews)}/{article_length}개")
+
+                # 리뷰 데이터 처리 (review_parser 에서 추출 완료)
+                for review in reviews:
+                    dict_data: dict[str, str | int] = {"title": self.page_title, **review}
                     sd.save(datas=dict_data)
-                    print(f"[SUCCESS] 리뷰 저장 완료: {user_name} - {rating}점")
+                    print(f"[SUCCESS] 리뷰 저장 완료: {review['user_name']} - {review['rating']}점")
 
                 page_delay = random.uniform(self.page_delay_min, self.page_delay_max)
                 print(f"[DEBUG] 다음 페이지까지 {page_delay:.1f}초 대기...")
@@ -947,16 +1070,24 @@ class Coupang:
 
 
 class SaveData:
-    def __init__(self) -> None:
-        self.wb: Workbook = Workbook()
-        self.ws = self.wb.active
-        self.ws.append([
-            "상품명", "구매상품명", "작성일자", "구매자명", "평점",
-            "헤드라인", "리뷰내용", "맛만족도", "도움수", "판매자", "이미지수"
-        ])
-        self.row: int = 2
+    def __init__(self, file_suffix: str = "", resume: bool = False, resume_rows=None) -> None:
         self.dir_name: str = "Coupang-reviews"
         self.create_directory()
+        # 리뷰는 JSONL 저널에 스트리밍 저장하고, 상품 완료 시(close) xlsx 를 한 번만 생성
+        self.writer = StreamingReviewWriter(
+            dir_name=self.dir_name,
+            headers=[
+                "상품명", "구매상품명", "작성일자", "구매자명", "평점",
+                "헤드라인", "리뷰내용", "맛만족도", "도움수", "판매자", "이미지수"
+            ],
+            keys=[
+                "title", "prod_name", "review_date", "user_name", "rating",
+                "headline", "review_content", "answer", "helpful_count", "seller_name", "image_count"
+            ],
+            file_suffix=file_suffix,
+            resume=resume,
+            resume_rows=resume_rows,
+        )
 
     def create_directory(self) -> None:
         if not os.path.exists(self.dir_name):
@@ -965,58 +1096,37 @@ class SaveData:
 
     def save(self, datas: dict[str, str | int]) -> None:
         try:
-            safe_title = re.sub(r'[<>:"/\\|?*]', '_', datas["title"])
-            file_name: str = os.path.join(self.dir_name, safe_title + ".xlsx")
-
-            self.ws[f"A{self.row}"] = datas["title"]
-            self.ws[f"B{self.row}"] = datas["prod_name"]
-            self.ws[f"C{self.row}"] = datas["review_date"]
-            self.ws[f"D{self.row}"] = datas["user_name"]
-            self.ws[f"E{self.row}"] = datas["rating"]
-            self.ws[f"F{self.row}"] = datas["headline"]
-            self.ws[f"G{self.row}"] = datas["review_content"]
-            self.ws[f"H{self.row}"] = datas["answer"]
-            self.ws[f"I{self.row}"] = datas["helpful_count"]
-            self.ws[f"J{self.row}"] = datas["seller_name"]
-            self.ws[f"K{self.row}"] = datas["image_count"]
-
-            self.row += 1
-            self.wb.save(filename=file_name)
-
+            self.writer.append(datas)
         except Exception as e:
             print(f"[ERROR] 데이터 저장 중 오류 발생: {e}")
 
+    def flush(self) -> bool:
+        """저널을 디스크에 기록 (체크포인트 갱신 전 호출, 실패 시 False)"""
+        try:
+            self.writer.flush()
+            return True
+        except Exception as e:
+            print(f"[ERROR] 저널 기록 중 오류 발생: {e}")
+            return False
+
+    def close(self, keep_journal: bool = False):
+        """상품 크롤링 완료 시 저널을 xlsx 로 변환 (keep_journal: 다음 실행에서 이어서 기록할 저널 보존)"""
+        try:
+            return self.writer.finalize(keep_journal=keep_journal)
+        except Exception as e:
+            print(f"[ERROR] 엑셀 파일 생성 중 오류 발생: {e}")
+            return None
+
     def __del__(self) -> None:
         try:
-            if hasattr(self, 'wb'):
-                self.wb.close()
+            if hasattr(self, 'writer'):
+                self.writer.close()
         except:
             pass
 
 
-def test_proxy(proxy_string):
-    """프록시 연결 테스트"""
-    try:
-        parts = proxy_string.split(':')
-        if len(parts) == 4:
-            ip, port, username, password = parts
-            proxy_dict = {
-                'http': f'http://{username}:{password}@{ip}:{port}',
-                'https': f'http://{username}:{password}@{ip}:{port}'
-            }
-        else:
-            return False
-
-        response = rq.get('http://httpbin.org/ip', proxies=proxy_dict, timeout=10)
-        if response.status_code == 200:
-            return True
-    except:
-        pass
-    return False
-
-
 def get_proxy_list():
-    """프록시 목록 반환"""
+    """프록시 목록과 헬스 체크 결과 반환 (테스트하지 않았으면 결과는 None)"""
     proxy_list = [
         "173.214.177.18:5709:daxvymvx:kn518nmfd34a",
         "198.23.214.119:6386:daxvymvx:kn518nmfd34a",
@@ -1134,7 +1244,7 @@ def get_proxy_list():
 
     if use_proxy == 'n':
         print("[INFO] 프록시 없이 실행합니다.")
-        return None
+        return None, None
     else:
         print("[INFO] 프록시를 사용하여 실행합니다.")
 
@@ -1143,42 +1253,37 @@ def get_proxy_list():
 
         if test_proxies == 'y':
             print("\n[INFO] 프록시 연결 테스트 중...")
-            working_proxies = []
-
-            for i, proxy in enumerate(proxy_list, 1):
-                print(f"[TEST] {i}/{len(proxy_list)} - {proxy.split(':')[0]}:{proxy.split(':')[1]} 테스트 중...", end='')
-                if test_proxy(proxy):
-                    print(" ✅ 성공")
-                    working_proxies.append(proxy)
-                else:
-                    print(" ❌ 실패")
+            working_proxies, health_results = run_health_check(proxy_list)
 
             if working_proxies:
                 print(f"\n[SUCCESS] {len(working_proxies)}/{len(proxy_list)}개 프록시가 정상 작동합니다.")
                 print(f"[INFO] 작동하는 프록시만 사용하여 크롤링을 시작합니다.")
-                return working_proxies
+                return working_proxies, health_results
             else:
                 print("\n[ERROR] 작동하는 프록시가 없습니다.")
                 fallback = input("프록시 없이 실행하시겠습니까? (Y/n): ").lower().strip()
                 if fallback != 'n':
                     print("[INFO] 프록시 없이 실행합니다.")
-                    return None
+                    return None, None
                 else:
                     print("[INFO] 프로그램을 종료합니다.")
                     exit(0)
         else:
             print("[INFO] 테스트 없이 모든 프록시를 사용합니다.")
             print("[INFO] 실행 중 자동으로 작동하지 않는 프록시를 제외합니다.")
-            return proxy_list
+            return proxy_list, None
 
 
 if __name__ == "__main__":
     try:
         # 프록시 목록 가져오기
-        proxy_list = get_proxy_list()
+        proxy_list, health_results = get_proxy_list()
+
+        # 증분 크롤링 여부 확인
+        incremental = input("증분 크롤링(이미 수집한 리뷰에서 중단)을 사용하시겠습니까? (y/N): ").lower().strip() == 'y'
 
         # 크롤러 시작
-        coupang = Coupang(proxy_list=proxy_list)
+        coupang = Coupang(proxy_list=proxy_list, incremental=incremental, health_results=health_results)
         coupang.start()
 
         print("\n" + "=" * 70)
@@ -3,12 +3,14 @@ import aiohttp
 import time
 import random
 import ssl
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
+import heapq
 import json
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from bs4 import BeautifulSoup as bs
 from pathlib import Path
 from openpyxl import Workbook
@@ -22,8 +24,15 @@ from urllib.parse import urlencode
 from main3 import (
     NonWindowsUserAgent, SaveData, URLManager,
     load_proxy_list_from_file, create_sample_proxy_file,
-    is_valid_proxy_format, test_proxy
+    is_valid_proxy_format
 )
+from crawl_state import CrawlCheckpoint, ReviewCursor, ReviewStateStore
+from page_planner import PagePlanner
+from proxy_health import ProxyCheck, run_health_check
+from proxy_perf import ProxyPerfStore
+from proxy_quarantine import ProxyQuarantine
+from proxy_selector import ProxySelector
+from review_parser import parse_reviews_with_total
 
 
 @dataclass
@@ -52,92 +61,156 @@ class ProxyStats:
 
 
 class AsyncProxyManager:
-    """비동기 프록시 관리자 (프록시당 1개 연결)"""
+    """비동기 프록시 관리자 (프록시당 1개 연결)
 
-    def __init__(self, proxy_list: List[str], max_concurrent_per_proxy: int = 1):
+    선택 가중치는 ProxySelector(Fenwick 트리)에 유지하여 선택/획득/반납/점수 갱신이 O(log P).
+    각 메서드는 await 없이 끝나므로 이벤트 루프 안에서 원자적으로 실행되어 전역 락이 필요 없다.
+    """
+
+    def __init__(self, proxy_list: List[str], max_concurrent_per_proxy: int = 1,
+                 perf_store: Optional[ProxyPerfStore] = None):
         self.proxy_list = proxy_list or []
         self.max_concurrent_per_proxy = max_concurrent_per_proxy  # 1개로 제한
         self.proxy_stats = {proxy: ProxyStats() for proxy in self.proxy_list}
-        self.failed_proxies = set()
-        self.lock = asyncio.Lock()
+
+        # 이전 실행의 성능 기록으로 초기 점수 설정 (시간 감쇠된 성공/실패 횟수, 응답 시간 EWMA)
+        self.perf_store = perf_store
+        if self.perf_store and self.proxy_list:
+            for proxy, record in self.perf_store.load(self.proxy_list).items():
+                stats = self.proxy_stats[proxy]
+                stats.success_count = record.success
+                stats.failure_count = record.failure
+                if record.latency and record.success > 0:
+                    stats.avg_response_time = record.latency
+                    stats.total_response_time = record.latency * record.success
+        self._perf_flush = None  # 스레드 풀에서 진행 중인 성능 기록 저장
+        self.failed_proxies = set()  # 현재 격리 중인 프록시
+        self.quarantine = ProxyQuarantine()
         # 세마포어 대신 간단한 연결 카운터 사용
         self.active_connections = defaultdict(int)
 
+        # 성능 점수 가중치 선택기 (성능 기록이 없는 프록시는 동일한 초기 점수)
+        self.selector = ProxySelector(self.proxy_list)
+        for proxy in self.proxy_list:
+            self._refresh(proxy)
+        self.selector.rebuild()
+
+    def _is_available(self, proxy: str) -> bool:
+        return (proxy not in self.failed_proxies and
+                self.active_connections[proxy] < self.max_concurrent_per_proxy)
+
+    def _refresh(self, proxy: str):
+        """프록시 상태 변경 후 선택 가중치 갱신 (O(log P))"""
+        self.selector.update(proxy, self.proxy_stats[proxy].performance_score, self._is_available(proxy))
+
+    def seed_from_health(self, results: Dict[str, ProxyCheck]) -> int:
+        """헬스 체크 결과를 초기 점수에 반영 (성능 기록에서 불러온 통계에 성공/실패 1회로 합산)
+
+        성공한 프록시는 측정 응답 시간을 평균에 반영하고,
+        실패한 프록시는 격리하여 쿨다운이 끝날 때까지 선택에서 제외
+        """
+        seeded = 0
+        for proxy, result in results.items():
+            stats = self.proxy_stats.get(proxy)
+            if stats is None:
+                continue
+            if result.ok:
+                stats.success_count += 1
+                stats.total_response_time += result.latency
+                stats.avg_response_time = stats.total_response_time / stats.success_count
+            else:
+                stats.failure_count += 1
+                self._quarantine(proxy)
+            self._refresh(proxy)
+            seeded += 1
+        self.selector.rebuild()
+        return seeded
+
+    def _quarantine(self, proxy: str) -> float:
+        """프록시 격리 (쿨다운은 격리될 때마다 지수적으로 증가)"""
+        self.failed_proxies.add(proxy)
+        cooldown = self.quarantine.quarantine(proxy)
+        self._refresh(proxy)
+        return cooldown
+
+    def readmit_expired(self) -> int:
+        """쿨다운이 끝난 프록시를 개별적으로 복귀 (일괄 초기화 없음)"""
+        released = self.quarantine.release_expired()
+        for proxy in released:
+            self.failed_proxies.discard(proxy)
+            self._refresh(proxy)
+        return len(released)
+
     async def get_best_proxy(self) -> Optional[str]:
-        """성능 기반 최적 프록시 선택 (보수적 기준)"""
-        async with self.lock:
-            available_proxies = [
-                p for p in self.proxy_list
-                if p not in self.failed_proxies and
-                   self.active_connections[p] < self.max_concurrent_per_proxy
-            ]
-
-            if not available_proxies:
-                # 70% 이상의 프록시가 실패했다면 실패 목록 초기화 (기존 80%에서 감소)
-                if len(self.failed_proxies) > len(self.proxy_list) * 0.7:
-                    print("[WARNING] 70% 이상의 프록시가 실패했습니다. 실패 목록을 초기화합니다.")
-                    self.failed_proxies.clear()
-                    available_proxies = [
-                        p for p in self.proxy_list
-                        if self.active_connections[p] < self.max_concurrent_per_proxy
-                    ]
-
-            if not available_proxies:
-                return None
-
-            # 성능 점수 기반 가중치 선택
-            weights = [self.proxy_stats[proxy].performance_score for proxy in available_proxies]
-            total_weight = sum(weights)
-
-            if total_weight == 0:
-                return random.choice(available_proxies)
-
-            # 가중치 기반 랜덤 선택
-            r = random.random() * total_weight
-            cumulative_weight = 0
-
-            for proxy, weight in zip(available_proxies, weights):
-                cumulative_weight += weight
-                if r <= cumulative_weight:
-                    return proxy
-
-            return available_proxies[-1]
+        """성능 기반 최적 프록시 선택 (보수적 기준, 모두 격리 중이면 None)"""
+        self.readmit_expired()
+
+        # 성능 점수 기반 가중치 랜덤 선택 (가중치 합이 0 이면 균등 선택)
+        return self.selector.pick()
 
     async def acquire_proxy(self, proxy: str) -> bool:
         """프록시 사용 시작"""
-        async with self.lock:
-            if self.active_connections[proxy] < self.max_concurrent_per_proxy:
-                self.active_connections[proxy] += 1
-                self.proxy_stats[proxy].last_used = time.time()
-                return True
-            return False
+        if self.active_connections[proxy] < self.max_concurrent_per_proxy:
+            self.active_connections[proxy] += 1
+            self.proxy_stats[proxy].last_used = time.time()
+            self._refresh(proxy)
+            return True
+        return False
 
     async def release_proxy(self, proxy: str):
         """프록시 사용 종료"""
-        async with self.lock:
-            if self.active_connections[proxy] > 0:
-                self.active_connections[proxy] -= 1
+        if self.active_connections[proxy] > 0:
+            self.active_connections[proxy] -= 1
+            self._refresh(proxy)
 
     async def record_success(self, proxy: str, response_time: float):
         """성공 기록"""
-        async with self.lock:
-            stats = self.proxy_stats[proxy]
-            stats.success_count += 1
-            stats.total_response_time += response_time
-            stats.avg_response_time = stats.total_response_time / stats.success_count
+        stats = self.proxy_stats[proxy]
+        stats.success_count += 1
+        stats.total_response_time += response_time
+        stats.avg_response_time = stats.total_response_time / stats.success_count
+        self.quarantine.forgive(proxy)
+        self._refresh(proxy)
+        if self.perf_store:
+            self.perf_store.record_success(proxy, response_time)
+            self._schedule_perf_flush()
 
     async def record_failure(self, proxy: str):
         """실패 기록 (더 엄격한 기준)"""
-        async with self.lock:
-            stats = self.proxy_stats[proxy]
-            stats.failure_count += 1
-
-            # 실패율이 높으면 더 빠르게 제외 (기준 강화)
-            if stats.failure_count > 5 and stats.success_rate < 0.5:  # 5회 실패 후 성공률 50% 미만
-                self.failed_proxies.add(proxy)
-                print(f"[WARNING] 프록시 일시 제외: {proxy.split(':')[0]} (성공률: {stats.success_rate:.2f})")
-            elif stats.failure_count > 3:  # 3회 이상 실패시 경고
+        stats = self.proxy_stats[proxy]
+        stats.failure_count += 1
+        if self.perf_store:
+            self.perf_store.record_failure(proxy)
+            self._schedule_perf_flush()
+
+        # 실패율이 높으면 쿨다운 동안 격리 (복귀 후 다시 실패하면 더 오래 격리)
+        if proxy in self.failed_proxies:
+            self._refresh(proxy)
+        elif stats.failure_count > 5 and stats.success_rate < 0.5:  # 5회 실패 후 성공률 50% 미만
+            cooldown = self._quarantine(proxy)
+            print(f"[WARNING] 프록시 격리: {proxy.split(':')[0]} (성공률: {stats.success_rate:.2f}, "
+                  f"{cooldown:.0f}초 후 복귀)")
+        else:
+            if stats.failure_count > 3:  # 3회 이상 실패시 경고
                 print(f"[WARNING] 프록시 실패 증가: {proxy.split(':')[0]} (실패: {stats.failure_count}회)")
+            self._refresh(proxy)
+
+    def _schedule_perf_flush(self):
+        """저장 시점이면 성능 기록을 스레드 풀에서 저장 (SQLite 쓰기 잠금 대기가 이벤트 루프를 막지 않도록)"""
+        if not self.perf_store.flush_due():
+            return
+        if self._perf_flush and not self._perf_flush.done():
+            return
+        self._perf_flush = asyncio.get_running_loop().run_in_executor(None, self.perf_store.flush)
+
+    async def flush_perf(self):
+        """진행 중인 저장을 기다린 뒤 남은 성능 기록 저장 (종료 시)"""
+        if not self.perf_store:
+            return
+        if self._perf_flush:
+            await asyncio.gather(self._perf_flush, return_exceptions=True)
+            self._perf_flush = None
+        await asyncio.get_running_loop().run_in_executor(None, self.perf_store.flush)
 
     def get_proxy_dict(self, proxy_string: str) -> Optional[Dict[str, str]]:
         """프록시 문자열을 aiohttp용 딕셔너리로 변환"""
@@ -154,20 +227,124 @@ class AsyncProxyManager:
         return None
 
 
+class ParseStage:
+    """프로세스 풀 기반 HTML 파싱 단계 (이벤트 루프는 I/O 만 담당)
+
+    fetch 단계는 parse() 로 raw HTML bytes 를 넘기고 (리뷰 dict 리스트, 전체 리뷰 수) 를 받는다.
+    대기열(max_queue)이 가득 차면 parse() 가 대기하므로 fetch 단계에 backpressure 가 걸린다.
+    워커 프로세스가 비정상 종료되면(BrokenProcessPool) 풀을 새로 만들고 해당 페이지만 실패로 돌려준다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: Optional[int] = None):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_queue = max_queue or self.workers * 2
+        self.executor = None
+        self.queue = None
+        self.consumers = []
+
+    async def start(self):
+        """프로세스 풀 및 소비자 태스크 시작"""
+        if self.executor:
+            return
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.queue = asyncio.Queue(maxsize=self.max_queue)
+        self.consumers = [asyncio.create_task(self._consume()) for _ in range(self.workers)]
+        print(f"[INFO] 파싱 프로세스 풀 시작: {self.workers}개 워커 (대기열 {self.max_queue}개)")
+
+    async def _consume(self):
+        """대기열에서 HTML 을 꺼내 프로세스 풀에서 파싱"""
+        loop = asyncio.get_running_loop()
+        while True:
+            html_bytes, product_title, future = await self.queue.get()
+            executor = self.executor
+            try:
+                parsed = await loop.run_in_executor(
+                    executor, parse_reviews_with_total, html_bytes, product_title
+                )
+                if not future.done():
+                    future.set_result(parsed)
+            except BrokenProcessPool as e:
+                # 워커 프로세스가 죽으면(lxml 크래시, OOM 등) 풀 전체가 사용 불가 - 새 풀로 교체 후 해당 페이지는 실패 처리
+                print(f"[ERROR] 파싱 프로세스 풀 손상, 재시작합니다: {e}")
+                self._restart_executor(executor)
+                if not future.done():
+                    future.set_exception(e)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self.queue.task_done()
+
+    def _restart_executor(self, broken: ProcessPoolExecutor):
+        """손상된 프로세스 풀을 버리고 새 풀 생성 (다른 소비자가 이미 교체했거나 종료 중이면 그대로 둠)"""
+        if self.executor is not broken:
+            return
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    async def parse(self, html_bytes: bytes, product_title: str) -> Tuple[List[Dict], Optional[int]]:
+        """HTML 을 파싱 대기열에 넣고 결과 대기 (풀 미시작 시 현재 프로세스에서 파싱)"""
+        if not self.executor:
+            return parse_reviews_with_total(html_bytes, product_title)
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((html_bytes, product_title, future))
+        return await future
+
+    async def close(self):
+        """소비자 태스크 및 프로세스 풀 종료"""
+        for consumer in self.consumers:
+            consumer.cancel()
+        await asyncio.gather(*self.consumers, return_exceptions=True)
+        self.consumers = []
+
+        if self.executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+            print("[INFO] 파싱 프로세스 풀 종료")
+
+
 class AsyncCoupangCrawler:
     """비동기 쿠팡 크롤러"""
 
-    def __init__(self, proxy_list: List[str] = None, max_concurrent: int = 80):
+    def __init__(self, proxy_list: List[str] = None, max_concurrent: int = 80,
+                 parse_workers: Optional[int] = None,
+                 max_products_in_flight: Optional[int] = None,
+                 product_order: str = "round_robin", incremental: bool = False):
         # 기본 설정 (높은 동시성 + 안전성)
         self.base_review_url = "https://www.coupang.com/vp/product/reviews"
         self.max_concurrent = min(max_concurrent, 80)  # 최대 80개 동시 요청
         self.max_pages_per_product = 100  # 페이지 수는 100개로 유지
         self.max_retries = 2  # 재시도 횟수는 2회로 유지
+        self.batch_size = 5  # 상품당 동시 요청 페이지 수 (페이지 파이프라인 워커 수)
+        self.page_delay_range = (3, 8)  # 워커별 페이지 간 대기 (초)
+
+        # 다중 상품 스케줄링 (전역 동시성 예산을 여러 상품이 공유)
+        # 기본값: 전역 동시 요청 수를 상품당 배치 크기로 나눈 만큼 동시에 진행 (프록시 수에 비례)
+        self.max_products_in_flight = max_products_in_flight or max(1, self.max_concurrent // self.batch_size)
+        self.product_order = product_order  # "round_robin"(입력 순서) 또는 "review_count"(리뷰 많은 상품 우선)
+        self.product_delay_range = (15, 30)  # 슬롯별 상품 간 대기 (초)
 
         # 비동기 관리자들 (프록시당 1개 연결)
-        self.proxy_manager = AsyncProxyManager(proxy_list, max_concurrent_per_proxy=1)  # 프록시당 1개로 제한
+        # 프록시 성능 기록은 main3 등 동기 크롤러와 같은 파일을 공유 (실행 간 유지)
+        # 이벤트 루프에서 기록하므로 자동 저장은 끄고 AsyncProxyManager 가 스레드 풀에서 저장
+        self.proxy_perf = ProxyPerfStore(auto_flush=False) if proxy_list else None
+        self.proxy_manager = AsyncProxyManager(proxy_list, max_concurrent_per_proxy=1,
+                                               perf_store=self.proxy_perf)  # 프록시당 1개로 제한
+        if self.proxy_perf:
+            print(f"[INFO] 프록시 성능 기록 ({self.proxy_perf.path}): {self.proxy_perf.describe()}")
         self.global_semaphore = asyncio.Semaphore(self.max_concurrent)
 
+        # 증분 크롤링: 최신순으로 수집하고 상품별 기준점(high-water mark) 이후 리뷰만 저장
+        self.incremental = incremental
+        self.state_store = ReviewStateStore(os.path.join("Coupang-reviews", "crawl_state.json")) if incremental else None
+
+        # 상품별 진행 상태 체크포인트 (main3 와 같은 파일, 중단 후 재시작 시 이어서 크롤링)
+        self.checkpoint = CrawlCheckpoint(os.path.join("Coupang-reviews", "crawl_checkpoint.json"))
+
+        # HTML 파싱은 프로세스 풀에서 수행 (이벤트 루프 블로킹 방지)
+        self.parse_stage = ParseStage(workers=parse_workers)
+
         # User-Agent 관리
         self.ua = NonWindowsUserAgent()
 
@@ -182,6 +359,9 @@ class AsyncCoupangCrawler:
         # SSL 컨텍스트 설정
         self.ssl_context = self._create_ssl_context()
 
+        # 공유 HTTP 세션 (start_async 에서 생성/종료)
+        self.session: Optional[aiohttp.ClientSession] = None
+
     def _create_ssl_context(self):
         """SSL 검증을 비활성화한 SSL 컨텍스트 생성"""
         try:
@@ -193,9 +373,43 @@ class AsyncCoupangCrawler:
             print(f"[WARNING] SSL 컨텍스트 생성 실패: {e}")
             return False  # SSL 검증 완전 비활성화
 
+    async def get_session(self) -> aiohttp.ClientSession:
+        """크롤러 전체에서 공유하는 aiohttp 세션 반환 (없으면 생성)
+
+        - keep-alive 유지로 동일 프록시 경유 연결 재사용 (aiohttp 는 프록시별로 연결 풀을 구분)
+        - DNS 캐시 활성화
+        - User-Agent 등 브라우저 헤더는 세션에 고정하지 않고 make_request 에서 요청마다 생성
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=max(100, self.max_concurrent),  # 전체 연결 풀 크기
+                limit_per_host=self.max_concurrent,  # 호스트(+프록시)당 연결 수
+                ssl=self.ssl_context,
+                enable_cleanup_closed=True,
+                keepalive_timeout=60,  # 유휴 연결 유지 시간 (초)
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+            )
+            timeout = aiohttp.ClientTimeout(total=45)  # 타임아웃 유지
+
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout
+            )
+            print("[INFO] 공유 HTTP 세션 생성 (keep-alive, DNS 캐시)")
+        return self.session
+
+    async def close_session(self):
+        """공유 aiohttp 세션 종료"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+            print("[INFO] 공유 HTTP 세션 종료")
+        self.session = None
+
     def get_realistic_headers(self) -> Dict[str, str]:
         """더욱 실제 브라우저와 유사한 헤더 생성"""
-        user_agent = self.ua.random
+        # User-Agent와 플랫폼 정보(UA 풀에서 미리 계산된 값)
+        user_agent, platform, mobile = self.ua.pick()
 
         # 기본 브라우저 헤더 (실제 Chrome에서 복사)
         headers = {
@@ -212,30 +426,10 @@ class AsyncCoupangCrawler:
             "Sec-Fetch-User": "?1",
             "Upgrade-Insecure-Requests": "1",
             "User-Agent": user_agent,
+            "sec-ch-ua-platform": platform,
+            "sec-ch-ua-mobile": mobile,
         }
 
-        # User-Agent에 따라 플랫폼 정보 조정
-        if 'iPhone' in user_agent or 'iPad' in user_agent:
-            headers.update({
-                "sec-ch-ua-platform": '"iOS"',
-                "sec-ch-ua-mobile": "?1" if 'iPhone' in user_agent else "?0"
-            })
-        elif 'Android' in user_agent:
-            headers.update({
-                "sec-ch-ua-platform": '"Android"',
-                "sec-ch-ua-mobile": "?1"
-            })
-        elif 'Macintosh' in user_agent or 'Mac OS X' in user_agent:
-            headers.update({
-                "sec-ch-ua-platform": '"macOS"',
-                "sec-ch-ua-mobile": "?0"
-            })
-        else:
-            headers.update({
-                "sec-ch-ua-platform": '"macOS"',
-                "sec-ch-ua-mobile": "?0"
-            })
-
         # 쿠팡 특화 헤더 (필요시에만)
         if random.choice([True, False]):
             headers.update({
@@ -250,15 +444,16 @@ class AsyncCoupangCrawler:
         return headers
 
     async def make_request(self, session: aiohttp.ClientSession, url: str,
-                           params: Dict, proxy: str) -> Optional[Tuple[str, float]]:
+                           params: Dict, proxy: str) -> Optional[Tuple[bytes, float]]:
         """단일 HTTP 요청 수행"""
         start_time = time.time()
 
         try:
             proxy_url = self.proxy_manager.get_proxy_dict(proxy) if proxy else None
 
-            # 요청 헤더에 추가 정보
+            # 요청마다 새 브라우저 헤더(User-Agent, sec-ch-ua) 생성 후 요청 헤더 추가
             headers = {
+                **self.get_realistic_headers(),
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                 'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
                 'Accept-Encoding': 'gzip, deflate, br',
@@ -278,7 +473,8 @@ class AsyncCoupangCrawler:
                 response_time = time.time() - start_time
 
                 if response.status == 200:
-                    content = await response.text()
+                    # 디코딩/파싱은 파싱 프로세스에서 수행하므로 raw bytes 그대로 전달
+                    content = await response.read()
                     if proxy:
                         await self.proxy_manager.record_success(proxy, response_time)
                     return content, response_time
@@ -310,14 +506,15 @@ class AsyncCoupangCrawler:
             return None, time.time() - start_time
 
     async def fetch_page_with_retry(self, session: aiohttp.ClientSession,
-                                    payload: Dict, max_retries: int = 2) -> Optional[str]:
+                                    payload: Dict, max_retries: int = 2) -> Optional[bytes]:
         """재시도가 포함된 페이지 요청 (보수적 접근)"""
         async with self.global_semaphore:
 
             # 프록시 실패율이 높으면 프록시 없이 시도 (기준 강화: 80% → 70%)
             proxy_failure_rate = len(self.proxy_manager.failed_proxies) / max(len(self.proxy_manager.proxy_list),
                                                                               1) if self.proxy_manager.proxy_list else 0
-            use_proxy = proxy_failure_rate < 0.7  # 70% 이상 실패하면 프록시 사용 안함
+            # 70% 이상 실패하면 프록시 사용 안함 (프록시 목록이 없으면 처음부터 직접 연결)
+            use_proxy = bool(self.proxy_manager.proxy_list) and proxy_failure_rate < 0.7
 
             if proxy_failure_rate > 0.5:  # 50% 이상 실패시 경고
                 print(f"[WARNING] 프록시 실패율 {proxy_failure_rate:.1%} - 직접 연결 가능성 증가")
@@ -367,252 +564,398 @@ class AsyncCoupangCrawler:
             self.total_requests += 1
             return None
 
-    async def parse_review_page(self, html_content: str, page_num: int,
-                                sd: SaveData, product_title: str) -> int:
-        """리뷰 페이지 파싱 및 저장"""
-        try:
-            soup = bs(html_content, "html.parser")
-            articles = soup.select("article.sdp-review__article__list")
-
-            if not articles:
-                return 0
-
-            print(f"[SUCCESS] 페이지 {page_num}에서 {len(articles)}개 리뷰 발견")
-
-            # 리뷰 데이터 파싱
-            reviews_data = []
-            for article in articles:
-                review_data = self.extract_review_data(article, product_title)
-                if review_data:
-                    reviews_data.append(review_data)
+    async def fetch_and_parse_page(self, session: aiohttp.ClientSession, payload: Dict,
+                                   page_num: int, product_title: str) -> Optional[Tuple[List[Dict], Optional[int]]]:
+        """페이지 요청 후 바로 파싱 단계로 전달 (요청 실패 시 None, 성공 시 (리뷰 리스트, 전체 리뷰 수))"""
+        result = await self.fetch_page_with_retry(session, payload, max_retries=2)
+        if not result:
+            return None
+        return await self.parse_review_page(result, page_num, product_title)
 
-            # 배치로 저장 (Thread pool 사용하여 I/O 블로킹 방지)
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                for review_data in reviews_data:
-                    await loop.run_in_executor(executor, sd.save, review_data)
+    async def parse_review_page(self, html_content: bytes, page_num: int,
+                                product_title: str) -> Optional[Tuple[List[Dict], Optional[int]]]:
+        """리뷰 페이지 파싱 (리뷰 리스트, 전체 리뷰 수 또는 None). 파싱 실패 시 None (요청 실패와 같이 처리)"""
+        try:
+            # 파싱 프로세스 풀에서 추출 (review_parser, lxml)
+            reviews_data, total_count = await self.parse_stage.parse(html_content, product_title)
 
-            return len(reviews_data)
+            if reviews_data:
+                print(f"[SUCCESS] 페이지 {page_num}에서 {len(reviews_data)}개 리뷰 발견")
+            return reviews_data, total_count
 
         except Exception as e:
             print(f"[ERROR] 페이지 {page_num} 파싱 실패: {e}")
-            return 0
+            return None
 
-    def extract_review_data(self, article, product_title: str) -> Optional[Dict]:
-        """단일 리뷰 데이터 추출 (기존 로직 유지)"""
-        try:
-            # 기존 추출 로직과 동일
-            review_date_elem = article.select_one(
-                "div.sdp-review__article__list__info__product-info__reg-date"
-            )
-            review_date = review_date_elem.text.strip() if review_date_elem else "-"
+    @staticmethod
+    def _save_all(sd: SaveData, reviews_data: List[Dict]):
+        for review_data in reviews_data:
+            sd.save(review_data)
 
-            user_name_elem = article.select_one(
-                "span.sdp-review__article__list__info__user__name"
-            )
-            user_name = user_name_elem.text.strip() if user_name_elem else "-"
+    async def save_reviews(self, sd: SaveData, reviews_data: List[Dict]):
+        """리뷰 저장 (스레드 풀에서 실행하여 I/O 블로킹 방지)"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._save_all, sd, reviews_data)
 
-            rating_elem = article.select_one(
-                "div.sdp-review__article__list__info__product-info__star-orange"
-            )
-            if rating_elem and rating_elem.get("data-rating"):
-                try:
-                    rating = int(rating_elem.get("data-rating"))
-                except (ValueError, TypeError):
-                    rating = 0
-            else:
-                rating = 0
+    def _record_page(self, sd: SaveData, prod_code: str, page_num: int, file_suffix: str):
+        if sd.flush():
+            self.checkpoint.record_page(prod_code, page_num, file_suffix=file_suffix,
+                                        reviews=sd.writer.row_count)
 
-            prod_name_elem = article.select_one(
-                "div.sdp-review__article__list__info__product-info__name"
-            )
-            prod_name = prod_name_elem.text.strip() if prod_name_elem else "-"
-
-            headline_elem = article.select_one(
-                "div.sdp-review__article__list__headline"
-            )
-            headline = headline_elem.text.strip() if headline_elem else "등록된 헤드라인이 없습니다"
-
-            review_content_elem = article.select_one(
-                "div.sdp-review__article__list__review__content.js_reviewArticleContent"
-            )
-            if review_content_elem:
-                review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
-            else:
-                review_content_elem = article.select_one(
-                    "div.sdp-review__article__list__review > div"
-                )
-                if review_content_elem:
-                    review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
-                else:
-                    review_content = "등록된 리뷰내용이 없습니다"
-
-            helpful_count_elem = article.select_one("span.js_reviewArticleHelpfulCount")
-            helpful_count = helpful_count_elem.text.strip() if helpful_count_elem else "0"
-
-            review_images = article.select("div.sdp-review__article__list__attachment__list img")
-            image_count = len(review_images)
-
-            return {
-                "title": product_title,
-                "prod_name": prod_name,
-                "review_date": review_date,
-                "user_name": user_name,
-                "rating": rating,
-                "headline": headline,
-                "review_content": review_content,
-                "helpful_count": helpful_count,
-                "image_count": image_count
-            }
-
-        except Exception as e:
-            print(f"[ERROR] 리뷰 데이터 추출 실패: {e}")
-            return None
+    async def checkpoint_page(self, sd: SaveData, prod_code: str, page_num: int, file_suffix: str = ""):
+        """저장 완료된 페이지를 체크포인트에 기록 (저널 fsync 후, 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._record_page, sd, prod_code, page_num, file_suffix)
 
     async def crawl_product_pages_batch(self, prod_code: str, product_title: str,
-                                        sd: SaveData, batch_size: int = 5) -> int:
-        """상품의 여러 페이지를 배치로 크롤링 (보수적 접근)"""
-
-        # SSL 검증 비활성화된 커넥터 설정
-        connector = aiohttp.TCPConnector(
-            limit=100,  # 전체 연결 풀 크기 증가
-            limit_per_host=80,  # 호스트당 연결 수 증가 (80개 동시 요청 지원)
-            ssl=self.ssl_context,
-            enable_cleanup_closed=True,
-            force_close=True
-        )
-        timeout = aiohttp.ClientTimeout(total=45)  # 타임아웃 유지
-
-        async with aiohttp.ClientSession(
-                headers=self.get_realistic_headers(),
-                connector=connector,
-                timeout=timeout
-        ) as session:
-
-            total_reviews = 0
-            current_page = 1
-            consecutive_empty_pages = 0
-            max_empty_pages = 3  # 빈 페이지 허용 횟수 감소
-            failed_proxy_count = 0
-            max_failed_proxies = len(self.proxy_manager.proxy_list) * 0.9 if self.proxy_manager.proxy_list else 0
-
-            while (consecutive_empty_pages < max_empty_pages and
-                   current_page <= self.max_pages_per_product):
-
-                # 프록시 대부분이 실패했으면 중단
-                if self.proxy_manager.proxy_list and failed_proxy_count > max_failed_proxies:
+                                        sd: SaveData, batch_size: Optional[int] = None,
+                                        review_count: Optional[int] = None,
+                                        cursor: Optional[ReviewCursor] = None,
+                                        start_page: int = 1, file_suffix: str = "",
+                                        failed_pages: Optional[List[int]] = None) -> int:
+        """상품 페이지를 슬라이딩 윈도우 파이프라인으로 크롤링
+
+        - batch_size 개 워커가 다음 페이지를 가져감: 느린 페이지가 다른 슬롯을 막지 않음
+        - 아직 저장되지 않은 가장 앞 페이지보다 batch_size * 2 페이지 이상 앞서 요청하지 않음
+        - 결과는 페이지 순서대로 저장하며, 종료 조건도 페이지 순서로 판정
+        - 전체 리뷰 수(상품 목록 review_count, 이후 첫 페이지 값으로 갱신)로 마지막 페이지를 계획하고
+          계획 이후 1페이지만 검증 요청. 리뷰 수를 모르면 연속 빈 페이지 규칙으로 종료
+        - cursor 가 주어지면(증분 모드) 최신순으로 요청하고, 이미 수집한 리뷰에 도달한 페이지에서 종료
+        - 저장된 페이지는 체크포인트에 기록하며, start_page 부터 요청해 중단된 상품을 이어서 크롤링
+          (요청 실패 페이지는 한 번 재요청한 뒤에도 실패하면 failed_pages 에 모으고, 그 이후 페이지는 체크포인트에 기록하지 않음)
+        - 요청 실패는 빈 페이지로 집계하지 않음 (연속 요청 실패 max_empty_pages 회면 종료, 다음 실행에서 이어서 수집)
+        - 계획이 줄어들거나 종료 조건이 확정되면 마지막 페이지 이후의 투기적 요청은 취소
+        """
+
+        # 크롤러 실행 단위로 공유되는 keep-alive 세션 사용 (상품마다 새 TCP/TLS 핸드셰이크 방지)
+        session = await self.get_session()
+        batch_size = batch_size or self.batch_size
+        failed_pages = [] if failed_pages is None else failed_pages
+
+        max_empty_pages = 3  # 빈 페이지 허용 횟수 감소
+        max_failed_proxies = len(self.proxy_manager.proxy_list) * 0.9 if self.proxy_manager.proxy_list else 0
+
+        planner = PagePlanner(page_size=5, max_pages=self.max_pages_per_product,
+                              max_empty_pages=max_empty_pages, review_count=review_count)
+        print(f"[INFO] 페이지 계획: {planner.describe()}")
+
+        results = {}  # 완료됐지만 아직 저장되지 않은 페이지 -> (리뷰 리스트, 전체 리뷰 수) (요청 실패 시 None)
+        in_flight = {}  # 요청 중인 페이지 -> task
+        requeued = []  # 계획 축소로 취소됐던 페이지 (계획이 다시 늘어나면 재요청, heap)
+        recent_failures = deque(maxlen=batch_size)
+        # 저장 순서 보장 + 윈도우 진행 알림 (저장되지 않은 페이지가 max_ahead 이상 앞서 나가지 않도록 제한)
+        progress = asyncio.Condition()
+        max_ahead = batch_size * 2
+
+        next_page = start_page  # 아직 한 번도 요청하지 않은 가장 앞 페이지
+        next_commit_page = start_page
+        last_page = planner.last_page
+        stopped = False
+        total_reviews = 0
+        failed_proxy_count = 0
+        consecutive_failed_pages = 0
+        page_retries = defaultdict(int)  # 페이지별 재요청 횟수 (요청 실패 시 max_page_retries 회까지 다시 대기열로)
+        max_page_retries = 1
+
+        def set_last_page(page_num: int):
+            """마지막 페이지 변경. 그 이후 페이지의 진행 중인 요청은 취소하고 재요청 대상으로 보관"""
+            nonlocal last_page
+            last_page = page_num
+            for pending_page, task in list(in_flight.items()):
+                if pending_page > last_page and not task.done():
+                    task.cancel()
+                    heapq.heappush(requeued, pending_page)
+
+        def stop_after(page_num: int):
+            """page_num 이후 페이지는 요청하지 않고, 진행 중인 요청은 취소"""
+            nonlocal stopped
+            stopped = True
+            set_last_page(min(last_page, page_num))
+
+        def is_finished() -> bool:
+            return stopped or next_commit_page > last_page
+
+        def can_take_page() -> bool:
+            limit = min(last_page, next_commit_page + max_ahead - 1)
+            return (requeued and requeued[0] <= limit) or next_page <= limit
+
+        def take_page() -> int:
+            nonlocal next_page
+            if requeued:
+                return heapq.heappop(requeued)
+            page_num = next_page
+            next_page += 1
+            return page_num
+
+        async def commit_ready_pages():
+            """완료된 페이지를 순서대로 저장하고 종료 조건/페이지 계획 갱신"""
+            nonlocal next_commit_page, total_reviews, failed_proxy_count, consecutive_failed_pages
+
+            while not stopped and next_commit_page <= last_page and next_commit_page in results:
+                page_num = next_commit_page
+                page_result = results.pop(page_num)
+                next_commit_page += 1
+
+                failed = page_result is None
+                reviews_data, total_count = page_result if page_result else (None, None)
+                recent_failures.append(failed)
+
+                # 리뷰 페이지의 전체 리뷰 수가 계획과 다르면 갱신
+                if total_count is not None and total_count != planner.review_count:
+                    planner.set_review_count(total_count)
+                    print(f"[INFO] 페이지 계획 갱신: {planner.describe()}")
+
+                # 요청 실패는 빈 페이지로 집계하지 않음 (정상 응답에 리뷰가 없는 페이지만 종료 조건에 반영)
+                if failed:
+                    consecutive_failed_pages += 1
+                else:
+                    consecutive_failed_pages = 0
+                    planner.record(page_num, bool(reviews_data))
+                if cursor and reviews_data:
+                    reviews_data = cursor.filter(reviews_data)
+                if reviews_data:
+                    await self.save_reviews(sd, reviews_data)
+                    total_reviews += len(reviews_data)
+                # 첫 실패 페이지 이후로는 체크포인트를 갱신하지 않음 (다음 실행에서 실패 페이지부터 다시 수집)
+                if failed:
+                    failed_pages.append(page_num)
+                elif not failed_pages:
+                    await self.checkpoint_page(sd, prod_code, page_num, file_suffix)
+
+                # 최근 윈도우의 70% 이상이 요청 실패면 차단된 프록시 카운트 증가
+                if failed and sum(recent_failures) > len(recent_failures) * 0.7:
+                    failed_proxy_count += 1
+
+                print(f"[PAGE] 페이지 {page_num}: {len(reviews_data or [])}개 리뷰"
+                      f"{' (요청 실패)' if failed else ''}, "
+                      f"연속 빈 페이지: {planner.consecutive_empty_pages}/{max_empty_pages}")
+
+                if cursor and cursor.reached:
+                    print(f"[INFO] 페이지 {page_num}에서 이미 수집한 리뷰 도달 - 증분 크롤링 종료")
+                    stop_after(page_num)
+                elif planner.finished:
+                    print(f"[INFO] {planner.stop_reason} - 크롤링 종료")
+                    stop_after(page_num)
+                elif consecutive_failed_pages >= max_empty_pages:
+                    print(f"[WARNING] 연속 {consecutive_failed_pages}페이지 요청 실패 - 이 상품은 다음 실행에서 이어서 수집")
+                    stop_after(page_num)
+                elif self.proxy_manager.proxy_list and failed_proxy_count > max_failed_proxies:
                     print(f"[WARNING] 90% 이상의 프록시가 차단되어 크롤링을 중단합니다.")
-                    break
-
-                # 배치 단위로 페이지 요청 생성 (더 작은 배치)
-                end_page = min(current_page + batch_size - 1, self.max_pages_per_product)
-                batch_tasks = []
-
-                for page_num in range(current_page, end_page + 1):
-                    payload = {
-                        "productId": str(prod_code),
-                        "page": str(page_num),
-                        "size": "5",
-                        "sortBy": "ORDER_SCORE_ASC",
-                        "ratings": "",
-                        "q": "",
-                        "viRoleCode": "2",
-                        "ratingSummary": "true",
-                    }
-
-                    task = self.fetch_page_with_retry(session, payload, max_retries=2)
-                    batch_tasks.append((page_num, task))
-
-                    # 요청 간 짧은 딜레이 (봇 탐지 방지)
-                    await asyncio.sleep(random.uniform(0.5, 1.5))
-
-                # 배치 실행
-                print(f"[INFO] 페이지 {current_page}-{end_page} 배치 요청 중... (보수적 모드)")
-                batch_results = await asyncio.gather(
-                    *[task for _, task in batch_tasks],
-                    return_exceptions=True
+                    stop_after(page_num)
+                elif planner.last_page != last_page:
+                    set_last_page(planner.last_page)
+
+        async def page_worker(slot: int):
+            # 워커별 시작 시점 분산 (요청 간 짧은 딜레이, 봇 탐지 방지)
+            if slot > 0:
+                await asyncio.sleep(slot * random.uniform(0.5, 1.5))
+
+            while True:
+                async with progress:
+                    await progress.wait_for(lambda: is_finished() or can_take_page())
+                    if is_finished():
+                        return
+                    page_num = take_page()
+
+                payload = {
+                    "productId": str(prod_code),
+                    "page": str(page_num),
+                    "size": "5",
+                    "sortBy": "DATE_DESC" if cursor else "ORDER_SCORE_ASC",
+                    "ratings": "",
+                    "q": "",
+                    "viRoleCode": "2",
+                    "ratingSummary": "true",
+                }
+
+                task = asyncio.ensure_future(
+                    self.fetch_and_parse_page(session, payload, page_num, product_title)
                 )
-
-                # 결과 처리
-                batch_review_count = 0
-                batch_403_count = 0
-
-                for (page_num, _), result in zip(batch_tasks, batch_results):
-                    if isinstance(result, Exception):
-                        print(f"[ERROR] 페이지 {page_num} 요청 실패: {result}")
-                        continue
-
-                    if result:
-                        review_count = await self.parse_review_page(
-                            result, page_num, sd, product_title
-                        )
-                        batch_review_count += review_count
-
-                        if review_count == 0:
-                            consecutive_empty_pages += 1
-                        else:
-                            consecutive_empty_pages = 0
-                    else:
-                        consecutive_empty_pages += 1
-                        batch_403_count += 1
-
-                # 403 오류가 많으면 실패한 프록시 카운트 증가
-                if batch_403_count > len(batch_tasks) * 0.7:
-                    failed_proxy_count += batch_403_count
-
-                total_reviews += batch_review_count
-                current_page = end_page + 1
-
-                # 배치 간 더 긴 대기 (인간적인 패턴)
-                if current_page <= self.max_pages_per_product:
-                    delay = random.uniform(3, 8)  # 3-8초 대기
-                    print(f"[DEBUG] 다음 배치까지 {delay:.1f}초 대기... (탐지 방지)")
-                    await asyncio.sleep(delay)
-
-                print(
-                    f"[BATCH] 페이지 {current_page - batch_size}-{end_page}: {batch_review_count}개 리뷰, 403 오류: {batch_403_count}개")
-
-                # 연속으로 모든 요청이 실패하면 조기 종료
-                if batch_review_count == 0 and batch_403_count == len(batch_tasks):
-                    consecutive_empty_pages += 1
-                    print(f"[WARNING] 배치 전체가 차단되었습니다. 연속 실패: {consecutive_empty_pages}/{max_empty_pages}")
-
-            return total_reviews
-
-    async def crawl_single_product(self, url: str, product_name: str) -> bool:
-        """단일 상품 크롤링 (기존 인터페이스 유지)"""
+                in_flight[page_num] = task
+                try:
+                    await asyncio.wait({task})
+                finally:
+                    in_flight.pop(page_num, None)
+                    if not task.done():
+                        task.cancel()
+
+                if task.cancelled():
+                    print(f"[DEBUG] 페이지 {page_num} 요청 취소 (마지막 페이지 {last_page} 이후)")
+                    continue
+                if task.exception():
+                    print(f"[ERROR] 페이지 {page_num} 요청 실패: {task.exception()}")
+                    page_result = None
+                else:
+                    page_result = task.result()
+
+                # 요청 실패 페이지는 한 번 더 대기열로 (다른 워커/프록시로 재요청), 그래도 실패하면 실패 페이지로 저장 단계에 전달
+                if page_result is None and page_retries[page_num] < max_page_retries:
+                    page_retries[page_num] += 1
+                    print(f"[INFO] 페이지 {page_num} 재요청 대기 ({page_retries[page_num]}/{max_page_retries})")
+                    await asyncio.sleep(random.uniform(*self.page_delay_range))
+                    async with progress:
+                        heapq.heappush(requeued, page_num)
+                        progress.notify_all()
+                    continue
+                results[page_num] = page_result
+
+                async with progress:
+                    await commit_ready_pages()
+                    progress.notify_all()
+
+                # 워커별 페이지 간 대기 (인간적인 패턴)
+                if page_num < last_page:
+                    await asyncio.sleep(random.uniform(*self.page_delay_range))
+
+        print(f"[INFO] 페이지 파이프라인 시작: 워커 {batch_size}개, 최대 {self.max_pages_per_product}페이지")
+        await asyncio.gather(*[page_worker(slot) for slot in range(batch_size)])
+
+        async with progress:
+            await commit_ready_pages()
+
+        return total_reviews
+
+    @staticmethod
+    def get_product_code(url: str) -> str:
+        return url.split('#')[0].split("products/")[-1].split("?")[0]
+
+    async def crawl_single_product(self, url: str, product_name: str,
+                                   review_count: Optional[int] = None) -> bool:
+        """단일 상품 크롤링 (기존 인터페이스 유지, review_count 는 페이지 계획용)"""
         if '#' in url:
             url = url.split('#')[0]
 
         # 상품 코드 추출 (기존 로직)
-        prod_code = url.split("products/")[-1].split("?")[0]
+        prod_code = self.get_product_code(url)
         print(f"[DEBUG] 상품 코드: {prod_code}")
 
-        # SaveData 인스턴스 생성
-        sd = SaveData()
+        # 체크포인트에 진행 중으로 남은 상품이면 마지막 저장 페이지 다음부터 같은 저널에 이어서 기록
+        start_page, resume_entry = self.checkpoint.resume_point(prod_code)
+
+        # SaveData 인스턴스 생성 (증분 모드는 기존 결과 파일을 덮어쓰지 않도록 실행 시각 접미사 사용)
+        if resume_entry:
+            file_suffix = resume_entry.get("file_suffix") or ""
+            print(f"[INFO] 체크포인트에서 재개: {start_page}페이지부터 (저장된 리뷰 {resume_entry.get('reviews', 0)}개)")
+        else:
+            file_suffix = time.strftime("_신규_%Y%m%d_%H%M%S") if self.incremental else ""
+        sd = SaveData(file_suffix=file_suffix, resume=resume_entry is not None,
+                      resume_rows=resume_entry.get("reviews") if resume_entry else None)
+        if resume_entry:
+            # 다시 요청한 페이지가 모두 비어도 기존 저널로 xlsx 를 만들 수 있도록 미리 열어 둠
+            sd.writer.open(product_name)
+
+        cursor = self.state_store.begin(prod_code) if self.incremental else None
+        if cursor:
+            print(f"[INFO] 증분 크롤링: {cursor.describe()}")
 
         product_start_time = time.time()
+        failed_pages = []
 
         try:
             total_reviews = await self.crawl_product_pages_batch(
-                prod_code, product_name, sd
+                prod_code, product_name, sd, review_count=review_count, cursor=cursor,
+                start_page=start_page, file_suffix=file_suffix, failed_pages=failed_pages
             )
 
+            # 이전 실행에서 저장한 리뷰가 있으면 재개한 페이지가 모두 비어도 성공으로 처리
+            success = total_reviews > 0 or sd.writer.row_count > 0 or bool(cursor and cursor.reached)
+
+            # 상품 완료 시 저널을 xlsx 로 한 번에 변환 (실패 페이지가 있으면 다음 실행에서 이어서 기록하도록 저널 보존)
+            sd.close(keep_journal=success and bool(failed_pages))
+            self.checkpoint.finish(prod_code, success, reviews=sd.writer.row_count, failed_pages=failed_pages)
+
+            # 저장이 끝난 뒤에만 기준점 갱신 (중단되거나 실패 페이지가 있으면 다음 실행에서 다시 수집)
+            if cursor and not failed_pages:
+                self.state_store.commit(cursor)
+
             product_end_time = time.time()
             product_elapsed = product_end_time - product_start_time
 
             print(f"\n[PRODUCT SUMMARY] 상품 '{product_name}' 크롤링 완료")
             print(f"[INFO] 총 리뷰 수: {total_reviews}개")
+            if failed_pages:
+                print(f"[WARNING] 요청 실패 페이지: {len(failed_pages)}개")
             print(f"[INFO] 소요 시간: {product_elapsed / 60:.1f}분")
             print(
                 f"[INFO] 성공률: {self.successful_requests}/{self.total_requests} ({self.successful_requests / max(self.total_requests, 1) * 100:.1f}%)")
 
-            return total_reviews > 0
+            return success
 
         except Exception as e:
             print(f"[ERROR] 상품 크롤링 실패: {e}")
             return False
 
+    def order_products(self, products: Iterable[Dict]) -> Iterable[Dict]:
+        """상품 크롤링 순서 결정
+
+        - round_robin: 입력 순서 유지 (파일에서 읽는 대로 슬롯에 전달, 메모리에 모아두지 않음)
+        - review_count: 예상 페이지 수(review_count 기반)가 많은 상품부터 시작해 후반부 쏠림 방지
+          (정렬을 위해 상품 목록 전체를 읽어야 함)
+        """
+        if self.product_order == "review_count":
+            return sorted(products, key=lambda p: p.get('review_count') or 0, reverse=True)
+        return products
+
+    async def feed_products(self, queue: asyncio.Queue, slot_count: int) -> int:
+        """상품 파일을 읽으며 대기열에 전달 (대기열이 차 있으면 슬롯이 빌 때까지 대기). 건너뛴 상품 수 반환"""
+        skipped = 0
+        try:
+            for i, product in enumerate(self.order_products(self.url_manager.iter_remaining()), 1):
+                if self.checkpoint.is_done(self.get_product_code(product['url'])):
+                    skipped += 1
+                    continue
+                await queue.put((i, product))
+        finally:
+            # 슬롯마다 종료 신호 전달
+            for _ in range(slot_count):
+                await queue.put(None)
+
+        if skipped:
+            print(f"[INFO] 이전 실행에서 완료된 상품 {skipped}개 건너뜀")
+        return skipped
+
+    async def product_worker(self, slot: int, queue: asyncio.Queue) -> Tuple[int, int]:
+        """상품 슬롯 워커: 대기열에서 상품을 꺼내 순차 크롤링 (성공 수, 실패 수 반환)"""
+        success_count = 0
+        failed_count = 0
+
+        # 슬롯별 시작 시점 분산 (모든 상품이 동시에 첫 요청을 보내지 않도록)
+        if slot > 0:
+            await asyncio.sleep(slot * random.uniform(1, 3))
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            i, product = item
+
+            # 슬롯별 상품 간 대기 시간 (봇 탐지 방지)
+            if success_count or failed_count:
+                delay = random.uniform(*self.product_delay_range)
+                print(f"[INFO] 슬롯 {slot + 1}: 다음 상품까지 {delay:.1f}초 대기... (봇 탐지 방지)")
+                await asyncio.sleep(delay)
+
+            _, total_products = self.url_manager.get_current_progress()
+            print(f"\n{'=' * 20} 상품 {i}/{total_products} (슬롯 {slot + 1}) {'=' * 20}")
+            print(f"[INFO] 현재 상품: {product['name']}")
+            print(f"[INFO] 상품 URL: {product['url']}")
+
+            try:
+                success = await self.crawl_single_product(
+                    product['url'], product['name'], product.get('review_count')
+                )
+                if success:
+                    success_count += 1
+                    print(f"✅ 상품 {i} 크롤링 성공")
+                else:
+                    failed_count += 1
+                    print(f"❌ 상품 {i} 크롤링 실패")
+            except Exception as e:
+                print(f"[ERROR] 상품 크롤링 중 예외 발생: {e}")
+                failed_count += 1
+
+        return success_count, failed_count
+
     async def start_async(self) -> None:
         """비동기 크롤링 시작 (프록시당 1개 연결 모드)"""
         print("=" * 70)
@@ -624,12 +967,16 @@ class AsyncCoupangCrawler:
             print("[ERROR] JSON 파일을 로드할 수 없습니다.")
             return
 
-        total_products = len(self.url_manager.products)
-        print(f"[INFO] 총 {total_products}개 상품을 효율적으로 크롤링합니다.")
+        if self.url_manager.total_count is not None:
+            print(f"[INFO] 총 {self.url_manager.total_count}개 상품을 효율적으로 크롤링합니다.")
+        else:
+            print(f"[INFO] 상품 파일을 읽으며 효율적으로 크롤링합니다.")
         print(f"[INFO] 최대 동시 요청 수: {self.max_concurrent}개")
-        print(f"[INFO] 배치 크기: 5페이지 (안전성 유지)")
+        print(f"[INFO] 상품당 페이지 워커: {self.batch_size}개 (슬라이딩 윈도우)")
         print(f"[INFO] 상품당 최대 페이지: {self.max_pages_per_product}페이지")
-        print(f"[INFO] 상품 간 대기시간: 15-30초")
+        print(f"[INFO] 동시 진행 상품 수: {self.max_products_in_flight}개 (순서: {self.product_order})")
+        print(f"[INFO] 슬롯별 상품 간 대기시간: {self.product_delay_range[0]}-{self.product_delay_range[1]}초")
+        print(f"[INFO] 파싱 워커 수: {self.parse_stage.workers}개 (프로세스 풀)")
 
         if self.proxy_manager.proxy_list:
             print(f"[INFO] 사용 가능한 프록시: {len(self.proxy_manager.proxy_list)}개")
@@ -642,42 +989,38 @@ class AsyncCoupangCrawler:
         print("=" * 70)
 
         # 전체 통계
-        total_success_products = 0
-        total_failed_products = 0
         overall_start_time = time.time()
+        total_skipped_products = 0
+        slot_results = []
 
-        # 상품별 크롤링 실행
-        for i, product in enumerate(self.url_manager.products, 1):
-            print(f"\n{'=' * 20} 상품 {i}/{total_products} {'=' * 20}")
-            print(f"[INFO] 현재 상품: {product['name']}")
-            print(f"[INFO] 상품 URL: {product['url']}")
+        # 파싱 프로세스 풀 및 공유 HTTP 세션 시작
+        await self.parse_stage.start()
+        await self.get_session()
 
-            try:
-                success = await self.crawl_single_product(product['url'], product['name'])
-                if success:
-                    total_success_products += 1
-                    print(f"✅ 상품 {i} 크롤링 성공")
-                else:
-                    total_failed_products += 1
-                    print(f"❌ 상품 {i} 크롤링 실패")
+        try:
+            # 상품 파일을 읽는 대로 대기열에 넣고 K개 슬롯에서 동시 크롤링 (이전 실행에서 완료된 상품 제외)
+            # 대기열 크기를 슬롯 수로 제한하여 읽어 둔 상품이 메모리에 쌓이지 않게 함
+            slot_count = self.max_products_in_flight
+            queue = asyncio.Queue(maxsize=slot_count)
+            total_skipped_products, *slot_results = await asyncio.gather(
+                self.feed_products(queue, slot_count),
+                *[self.product_worker(slot, queue) for slot in range(slot_count)]
+            )
+        finally:
+            await self.close_session()
+            await self.parse_stage.close()
+            await self.proxy_manager.flush_perf()
 
-            except KeyboardInterrupt:
-                print(f"\n[INFO] 사용자에 의해 중단되었습니다.")
-                break
-            except Exception as e:
-                print(f"[ERROR] 상품 크롤링 중 예외 발생: {e}")
-                total_failed_products += 1
-                continue
+        # 모든 상품을 처리했으면 체크포인트 정리 (다음 실행은 처음부터, 실패 페이지가 남은 상품만 이어서 수집)
+        self.checkpoint.complete_run()
 
-            # 상품 간 대기 시간 (더 긴 딜레이)
-            if i < total_products:
-                delay = random.uniform(15, 30)  # 15-30초 대기 (매우 보수적)
-                print(f"[INFO] 다음 상품까지 {delay:.1f}초 대기... (봇 탐지 방지)")
-                await asyncio.sleep(delay)
+        total_success_products = sum(success for success, _ in slot_results)
+        total_failed_products = sum(failed for _, failed in slot_results)
 
         # 전체 결과 요약
         overall_end_time = time.time()
         total_elapsed = overall_end_time - overall_start_time
+        total_products = self.url_manager.total_count or self.url_manager.current_index
 
         print("\n" + "=" * 70)
         print("📊 전체 크롤링 결과 요약")
@@ -685,7 +1028,9 @@ class AsyncCoupangCrawler:
         print(f"총 상품 수: {total_products}개")
         print(f"성공한 상품: {total_success_products}개")
         print(f"실패한 상품: {total_failed_products}개")
-        print(f"성공률: {(total_success_products / total_products * 100):.1f}%")
+        if total_skipped_products:
+            print(f"건너뛴 상품 (이전 실행에서 완료): {total_skipped_products}개")
+        print(f"성공률: {(total_success_products / max(total_products, 1) * 100):.1f}%")
         print(f"총 소요 시간: {total_elapsed / 60:.1f}분")
         print(f"총 요청 수: {self.total_requests}개")
         print(f"요청 성공률: {(self.successful_requests / max(self.total_requests, 1) * 100):.1f}%")
@@ -720,6 +1065,19 @@ def start_optimized_crawler():
         if use_proxy == 'n':
             proxy_list = None
 
+    # 프록시 헬스 체크 (측정한 응답 시간을 초기 성능 점수로 사용)
+    health_results = None
+    if proxy_list:
+        test_proxies = input("프록시 연결을 테스트하시겠습니까? (y/N): ").lower().strip()
+        if test_proxies == 'y':
+            print("\n[INFO] 프록시 연결 테스트 중...")
+            working_proxies, health_results = run_health_check(proxy_list)
+            if working_proxies:
+                proxy_list = working_proxies
+            else:
+                print("[WARNING] 작동하는 프록시가 없어 테스트 결과 없이 모든 프록시를 사용합니다.")
+                health_results = None
+
     # 동시성 설정 (프록시당 1개 연결)
     if proxy_list:
         max_concurrent = min(80, len(proxy_list))  # 프록시 수만큼, 최대 80개
@@ -735,8 +1093,23 @@ def start_optimized_crawler():
         print(f"[WARNING] 프록시 없이 실행하면 IP 차단 위험이 높습니다.")
         print(f"[WARNING] 매우 느린 속도로 크롤링됩니다. (안전성 우선)")
 
+    # 증분 크롤링 여부 확인
+    incremental = input("증분 크롤링(이미 수집한 리뷰에서 중단)을 사용하시겠습니까? (y/N): ").lower().strip() == 'y'
+
     # 크롤러 생성 및 실행
-    crawler = AsyncCoupangCrawler(proxy_list=proxy_list, max_concurrent=max_concurrent)
+    crawler = AsyncCoupangCrawler(proxy_list=proxy_list, max_concurrent=max_concurrent,
+                                  incremental=incremental)
+    if health_results:
+        seeded = crawler.proxy_manager.seed_from_health(health_results)
+        print(f"[INFO] 헬스 체크 결과 {seeded}개를 프록시 초기 점수로 반영했습니다.")
+
+    # 이전 실행 체크포인트 확인 (완료된 상품은 건너뛰고, 진행 중이던 상품은 마지막 페이지 다음부터 재개)
+    if crawler.checkpoint.has_progress():
+        print(f"[INFO] 이전 실행 체크포인트 발견: {crawler.checkpoint.describe()}")
+        resume = input("이전 진행 상황에서 이어서 크롤링하시겠습니까? (Y/n): ").lower().strip()
+        if resume == 'n':
+            crawler.checkpoint.reset()
+            print("[INFO] 체크포인트를 초기화하고 처음부터 크롤링합니다.")
 
     try:
         # 비동기 실행
@@ -0,0 +1,82 @@
+import math
+from typing import Optional
+
+
+class PagePlanner:
+    """전체 리뷰 수로 상품별 요청 페이지 수를 미리 계산하는 planner
+
+    - 리뷰 수를 알면 ceil(리뷰 수 / 페이지 크기) 페이지만 요청하고,
+      마지막에 검증용으로 1페이지만 더 확인 (리뷰 수가 그 사이 늘어난 경우 대비)
+    - 리뷰 수를 모르면 기존처럼 연속 빈 페이지 max_empty_pages 회에서 종료
+    - 계획 중에도 연속 빈 페이지 규칙은 안전장치로 유지
+    """
+
+    def __init__(self, page_size: int, max_pages: int, max_empty_pages: int = 3,
+                 review_count: Optional[int] = None) -> None:
+        self.page_size = max(1, int(page_size))
+        self.max_pages = max_pages
+        self.max_empty_pages = max_empty_pages
+
+        self.review_count = None
+        self.planned_pages = None
+        self.consecutive_empty_pages = 0
+        self.finished = False
+        self.stop_reason = ""
+
+        if review_count is not None:
+            self.set_review_count(review_count)
+
+    @property
+    def is_planned(self) -> bool:
+        return self.planned_pages is not None
+
+    @property
+    def last_page(self) -> int:
+        """요청할 마지막 페이지 (계획 페이지 + 검증 1페이지, max_pages 이내)"""
+        if self.planned_pages is None:
+            return self.max_pages
+        return min(self.planned_pages + 1, self.max_pages)
+
+    def set_review_count(self, review_count) -> bool:
+        """전체 리뷰 수로 계획 갱신 (유효하지 않은 값이면 False)"""
+        try:
+            review_count = int(review_count)
+        except (TypeError, ValueError):
+            return False
+        if review_count < 0:
+            return False
+
+        self.review_count = review_count
+        self.planned_pages = min(math.ceil(review_count / self.page_size), self.max_pages)
+        return True
+
+    def record(self, page_num: int, has_reviews: bool) -> bool:
+        """페이지 결과 반영. 다음 페이지를 계속 요청해야 하면 True"""
+        if has_reviews:
+            self.consecutive_empty_pages = 0
+        else:
+            self.consecutive_empty_pages += 1
+
+        if self.consecutive_empty_pages >= self.max_empty_pages:
+            self._finish(f"연속 {self.max_empty_pages}페이지 빈 결과")
+        elif self.is_planned and page_num > self.planned_pages and not has_reviews:
+            self._finish(f"계획된 {self.planned_pages}페이지 이후 검증 페이지 빈 결과")
+        else:
+            if self.is_planned and page_num > self.planned_pages:
+                # 리뷰 수가 계획보다 많음 (그 사이 리뷰 추가) - 다음 페이지를 다시 검증
+                self.planned_pages = page_num
+            if page_num >= self.max_pages:
+                self._finish(f"최대 페이지({self.max_pages}) 도달")
+
+        return not self.finished
+
+    def _finish(self, reason: str) -> None:
+        self.finished = True
+        self.stop_reason = reason
+
+    def describe(self) -> str:
+        if not self.is_planned:
+            return f"리뷰 수 미확인 - 연속 빈 페이지 {self.max_empty_pages}회까지 탐색 (최대 {self.max_pages}페이지)"
+        probe = " + 검증 1페이지" if self.planned_pages < self.max_pages else ""
+        return (f"리뷰 {self.review_count:,}개 / 페이지당 {self.page_size}개 → "
+                f"{self.planned_pages}페이지{probe}")
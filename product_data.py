@@ -0,0 +1,117 @@
+import re
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional, Tuple
+
+# "(1개입당 290원)", "(100g당 1,234원)" -> ("1개입", 290)
+UNIT_PRICE_RE = re.compile(r'\(?\s*([^()]+?)\s*당\s*([\d,]+)\s*원')
+PERCENT_RE = re.compile(r'(\d+)\s*%')
+
+# 상품마다 같은 값이 반복되는 필드 (한 객체를 공유하여 상품당 메모리 절약)
+SHARED_FIELDS = ('rating', 'discount_rate', 'delivery_info')
+_shared_ratings: Dict[str, Optional[float]] = {}
+
+
+def parse_int(value, default: Optional[int] = None) -> Optional[int]:
+    """"2,690" / 2690 -> 2690 (빈 값이나 숫자가 아니면 default)"""
+    if isinstance(value, bool):
+        return default
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).replace(',', '').strip())
+    except (ValueError, TypeError):
+        return default
+
+
+def parse_float(value, default: Optional[float] = None) -> Optional[float]:
+    """"4.5" / 4.5 -> 4.5 (빈 값이나 숫자가 아니면 default)"""
+    if isinstance(value, bool):
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).strip())
+    except (ValueError, TypeError):
+        return default
+
+
+def parse_percent(value) -> Optional[int]:
+    """"21%" -> 21"""
+    match = PERCENT_RE.search(value or '')
+    return int(match.group(1)) if match else None
+
+
+def parse_unit_price(value) -> Tuple[Optional[int], str]:
+    """"(1개당 2,690원)" -> (2690, "1개")"""
+    match = UNIT_PRICE_RE.search(value or '')
+    if not match:
+        return None, ''
+    return parse_int(match.group(2)), match.group(1)
+
+
+@dataclass(slots=True)
+class ProductData:
+    """상품 데이터 구조
+
+    표시용 문자열(price="2,690" 등)은 기존 JSON 스키마 그대로 유지하고,
+    생성 시(추출 시점) 한 번 변환한 숫자 값을 *_value 필드로 함께 보관한다.
+    to_dict() 는 기존 스키마의 필드만 반환한다.
+    """
+    product_id: str
+    product_name: str
+    price: str
+    original_price: str
+    discount_rate: str
+    unit_price: str
+    rating: str
+    review_count: str
+    product_url: str
+    image_url: str
+    delivery_info: str
+    cashback_amount: str
+    is_rocket_delivery: bool
+    vendor_item_id: str
+    item_id: str
+    page_number: int
+    crawled_at: str
+
+    # 추출 시 한 번만 변환되는 숫자 값 (변환할 수 없으면 None)
+    price_value: Optional[int] = field(init=False, default=None)
+    original_price_value: Optional[int] = field(init=False, default=None)
+    discount_percent: Optional[int] = field(init=False, default=None)
+    unit_price_value: Optional[int] = field(init=False, default=None)
+    unit_price_basis: str = field(init=False, default='')  # 단위가격 기준 ("1개", "100g" 등)
+    rating_value: Optional[float] = field(init=False, default=None)
+    review_count_value: Optional[int] = field(init=False, default=None)
+
+    def __post_init__(self):
+        for name in SHARED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+        self.price_value = parse_int(self.price)
+        self.original_price_value = parse_int(self.original_price)
+        self.discount_percent = parse_percent(self.discount_rate)
+        self.unit_price_value, basis = parse_unit_price(self.unit_price)
+        self.unit_price_basis = sys.intern(basis)
+        self.review_count_value = parse_int(self.review_count)
+
+        # 평점 종류는 몇 개뿐이므로 같은 문자열이면 같은 float 객체 사용
+        if self.rating not in _shared_ratings:
+            _shared_ratings[self.rating] = parse_float(self.rating)
+        self.rating_value = _shared_ratings[self.rating]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 JSON 스키마(표시용 문자열 필드)로 변환"""
+        return {name: getattr(self, name) for name in SCHEMA_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ProductData':
+        """저장된 JSON/JSONL 레코드에서 생성 (숫자 값은 다시 변환)"""
+        return cls(**{name: data.get(name, '') for name in SCHEMA_FIELDS})
+
+
+# JSON/CSV 로 저장되는 필드 (생성자 인자와 같음)
+SCHEMA_FIELDS = tuple(f.name for f in fields(ProductData) if f.init)
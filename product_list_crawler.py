@@ -8,17 +8,21 @@
 import csv
 import json
 import logging
+import queue
 import random
 import re
+import threading
 import time
 import sys
-from dataclasses import dataclass, asdict
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse, parse_qs
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup, Tag
 
 from selenium import webdriver
@@ -29,8 +33,34 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from product_data import ProductData
+
 SELENIUM_AVAILABLE = True
 
+# 상품 목록 로드 상태 확인 스크립트
+# - #productList 에 MutationObserver 를 한 번 설치하여 마지막 DOM 변경 시각 기록
+# - 맨 아래로 스크롤(지연 로딩 유도) 후 상품 수 / 마지막 변경 이후 경과 시간 / 리소스 요청 수 / 문서 높이 반환
+CONTENT_STATE_SCRIPT = """
+const list = document.getElementById('productList');
+let watch = window.__productListWatch;
+if (!watch) {
+    watch = window.__productListWatch = {last: performance.now(), observed: false};
+}
+if (list && !watch.observed) {
+    new MutationObserver(() => { watch.last = performance.now(); })
+        .observe(list, {childList: true, subtree: true, attributes: true});
+    watch.observed = true;
+}
+window.scrollTo(0, document.body.scrollHeight);
+return {
+    count: list ? list.querySelectorAll('li.baby-product').length : 0,
+    quiet_ms: performance.now() - watch.last,
+    resources: performance.getEntriesByType('resource').length,
+    height: document.body.scrollHeight,
+    ready: document.readyState
+};
+"""
+
 
 # =================== 설정 및 데이터 클래스 ===================
 @dataclass
@@ -41,6 +71,16 @@ class CrawlingConfig:
     brand_name: str = "홈플래닛"
     max_pages: int = 5
     delay_range: tuple = (2.0, 5.0)
+    browser_workers: int = 3  # 동시에 페이지를 처리할 브라우저(드라이버) 수
+
+    # 상품 목록 로드 완료 판단 (고정 대기 대신 DOM 변경/네트워크 요청이 멈출 때까지)
+    content_timeout: float = 15.0  # 최대 대기 시간 (초)
+    content_settle: float = 1.0  # 변경이 없어야 하는 시간 (초)
+    content_poll_interval: float = 0.2
+
+    # HTTP 우선 수집 (상품 목록이 없거나 불완전할 때만 브라우저로 대체)
+    http_first: bool = True
+    http_min_products: int = 1  # HTTP 응답에서 최소 이만큼 상품이 추출되어야 사용
     max_retries: int = 3
     timeout: int = 30
 
@@ -48,6 +88,8 @@ class CrawlingConfig:
     output_dir: str = "./coupang_홈플래닛_data"
     csv_filename: str = "홈플래닛_products_{timestamp}.csv"
     json_filename: str = "홈플래닛_products_{timestamp}.json"
+    jsonl_filename: str = "홈플래닛_products_{timestamp}.jsonl"
+    pretty_json: bool = False  # 실행 종료 시 JSONL 을 들여쓰기 JSON 으로도 변환할지 여부
 
     # 로깅 설정
     log_level: str = "INFO"
@@ -69,28 +111,6 @@ class CrawlingConfig:
             ]
 
 
-@dataclass
-class ProductData:
-    """상품 데이터 구조"""
-    product_id: str
-    product_name: str
-    price: str
-    original_price: str
-    discount_rate: str
-    unit_price: str
-    rating: str
-    review_count: str
-    product_url: str
-    image_url: str
-    delivery_info: str
-    cashback_amount: str
-    is_rocket_delivery: bool
-    vendor_item_id: str
-    item_id: str
-    page_number: int
-    crawled_at: str
-
-
 # =================== 로깅 설정 ===================
 class LoggerManager:
     """로깅 관리 클래스"""
@@ -143,8 +163,11 @@ class SessionManager:
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
-        """세션 생성"""
+        """세션 생성 (브라우저 워커 스레드들이 공유하므로 워커 수만큼 연결 풀 유지)"""
         session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(10, self.config.browser_workers))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
 
         # 기본 헤더 설정
         session.headers.update({
@@ -161,14 +184,17 @@ class SessionManager:
 
     def get_with_retry(self, url: str, **kwargs) -> Optional[requests.Response]:
         """재시도 로직이 포함된 GET 요청"""
+        # 호출자 헤더(Referer 등)는 재시도마다 유지
+        extra_headers = kwargs.pop('headers', None) or {}
         for attempt in range(self.config.max_retries):
             try:
-                # User-Agent 로테이션
-                self.session.headers['User-Agent'] = random.choice(self.config.user_agents)
+                # User-Agent 로테이션 (공유 세션 헤더를 바꾸지 않고 요청 단위로 지정)
+                headers = {'User-Agent': random.choice(self.config.user_agents), **extra_headers}
 
                 response = self.session.get(
                     url,
                     timeout=self.config.timeout,
+                    headers=headers,
                     **kwargs
                 )
 
@@ -250,14 +276,11 @@ class SeleniumDriverManager:
 
             self.driver.get(full_url)
 
-            # 페이지 로딩 대기
+            # 페이지 로딩 대기 (상품 목록 로드 완료는 scroll_and_load_content 에서 판단)
             self.wait.until(
                 EC.presence_of_element_located((By.ID, "productList"))
             )
 
-            # 추가 로딩 대기
-            time.sleep(random.uniform(*self.config.delay_range))
-
             return True
 
         except TimeoutException:
@@ -268,27 +291,44 @@ class SeleniumDriverManager:
             return False
 
     def scroll_and_load_content(self) -> str:
-        """스크롤하여 모든 콘텐츠 로드"""
+        """스크롤하며 상품 목록이 안정될 때까지 대기 후 페이지 소스 반환
+
+        상품(li.baby-product)이 있고 DOM 변경·리소스 요청·문서 높이가 content_settle 초 동안 멈추면
+        로드 완료로 판단한다. 상품이 없는 페이지는 content_settle 의 3배 동안 변화가 없으면 종료하며,
+        어느 경우든 content_timeout 초를 넘기지 않는다.
+        """
         self.logger.info("페이지 스크롤 시작")
 
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        no_change_count = 0
+        started = time.monotonic()
+        deadline = started + self.config.content_timeout
+        settle_ms = self.config.content_settle * 1000
+        last_key = None
+        stable_since = started
 
-        while no_change_count < 3:
-            # 스크롤 다운
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        while True:
+            state = self.driver.execute_script(CONTENT_STATE_SCRIPT)
+            now = time.monotonic()
 
-            # 로딩 대기
-            time.sleep(random.uniform(2, 4))
+            key = (state['count'], state['resources'], state['height'])
+            if key != last_key:
+                last_key = key
+                stable_since = now
+            stable_ms = min((now - stable_since) * 1000, state['quiet_ms'])
 
-            # 새로운 높이 확인
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            if state['ready'] == 'complete':
+                if state['count'] > 0 and stable_ms >= settle_ms:
+                    break
+                if state['count'] == 0 and stable_ms >= settle_ms * 3:
+                    self.logger.warning("상품 목록이 비어 있습니다.")
+                    break
 
-            if new_height == last_height:
-                no_change_count += 1
-            else:
-                no_change_count = 0
-                last_height = new_height
+            if now >= deadline:
+                self.logger.warning(f"상품 목록 로드 대기 시간 초과 ({self.config.content_timeout:.0f}초), 현재 상태로 진행")
+                break
+
+            time.sleep(self.config.content_poll_interval)
+
+        self.logger.info(f"상품 목록 로드 완료: {state['count']}개 ({time.monotonic() - started:.1f}초)")
 
         # 최종 페이지 소스 반환
         return self.driver.page_source
@@ -325,6 +365,14 @@ class CoupangDataExtractor:
 
     def extract_products_from_html(self, html: str, page_number: int) -> List[ProductData]:
         """HTML에서 상품 데이터 추출"""
+        products, _ = self.extract_products_with_count(html, page_number)
+        return products
+
+    def extract_products_with_count(self, html: str, page_number: int) -> Tuple[List[ProductData], Optional[int]]:
+        """HTML에서 상품 데이터 추출 (상품 리스트, 추출 대상 상품 요소 수 - 상품 리스트가 없으면 None)
+
+        상품 링크가 없는 요소(광고, 자리표시자 등)는 원래 추출되지 않으므로 요소 수에서 제외한다.
+        """
         self.logger.info(f"페이지 {page_number} 데이터 추출 시작")
 
         soup = BeautifulSoup(html, 'html.parser')
@@ -333,21 +381,24 @@ class CoupangDataExtractor:
         product_list = soup.find('ul', id='productList')
         if not product_list:
             self.logger.warning("상품 리스트를 찾을 수 없습니다.")
-            return []
+            return [], None
 
         # 개별 상품 요소들
         product_elements = product_list.find_all('li', class_='baby-product')
         self.logger.info(f"페이지 {page_number}에서 {len(product_elements)}개 상품 발견")
 
         products = []
+        extractable = 0
         for i, element in enumerate(product_elements, 1):
+            if element.find('a', class_='baby-product-link'):
+                extractable += 1
             product_data = self._extract_single_product(element, page_number)
             if product_data:
                 products.append(product_data)
                 self.logger.debug(f"[{page_number}-{i:2d}] {product_data.product_name[:40]}...")
 
         self.logger.info(f"페이지 {page_number}에서 {len(products)}개 상품 추출 완료")
-        return products
+        return products, extractable
 
     def _extract_single_product(self, element: Tag, page_number: int) -> Optional[ProductData]:
         """개별 상품 데이터 추출"""
@@ -472,7 +523,18 @@ class CoupangDataExtractor:
 
 # =================== 데이터 저장 클래스 ===================
 class DataStorage:
-    """데이터 저장 관리"""
+    """데이터 저장 관리
+
+    실행 시작 시 open_run() 으로 CSV / JSONL 파일을 열고, 페이지마다 append_page() 로 추가 후 flush 한다.
+    중간에 중단되어도 그때까지 수집한 페이지는 남으며, 들여쓰기 JSON 은 finalize_json() 요청 시에만 생성한다.
+    """
+
+    CSV_HEADERS = [
+        '상품ID', '상품명', '현재가격', '정가', '할인율', '단위가격',
+        '평점', '리뷰수', '상품URL', '이미지URL', '배송정보',
+        '적립금', '로켓배송여부', '판매자상품ID', '아이템ID',
+        '페이지번호', '수집시간'
+    ]
 
     def __init__(self, config: CrawlingConfig, logger: logging.Logger):
         self.config = config
@@ -480,6 +542,88 @@ class DataStorage:
         self.output_dir = Path(config.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # 현재 실행의 증분 저장 파일
+        self.csv_path: Optional[Path] = None
+        self.jsonl_path: Optional[Path] = None
+        self._csv_file = None
+        self._csv_writer = None
+        self._jsonl_file = None
+        self._lock = threading.Lock()
+        self.saved_count = 0
+
+    @staticmethod
+    def _csv_row(product: ProductData) -> list:
+        return [
+            product.product_id, product.product_name, product.price,
+            product.original_price, product.discount_rate, product.unit_price,
+            product.rating, product.review_count, product.product_url,
+            product.image_url, product.delivery_info, product.cashback_amount,
+            product.is_rocket_delivery, product.vendor_item_id, product.item_id,
+            product.page_number, product.crawled_at
+        ]
+
+    def open_run(self) -> None:
+        """실행 시작: CSV(헤더 포함) / JSONL 파일 생성"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.csv_path = self.output_dir / self.config.csv_filename.format(timestamp=timestamp)
+        self.jsonl_path = self.output_dir / self.config.jsonl_filename.format(timestamp=timestamp)
+        self.saved_count = 0
+
+        self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(self.CSV_HEADERS)
+        self._csv_file.flush()
+        self._jsonl_file = open(self.jsonl_path, 'w', encoding='utf-8')
+
+        self.logger.info(f"증분 저장 시작: {self.csv_path}, {self.jsonl_path}")
+
+    def append_page(self, products: List[ProductData]) -> None:
+        """페이지 상품을 CSV / JSONL 에 추가하고 디스크로 flush"""
+        if not products:
+            return
+        with self._lock:
+            self._csv_writer.writerows(self._csv_row(product) for product in products)
+            self._jsonl_file.write(''.join(
+                json.dumps(product.to_dict(), ensure_ascii=False) + '\n' for product in products
+            ))
+            self._csv_file.flush()
+            self._jsonl_file.flush()
+            self.saved_count += len(products)
+
+    def close_run(self) -> None:
+        """실행 종료: 증분 저장 파일 닫기"""
+        with self._lock:
+            for f in (self._csv_file, self._jsonl_file):
+                if f:
+                    f.close()
+            self._csv_file = self._csv_writer = self._jsonl_file = None
+        if self.csv_path:
+            self.logger.info(f"CSV 저장 완료: {self.csv_path} ({self.saved_count}개 상품)")
+            self.logger.info(f"JSONL 저장 완료: {self.jsonl_path}")
+
+    def finalize_json(self) -> Optional[str]:
+        """JSONL 을 들여쓰기 JSON 배열로 변환 (한 줄씩 읽어 쓰므로 전체를 메모리에 올리지 않음)"""
+        if not self.jsonl_path or not self.jsonl_path.exists():
+            return None
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filepath = self.output_dir / self.config.json_filename.format(timestamp=timestamp)
+
+        with open(self.jsonl_path, 'r', encoding='utf-8') as src, \
+                open(filepath, 'w', encoding='utf-8') as jsonfile:
+            jsonfile.write('[')
+            first = True
+            for line in src:
+                if not line.strip():
+                    continue
+                record = json.dumps(json.loads(line), ensure_ascii=False, indent=2)
+                jsonfile.write(('\n' if first else ',\n') + '  ' + record.replace('\n', '\n  '))
+                first = False
+            jsonfile.write('\n]' if not first else ']')
+
+        self.logger.info(f"JSON 저장 완료: {filepath}")
+        return str(filepath)
+
     def save_to_csv(self, products: List[ProductData]) -> str:
         """CSV 저장"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -487,26 +631,11 @@ class DataStorage:
         filepath = self.output_dir / filename
 
         with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            headers = [
-                '상품ID', '상품명', '현재가격', '정가', '할인율', '단위가격',
-                '평점', '리뷰수', '상품URL', '이미지URL', '배송정보',
-                '적립금', '로켓배송여부', '판매자상품ID', '아이템ID',
-                '페이지번호', '수집시간'
-            ]
-
             writer = csv.writer(csvfile)
-            writer.writerow(headers)
+            writer.writerow(self.CSV_HEADERS)
 
             for product in products:
-                row = [
-                    product.product_id, product.product_name, product.price,
-                    product.original_price, product.discount_rate, product.unit_price,
-                    product.rating, product.review_count, product.product_url,
-                    product.image_url, product.delivery_info, product.cashback_amount,
-                    product.is_rocket_delivery, product.vendor_item_id, product.item_id,
-                    product.page_number, product.crawled_at
-                ]
-                writer.writerow(row)
+                writer.writerow(self._csv_row(product))
 
         self.logger.info(f"CSV 저장 완료: {filepath} ({len(products)}개 상품)")
         return str(filepath)
@@ -517,7 +646,7 @@ class DataStorage:
         filename = self.config.json_filename.format(timestamp=timestamp)
         filepath = self.output_dir / filename
 
-        products_dict = [asdict(product) for product in products]
+        products_dict = [product.to_dict() for product in products]
 
         with open(filepath, 'w', encoding='utf-8') as jsonfile:
             json.dump(products_dict, jsonfile, ensure_ascii=False, indent=2)
@@ -534,11 +663,14 @@ class Coupang홈플래닛Crawler:
         self.config = config or CrawlingConfig()
         self.logger = LoggerManager.setup_logger(self.config)
         self.session_manager = SessionManager(self.config, self.logger)
-        self.driver_manager = SeleniumDriverManager(self.config, self.logger)
         self.data_extractor = CoupangDataExtractor(self.config, self.logger)
         self.storage = DataStorage(self.config, self.logger)
 
-        self.all_products = []
+        self.page_counts: Dict[int, int] = {}  # 저장된 페이지별 상품 수 (상품 자체는 페이지마다 파일로 저장)
+        # 실행별 수집 경로 통계 (http: HTTP 로 수집한 페이지, browser: 브라우저로 수집한 페이지,
+        # fallback_*: HTTP 결과를 쓰지 못하고 브라우저로 대체한 사유별 횟수, failed: 실패한 페이지)
+        self.fetch_stats = Counter()
+        self._stats_lock = threading.Lock()
 
     def run_crawling(self) -> Dict[str, Any]:
         """크롤링 실행"""
@@ -548,42 +680,35 @@ class Coupang홈플래닛Crawler:
         start_time = datetime.now()
 
         try:
-            # Selenium 드라이버 설정
-            self.driver_manager.setup_driver()
-
-            # 페이지별 크롤링
-            for page in range(1, self.config.max_pages + 1):
-                self.logger.info(f"📄 페이지 {page}/{self.config.max_pages} 크롤링 시작")
-
-                success = self._crawl_single_page(page)
-                if not success:
-                    self.logger.warning(f"페이지 {page} 크롤링 실패, 건너뜀")
-                    continue
-
-                # 페이지 간 딜레이
-                if page < self.config.max_pages:
-                    delay = random.uniform(*self.config.delay_range)
-                    self.logger.info(f"⏳ {delay:.1f}초 대기 중...")
-                    time.sleep(delay)
+            # 워커 풀로 페이지 병렬 크롤링, 완료된 페이지는 페이지 순서대로 바로 파일에 추가
+            self.fetch_stats = Counter()
+            self.page_counts = {}
+            self.storage.open_run()
+            try:
+                self._crawl_pages_parallel()
+            finally:
+                self.storage.close_run()
+            self.logger.info(f"📡 수집 경로: {self.describe_fetch_stats()}")
 
-            # 데이터 저장
-            if self.all_products:
-                csv_path = self.storage.save_to_csv(self.all_products)
-                json_path = self.storage.save_to_json(self.all_products)
+            total_products = sum(self.page_counts.values())
+            if total_products:
+                json_path = self.storage.finalize_json() if self.config.pretty_json else None
 
                 execution_time = datetime.now() - start_time
 
                 result = {
                     'status': 'success',
-                    'total_products': len(self.all_products),
-                    'pages_crawled': self.config.max_pages,
-                    'csv_file': csv_path,
+                    'total_products': total_products,
+                    'pages_crawled': len(self.page_counts),
+                    'csv_file': str(self.storage.csv_path),
+                    'jsonl_file': str(self.storage.jsonl_path),
                     'json_file': json_path,
                     'execution_time': str(execution_time),
-                    'products_per_page': self._get_products_per_page_stats()
+                    'products_per_page': self._get_products_per_page_stats(),
+                    'fetch_stats': dict(self.fetch_stats)
                 }
 
-                self.logger.info(f"✅ 크롤링 완료! 총 {len(self.all_products)}개 상품 수집")
+                self.logger.info(f"✅ 크롤링 완료! 총 {total_products}개 상품 수집")
                 self.logger.info(f"⏱️  실행 시간: {execution_time}")
 
                 return result
@@ -599,42 +724,185 @@ class Coupang홈플래닛Crawler:
                 'status': 'error',
                 'message': str(e)
             }
-        finally:
-            self.driver_manager.close()
 
-    def _crawl_single_page(self, page: int) -> bool:
-        """단일 페이지 크롤링"""
+    def _crawl_pages_parallel(self) -> Dict[int, int]:
+        """페이지 대기열을 N개 워커가 나눠서 처리 (브라우저가 필요하면 워커마다 별도 드라이버)
+
+        완료된 페이지는 앞 페이지들이 모두 끝나는 대로 페이지 순서대로 저장하며(실패한 페이지는 건너뜀),
+        저장된 {페이지 번호: 상품 수} 를 반환한다.
+        """
+        pages = queue.Queue()
+        for page in range(1, self.config.max_pages + 1):
+            pages.put(page)
+
+        worker_count = max(1, min(self.config.browser_workers, self.config.max_pages))
+        self.logger.info(f"🧵 워커 {worker_count}개로 페이지 병렬 크롤링 "
+                         f"({'HTTP 우선, 필요 시 브라우저' if self.config.http_first else '브라우저'})")
+
+        finished: Dict[int, Optional[List[ProductData]]] = {}  # 앞 페이지를 기다리는 완료 페이지
+        next_page = 1
+        setup_errors: List[Exception] = []
+        lock = threading.Lock()
+
+        def commit(page: int, products: Optional[List[ProductData]]):
+            """완료된 페이지 등록 후 순서가 된 페이지들을 저장"""
+            nonlocal next_page
+            with lock:
+                finished[page] = products
+                while next_page in finished:
+                    ready = finished.pop(next_page)
+                    if ready is not None:
+                        self.storage.append_page(ready)
+                        self.page_counts[next_page] = len(ready)
+                    next_page += 1
+
+        def worker(slot: int):
+            # 워커별 시작 시점 분산 (모든 워커가 동시에 첫 요청을 보내지 않도록)
+            if slot > 0:
+                time.sleep(slot * random.uniform(*self.config.delay_range) / worker_count)
+
+            driver_manager = None
+            setup_error = None
+
+            def get_driver() -> SeleniumDriverManager:
+                """워커 전용 드라이버 (처음 필요할 때 시작, 시작 실패 시 이후 요청도 같은 오류)"""
+                nonlocal driver_manager, setup_error
+                if setup_error:
+                    raise setup_error
+                if driver_manager is None:
+                    try:
+                        manager = SeleniumDriverManager(self.config, self.logger)
+                        manager.setup_driver()
+                    except Exception as e:
+                        setup_error = e
+                        with lock:
+                            setup_errors.append(e)
+                        raise
+                    driver_manager = manager
+                return driver_manager
+
+            try:
+                while True:
+                    try:
+                        page = pages.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    self.logger.info(f"📄 [워커 {slot + 1}] 페이지 {page}/{self.config.max_pages} 크롤링 시작")
+                    products = self._crawl_single_page(page, get_driver)
+                    if products is None:
+                        self._count('failed')
+                        self.logger.warning(f"페이지 {page} 크롤링 실패, 건너뜀")
+                    commit(page, products)
+
+                    # 워커별 페이지 간 딜레이
+                    if not pages.empty():
+                        delay = random.uniform(*self.config.delay_range)
+                        self.logger.info(f"⏳ [워커 {slot + 1}] {delay:.1f}초 대기 중...")
+                        time.sleep(delay)
+            finally:
+                if driver_manager:
+                    driver_manager.close()
+
+        threads = [
+            threading.Thread(target=worker, args=(slot,), name=f"browser-worker-{slot + 1}", daemon=True)
+            for slot in range(worker_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 수집된 페이지가 없고 드라이버 시작이 실패했다면 그 오류로 처리
+        if setup_errors and not self.page_counts:
+            raise setup_errors[0]
+        if setup_errors:
+            self.logger.warning(f"브라우저 워커 {len(setup_errors)}개 시작 실패, 나머지 워커로 진행")
+
+        return self.page_counts
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.fetch_stats[key] += 1
+
+    def _fetch_via_http(self, page: int) -> Tuple[Optional[List[ProductData]], str]:
+        """HTTP 로 상품 목록 수집. (상품 리스트 또는 None, 브라우저 대체 사유)"""
+        response = self.session_manager.get_with_retry(
+            self.config.brand_url,
+            params={'brandName': self.config.brand_name, 'page': page},
+            headers={'Referer': self.config.base_url},
+        )
+        if response is None:
+            return None, 'http_error'
+
+        products, extractable = self.data_extractor.extract_products_with_count(response.text, page)
+        if extractable is None:
+            return None, 'no_list'
+        # 상품 링크가 있는 요소 중 일부만 추출되었거나 너무 적으면 불완전한 목록으로 판단
+        if len(products) < max(extractable, self.config.http_min_products):
+            return None, 'incomplete'
+        return products, ''
+
+    def _crawl_single_page(self, page: int, get_driver) -> Optional[List[ProductData]]:
+        """단일 페이지 크롤링: HTTP 우선, 상품 목록이 없거나 불완전하면 브라우저로 대체 (실패 시 None)"""
+        if self.config.http_first:
+            try:
+                products, reason = self._fetch_via_http(page)
+            except Exception as e:
+                products, reason = None, 'http_error'
+                self.logger.warning(f"페이지 {page} HTTP 수집 오류: {e}")
+
+            if products is not None:
+                self._count('http')
+                self.logger.info(f"✅ 페이지 {page} 완료 (HTTP): {len(products)}개 상품 추출")
+                return products
+
+            self._count('fallback')
+            self._count(f'fallback_{reason}')
+            self.logger.info(f"🔁 페이지 {page} 브라우저로 대체 (사유: {reason})")
+
         try:
+            driver_manager = get_driver()
+
             # 페이지 이동
-            success = self.driver_manager.navigate_to_page(
+            success = driver_manager.navigate_to_page(
                 self.config.brand_url, page
             )
             if not success:
-                return False
+                return None
 
             # 콘텐츠 로드
-            html_content = self.driver_manager.scroll_and_load_content()
+            html_content = driver_manager.scroll_and_load_content()
 
             # 데이터 추출
             products = self.data_extractor.extract_products_from_html(html_content, page)
 
-            # 결과 저장
-            self.all_products.extend(products)
-
+            self._count('browser')
             self.logger.info(f"✅ 페이지 {page} 완료: {len(products)}개 상품 추출")
-            return True
+            return products
 
         except Exception as e:
             self.logger.error(f"페이지 {page} 크롤링 오류: {e}")
-            return False
+            return None
+
+    def describe_fetch_stats(self) -> str:
+        """수집 경로 통계 요약"""
+        stats = self.fetch_stats
+        attempted = stats['http'] + stats['fallback'] if self.config.http_first else 0
+        reasons = ", ".join(
+            f"{key[len('fallback_'):]} {count}회" for key, count in sorted(stats.items())
+            if key.startswith('fallback_')
+        )
+        summary = f"HTTP {stats['http']}페이지 / 브라우저 {stats['browser']}페이지 / 실패 {stats['failed']}페이지"
+        if attempted:
+            summary += f" / 브라우저 대체 {stats['fallback']}회 ({stats['fallback'] / attempted:.0%})"
+        if reasons:
+            summary += f" [{reasons}]"
+        return summary
 
     def _get_products_per_page_stats(self) -> Dict[int, int]:
         """페이지별 상품 수 통계"""
-        stats = {}
-        for product in self.all_products:
-            page = product.page_number
-            stats[page] = stats.get(page, 0) + 1
-        return stats
+        return dict(sorted(self.page_counts.items()))
 
 
 # =================== 실행 함수 ===================
@@ -655,11 +923,13 @@ def main():
         max_pages=3,  # 테스트용으로 3페이지만
         headless=False,  # 브라우저 창 표시 (디버깅용)
         delay_range=(1.0, 1.1),
+        browser_workers=3,
+        pretty_json=True,  # 중복 제거(delete_dup.py) 입력용 JSON 배열도 생성
         log_level="INFO"
     )
 
     print(f"🎯 브랜드: {config.brand_name}")
-    print(f"📄 수집 페이지: {config.max_pages}개")
+    print(f"📄 수집 페이지: {config.max_pages}개 (브라우저 워커 {config.browser_workers}개)")
     print(f"💾 출력 폴더: {config.output_dir}")
     print("-" * 50)
 
@@ -673,8 +943,11 @@ def main():
         print("🎉 크롤링 성공!")
         print(f"📊 총 상품 수: {result['total_products']:,}개")
         print(f"📁 CSV 파일: {result['csv_file']}")
-        print(f"📁 JSON 파일: {result['json_file']}")
+        print(f"📁 JSONL 파일: {result['jsonl_file']}")
+        if result['json_file']:
+            print(f"📁 JSON 파일: {result['json_file']}")
         print(f"⏱️ 실행 시간: {result['execution_time']}")
+        print(f"📡 수집 경로: {crawler.describe_fetch_stats()}")
 
         print("\n📈 페이지별 상품 수:")
         for page, count in result['products_per_page'].items():
@@ -0,0 +1,113 @@
+import json
+from typing import Iterator, Optional
+
+JSONL_EXTENSIONS = ('.jsonl', '.ndjson')
+
+
+def iter_json_array(f, chunk_size: int = 1 << 16) -> Iterator:
+    """최상위 JSON 배열의 원소를 하나씩 읽어 반환 (파일 전체를 메모리에 올리지 않음)
+
+    chunk_size 단위로 읽으며 버퍼에는 아직 처리하지 않은 부분만 남긴다.
+    """
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    eof = False
+    started = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    while True:
+        # 공백 건너뛰기 (필요하면 다음 청크 읽기)
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            fill()
+
+        if pos >= len(buf):
+            raise ValueError("JSON 배열이 닫히지 않았습니다 (파일이 잘렸을 수 있음)")
+
+        ch = buf[pos]
+        if not started:
+            if ch != '[':
+                raise ValueError("최상위 값이 JSON 배열이 아닙니다")
+            started = True
+            pos += 1
+            continue
+        if ch == ']':
+            return
+        if ch == ',':
+            pos += 1
+            continue
+
+        # 원소 하나가 버퍼에 모두 들어올 때까지 읽은 뒤 디코딩
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            if not eof and (end == len(buf) or (
+                    isinstance(value, (int, float)) and buf[end] not in ' \t\r\n,]')):
+                # 숫자는 청크 경계에서 잘려도("12" + "3.5e2") 디코딩되므로 구분자가 보일 때까지 더 읽음
+                fill()
+                continue
+            break
+
+        pos = end
+        yield value
+
+
+def is_jsonl(file_path: str) -> bool:
+    """확장자(.jsonl/.ndjson) 또는 첫 문자로 JSONL 여부 판단"""
+    if file_path.lower().endswith(JSONL_EXTENSIONS):
+        return True
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                return False
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[0] == '{'
+
+
+def iter_json_records(file_path: str) -> Iterator:
+    """JSON 배열 또는 JSONL 파일의 레코드를 순서대로 스트리밍
+
+    JSONL 의 잘못된 줄은 경고 후 건너뛰고, JSON 배열의 문법 오류는 예외로 전달한다.
+    """
+    if is_jsonl(file_path):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"[WARNING] JSONL 파싱 오류 (라인 {line_num}): {e}")
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield from iter_json_array(f)
+
+
+def count_jsonl_records(file_path: str) -> Optional[int]:
+    """JSONL 파일의 비어 있지 않은 줄 수 (JSON 배열이면 None - 끝까지 읽어야 알 수 있음)
+
+    디코딩 없이 바이트 단위로 줄만 세므로 파싱보다 훨씬 빠르고 메모리를 쓰지 않는다.
+    """
+    if not is_jsonl(file_path):
+        return None
+    with open(file_path, 'rb') as f:
+        return sum(1 for line in f if line.strip())
@@ -0,0 +1,215 @@
+"""
+프록시 헬스 체크 (비동기 동시 검사)
+
+- 동시 검사 수를 제한한 asyncio 스윕으로 프록시별 응답 시간 측정
+- 결과는 JSON 파일에 저장하여 max_age 이내의 결과는 다음 실행에서 재사용
+- 임의의 URL 을 대상으로 검사 가능 (기본: httpbin.org/ip)
+
+오프라인 확인: python proxy_health.py --offline [프록시 수]
+  로컬 대체 서버(LocalTargetServer)를 띄워 가짜 프록시 목록으로 스윕을 실행
+"""
+
+import asyncio
+import random
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from crawl_state import atomic_write_json, load_json
+
+DEFAULT_TARGET_URL = "http://httpbin.org/ip"
+
+
+@dataclass
+class ProxyCheck:
+    """프록시 1개의 검사 결과"""
+    proxy: str
+    ok: bool
+    latency: float = 0.0  # 초 (실패 시 소요 시간)
+    status: int = 0
+    error: str = ""
+    checked_at: float = 0.0
+
+
+def proxy_url(proxy: str) -> Optional[str]:
+    """ip:port[:username:password] -> aiohttp proxy URL"""
+    parts = proxy.split(':')
+    if len(parts) == 2:
+        ip, port = parts
+        return f'http://{ip}:{port}'
+    elif len(parts) == 4:
+        ip, port, username, password = parts
+        return f'http://{username}:{password}@{ip}:{port}'
+    return None
+
+
+async def check_proxy(session: aiohttp.ClientSession, proxy: str,
+                      target_url: str = DEFAULT_TARGET_URL, timeout: float = 10.0) -> ProxyCheck:
+    """프록시를 통해 target_url 요청 후 응답 시간 측정"""
+    start_time = time.perf_counter()
+    try:
+        async with session.get(target_url, proxy=proxy_url(proxy),
+                               timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            await response.read()
+            latency = time.perf_counter() - start_time
+            return ProxyCheck(proxy, response.status == 200, latency, response.status,
+                              checked_at=time.time())
+    except asyncio.TimeoutError:
+        error = "timeout"
+    except (aiohttp.ClientError, OSError, ValueError) as e:
+        error = type(e).__name__
+    return ProxyCheck(proxy, False, time.perf_counter() - start_time, error=error, checked_at=time.time())
+
+
+async def sweep(proxies: List[str], target_url: str = DEFAULT_TARGET_URL,
+                concurrency: int = 100, timeout: float = 10.0,
+                progress_every: int = 500) -> Dict[str, ProxyCheck]:
+    """동시 검사 수를 제한하여 전체 프록시 검사"""
+    results = {}
+    if not proxies:
+        return results
+
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, ssl=False)
+    started = time.perf_counter()
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def run(proxy: str):
+            async with semaphore:
+                result = await check_proxy(session, proxy, target_url, timeout)
+            results[proxy] = result
+
+            done = len(results)
+            if done % progress_every == 0 or done == len(proxies):
+                ok_count = sum(1 for r in results.values() if r.ok)
+                print(f"[TEST] {done}/{len(proxies)} 검사 완료 (성공 {ok_count}개, "
+                      f"{time.perf_counter() - started:.1f}초)")
+
+        await asyncio.gather(*(run(proxy) for proxy in proxies))
+
+    return results
+
+
+class ProxyHealthStore:
+    """헬스 체크 결과 저장소 (JSON 파일, 원자적 교체 저장)"""
+
+    def __init__(self, path: str = "proxy_health.json") -> None:
+        self.path = path
+        self.results: Dict[str, dict] = load_json(path, {}, "프록시 헬스 체크 결과")
+
+    def fresh(self, proxies: List[str], target_url: str, max_age: float) -> Dict[str, ProxyCheck]:
+        """target_url 대상으로 max_age 초 이내에 검사된 결과"""
+        now = time.time()
+        fresh = {}
+        for proxy in proxies:
+            entry = self.results.get(proxy)
+            if entry and entry.get("target_url") == target_url and now - entry.get("checked_at", 0) < max_age:
+                fresh[proxy] = ProxyCheck(**{k: v for k, v in entry.items() if k != "target_url"})
+        return fresh
+
+    def update(self, results: Dict[str, ProxyCheck], target_url: str) -> None:
+        for proxy, result in results.items():
+            self.results[proxy] = {**asdict(result), "target_url": target_url}
+        atomic_write_json(self.path, self.results)
+
+
+def run_health_check(proxies: List[str], target_url: str = DEFAULT_TARGET_URL,
+                     concurrency: int = 100, timeout: float = 10.0,
+                     store_path: Optional[str] = "proxy_health.json",
+                     max_age: float = 6 * 3600) -> Tuple[List[str], Dict[str, ProxyCheck]]:
+    """프록시 헬스 체크 실행 (최근 결과는 재사용)
+
+    Returns:
+        (응답 시간 순으로 정렬된 정상 프록시 리스트, 프록시별 검사 결과)
+    """
+    store = ProxyHealthStore(store_path) if store_path else None
+    results = store.fresh(proxies, target_url, max_age) if store else {}
+    pending = [proxy for proxy in proxies if proxy not in results]
+
+    if results:
+        print(f"[INFO] 최근 {max_age / 3600:.0f}시간 이내 검사 결과 {len(results)}개 재사용")
+    if pending:
+        print(f"[INFO] {len(pending)}개 프록시 검사 시작 (동시 {concurrency}개, 타임아웃 {timeout:.0f}초, 대상 {target_url})")
+        checked = asyncio.run(sweep(pending, target_url, concurrency, timeout))
+        if store:
+            store.update(checked, target_url)
+        results.update(checked)
+
+    working = sorted((r for r in results.values() if r.ok), key=lambda r: r.latency)
+    if working:
+        latencies = [r.latency for r in working]
+        print(f"[INFO] 정상 프록시 {len(working)}/{len(proxies)}개, "
+              f"응답 시간 중앙값 {latencies[len(latencies) // 2] * 1000:.0f}ms")
+    return [r.proxy for r in working], results
+
+
+class LocalTargetServer:
+    """오프라인 검사용 로컬 대체 서버
+
+    모든 경로(프록시 형식의 절대 URL 요청 포함)에 200 으로 응답하므로,
+    127.0.0.1:<port> 를 프록시로 지정하면 대상 서버 겸 프록시 역할을 한다.
+    delay_range 로 응답 지연을, fail_rate 로 5xx 응답 비율을 흉내낸다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 delay_range: Tuple[float, float] = (0.0, 0.0), fail_rate: float = 0.0) -> None:
+        self.host = host
+        self.port = port
+        self.delay_range = delay_range
+        self.fail_rate = fail_rate
+        self.runner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if self.delay_range[1] > 0:
+            await asyncio.sleep(random.uniform(*self.delay_range))
+        if self.fail_rate and random.random() < self.fail_rate:
+            return web.Response(status=503, text="unavailable")
+        return web.json_response({"origin": request.remote})
+
+    async def start(self) -> str:
+        """서버 시작 후 기본 URL 반환"""
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return f"http://{self.host}:{self.port}"
+
+    async def stop(self) -> None:
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+
+async def _offline_demo(count: int) -> None:
+    server = LocalTargetServer(delay_range=(0.01, 0.2), fail_rate=0.1)
+    base_url = await server.start()
+    try:
+        # 절반은 로컬 서버(정상), 나머지 일부는 닫힌 포트(연결 실패)
+        proxies = [f"127.0.0.1:{server.port}:user{i}:pass" for i in range(count)]
+        proxies += [f"127.0.0.1:9:user{i}:pass" for i in range(count // 10)]
+        started = time.perf_counter()
+        results = await sweep(proxies, target_url=f"{base_url}/ip", concurrency=50, timeout=2.0)
+        elapsed = time.perf_counter() - started
+    finally:
+        await server.stop()
+
+    ok = [r for r in results.values() if r.ok]
+    print("=" * 50)
+    print(f"검사 프록시: {len(proxies)}개 / 정상: {len(ok)}개 / 소요: {elapsed:.2f}초")
+    if ok:
+        print(f"평균 응답 시간: {sum(r.latency for r in ok) / len(ok) * 1000:.0f}ms")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--offline":
+        asyncio.run(_offline_demo(int(sys.argv[2]) if len(sys.argv) > 2 else 200))
+    else:
+        print("사용법: python proxy_health.py --offline [프록시 수]")
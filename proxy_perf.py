@@ -0,0 +1,227 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+DEFAULT_DB_PATH = "proxy_perf.db"
+
+
+@dataclass
+class ProxyRecord:
+    """프록시 1개의 누적 성능 기록 (success/failure 는 시간 감쇠된 가중 횟수)"""
+    success: float = 0.0
+    failure: float = 0.0
+    latency: float = 0.0  # 응답 시간 EWMA (초, 0 이면 측정 기록 없음)
+    last_failure: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        total = self.success + self.failure
+        return self.success / total if total > 0 else 0.5
+
+    @property
+    def score(self) -> float:
+        """성능 점수 (optm.ProxyStats.performance_score 와 같은 기준)"""
+        if self.latency == 0:
+            return self.success_rate
+        time_score = min(1.0, 3.0 / max(self.latency, 0.1))
+        return (self.success_rate * 0.7) + (time_score * 0.3)
+
+
+class ProxyPerfStore:
+    """프록시 성능 기록 저장소 (SQLite)
+
+    - 프록시별 성공/실패 횟수, 응답 시간 EWMA, 마지막 실패 시각을 저장
+    - 횟수는 half_life 마다 절반으로 감쇠하여 오래된 기록일수록 영향이 작아짐
+    - 갱신은 메모리에 모았다가 flush_every 건 / flush_interval 초마다 한 트랜잭션으로 반영
+      (파일을 공유하는 다른 크롤러의 기록과 합쳐지도록 저장 시점에 DB 값을 다시 읽어 합산)
+    - auto_flush=False 면 record_* 에서 저장하지 않음: 호출자가 flush_due() 를 보고 다른 스레드에서 flush()
+      (이벤트 루프에서 기록하는 비동기 크롤러용)
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, half_life: float = 24 * 3600,
+                 latency_alpha: float = 0.3, flush_every: int = 50, flush_interval: float = 30.0,
+                 auto_flush: bool = True) -> None:
+        self.path = path
+        self.half_life = half_life
+        self.latency_alpha = latency_alpha
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.auto_flush = auto_flush
+
+        self.records: Dict[str, ProxyRecord] = {}
+        # 아직 저장하지 않은 변경분: {프록시: [성공 수, 실패 수, 마지막 응답 시간 EWMA, 마지막 실패 시각]}
+        self._pending: Dict[str, list] = {}
+        self._pending_count = 0
+        self._last_flush = time.time()
+        self._lock = threading.Lock()  # records / _pending 보호 (DB 저장 중에는 잡지 않음)
+        self._flush_lock = threading.Lock()  # DB 저장 직렬화
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS proxy_perf ("
+            " proxy TEXT PRIMARY KEY,"
+            " success REAL NOT NULL DEFAULT 0,"
+            " failure REAL NOT NULL DEFAULT 0,"
+            " latency REAL NOT NULL DEFAULT 0,"
+            " last_failure REAL NOT NULL DEFAULT 0,"
+            " updated_at REAL NOT NULL DEFAULT 0)"
+        )
+
+    def _decay(self, record: ProxyRecord, now: float) -> ProxyRecord:
+        """updated_at 이후 경과 시간만큼 횟수 감쇠"""
+        if record.updated_at and self.half_life > 0 and now > record.updated_at:
+            factor = 0.5 ** ((now - record.updated_at) / self.half_life)
+            record.success *= factor
+            record.failure *= factor
+        record.updated_at = now
+        return record
+
+    def load(self, proxies: Optional[Iterable[str]] = None) -> Dict[str, ProxyRecord]:
+        """저장된 기록을 현재 시각 기준으로 감쇠하여 로드 (proxies 지정 시 해당 프록시만)"""
+        now = time.time()
+        wanted = set(proxies) if proxies is not None else None
+        rows = self.conn.execute(
+            "SELECT proxy, success, failure, latency, last_failure, updated_at FROM proxy_perf").fetchall()
+
+        with self._lock:
+            for proxy, success, failure, latency, last_failure, updated_at in rows:
+                if wanted is not None and proxy not in wanted:
+                    continue
+                self.records[proxy] = self._decay(
+                    ProxyRecord(success, failure, latency, last_failure, updated_at), now)
+        return self.records
+
+    def get(self, proxy: str) -> Optional[ProxyRecord]:
+        return self.records.get(proxy)
+
+    def score(self, proxy: str, default: float = 0.5) -> float:
+        record = self.records.get(proxy)
+        return record.score if record else default
+
+    def seed_health(self, results) -> int:
+        """헬스 체크 결과(proxy_health.ProxyCheck)를 불러온 기록에 성공/실패 1회로 합산
+
+        검사 대상이 실제 크롤링 대상과 다르므로 메모리에만 반영하고 DB 에는 저장하지 않는다.
+        반영한 프록시 수 반환
+        """
+        now = time.time()
+        with self._lock:
+            for proxy, result in results.items():
+                record = self.records.setdefault(proxy, ProxyRecord(updated_at=now))
+                if result.ok:
+                    record.success += 1
+                    if result.latency > 0:
+                        if record.latency:
+                            record.latency += self.latency_alpha * (result.latency - record.latency)
+                        else:
+                            record.latency = result.latency
+                else:
+                    record.failure += 1
+        return len(results)
+
+    def record_success(self, proxy: str, latency: Optional[float] = None) -> None:
+        with self._lock:
+            record = self.records.setdefault(proxy, ProxyRecord(updated_at=time.time()))
+            record.success += 1
+            if latency is not None and latency > 0:
+                if record.latency:
+                    record.latency += self.latency_alpha * (latency - record.latency)
+                else:
+                    record.latency = latency
+            pending = self._pending.setdefault(proxy, [0.0, 0.0, 0.0, 0.0])
+            pending[0] += 1
+            pending[2] = record.latency
+            self._pending_count += 1
+        self._maybe_flush()
+
+    def record_failure(self, proxy: str) -> None:
+        now = time.time()
+        with self._lock:
+            record = self.records.setdefault(proxy, ProxyRecord(updated_at=now))
+            record.failure += 1
+            record.last_failure = now
+            pending = self._pending.setdefault(proxy, [0.0, 0.0, 0.0, 0.0])
+            pending[1] += 1
+            pending[3] = now
+            self._pending_count += 1
+        self._maybe_flush()
+
+    def flush_due(self) -> bool:
+        """저장할 시점인지 (변경분 flush_every 건 이상 또는 마지막 저장 후 flush_interval 초 경과)"""
+        return bool(self._pending) and (self._pending_count >= self.flush_every
+                                        or time.time() - self._last_flush >= self.flush_interval)
+
+    def _maybe_flush(self) -> None:
+        if self.auto_flush and self.flush_due():
+            self.flush()
+
+    def _restore_pending(self, pending: Dict[str, list]) -> None:
+        """저장에 실패한 변경분을 다음 저장 대상으로 되돌림 (그 사이 쌓인 변경분과 합산)"""
+        with self._lock:
+            for proxy, (success, failure, latency, last_failure) in pending.items():
+                current = self._pending.get(proxy)
+                if current is None:
+                    self._pending[proxy] = [success, failure, latency, last_failure]
+                else:
+                    current[0] += success
+                    current[1] += failure
+                    current[2] = current[2] or latency  # 더 최근 EWMA 우선
+                    current[3] = max(current[3], last_failure)
+                self._pending_count += int(success + failure)
+
+    def flush(self) -> int:
+        """메모리의 변경분을 DB 에 합산 저장. 저장한 프록시 수 반환 (실패 시 변경분은 다음 저장으로 이월)"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._pending_count = 0
+                self._last_flush = time.time()
+            if not pending:
+                return 0
+
+            now = time.time()
+            try:
+                # BEGIN IMMEDIATE 로 쓰기 잠금을 먼저 잡아 다른 프로세스의 갱신과 섞이지 않게 함
+                self.conn.execute("BEGIN IMMEDIATE")
+                rows = []
+                for proxy, (success, failure, latency, last_failure) in pending.items():
+                    row = self.conn.execute(
+                        "SELECT success, failure, latency, last_failure, updated_at FROM proxy_perf WHERE proxy = ?",
+                        (proxy,)).fetchone()
+                    record = self._decay(ProxyRecord(*row), now) if row else ProxyRecord(updated_at=now)
+                    record.success += success
+                    record.failure += failure
+                    if latency:
+                        record.latency = latency
+                    record.last_failure = max(record.last_failure, last_failure)
+                    rows.append((proxy, record.success, record.failure, record.latency,
+                                 record.last_failure, record.updated_at))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO proxy_perf "
+                    "(proxy, success, failure, latency, last_failure, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows)
+                self.conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                if self.conn.in_transaction:
+                    self.conn.execute("ROLLBACK")
+                self._restore_pending(pending)
+                print(f"[WARNING] 프록시 성능 기록 저장 실패 (다음 저장 시 재시도): {e}")
+                return 0
+        return len(pending)
+
+    def describe(self) -> str:
+        measured = [r for r in self.records.values() if r.success + r.failure > 0]
+        fast = sum(1 for r in measured if r.latency and r.success_rate >= 0.7)
+        return f"기록 {len(measured)}개 (성공률 70% 이상 {fast}개)"
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
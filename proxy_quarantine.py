@@ -0,0 +1,80 @@
+import heapq
+import random
+import time
+from typing import Dict, List, Optional
+
+
+class ProxyQuarantine:
+    """프록시 격리 관리 (지수 증가 쿨다운 + 해제 시각 순 힙)
+
+    - 격리될 때마다 쿨다운이 base_cooldown * factor^(누적 격리 횟수 - 1) 로 늘어남 (max_cooldown 이내)
+    - 해제 시각 순서의 힙에서 만료된 프록시만 꺼내므로 전체 목록을 훑거나 일괄 초기화하지 않음
+    - 해제된 프록시의 누적 격리 횟수는 유지되어 다시 실패하면 더 오래 격리되고,
+      성공할 때마다 1씩 줄어듦
+    """
+
+    def __init__(self, base_cooldown: float = 60.0, max_cooldown: float = 3600.0,
+                 factor: float = 2.0, jitter: float = 0.1) -> None:
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.factor = factor
+        self.jitter = jitter  # 같은 시각에 격리된 프록시들이 한꺼번에 풀리지 않도록 분산
+
+        self.release_at: Dict[str, float] = {}  # 격리 중인 프록시 -> 해제 시각
+        self.strikes: Dict[str, int] = {}  # 프록시별 누적 격리 횟수
+        self._heap = []  # (해제 시각, 프록시) - release_at 과 다른 항목은 무시
+
+    def __len__(self) -> int:
+        return len(self.release_at)
+
+    def __contains__(self, proxy: str) -> bool:
+        return proxy in self.release_at
+
+    def cooldown_for(self, strikes: int) -> float:
+        cooldown = min(self.base_cooldown * self.factor ** max(0, strikes - 1), self.max_cooldown)
+        if self.jitter:
+            cooldown *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return cooldown
+
+    def quarantine(self, proxy: str, now: Optional[float] = None) -> float:
+        """프록시 격리. 적용된 쿨다운(초) 반환"""
+        now = time.time() if now is None else now
+        strikes = self.strikes.get(proxy, 0) + 1
+        self.strikes[proxy] = strikes
+
+        cooldown = self.cooldown_for(strikes)
+        release_at = now + cooldown
+        self.release_at[proxy] = release_at
+        heapq.heappush(self._heap, (release_at, proxy))
+        return cooldown
+
+    def release_expired(self, now: Optional[float] = None) -> List[str]:
+        """쿨다운이 끝난 프록시를 격리 해제하여 반환 (O(k log n), k = 해제 수)"""
+        now = time.time() if now is None else now
+        released = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            release_at, proxy = heapq.heappop(heap)
+            if self.release_at.get(proxy) == release_at:
+                del self.release_at[proxy]
+                released.append(proxy)
+        return released
+
+    def next_release_in(self, now: Optional[float] = None) -> Optional[float]:
+        """가장 빨리 해제될 프록시까지 남은 시간 (격리 중인 프록시가 없으면 None)"""
+        now = time.time() if now is None else now
+        heap = self._heap
+        while heap and self.release_at.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - now)
+
+    def forgive(self, proxy: str) -> None:
+        """요청 성공 시 누적 격리 횟수 감소"""
+        strikes = self.strikes.get(proxy)
+        if strikes:
+            if strikes > 1:
+                self.strikes[proxy] = strikes - 1
+            else:
+                del self.strikes[proxy]
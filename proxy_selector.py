@@ -0,0 +1,111 @@
+import random
+from typing import Dict, List, Optional
+
+
+class FenwickTree:
+    """누적합 트리 (갱신/누적합/누적합 기준 탐색 모두 O(log n))"""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.tree = [0.0] * (size + 1)
+        self.top_bit = 1 << (size.bit_length() - 1) if size else 0
+
+    def build(self, values: List[float]) -> None:
+        """values 로 트리 전체를 O(n) 재구성"""
+        tree = [0.0] + list(values)
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def add(self, index: int, delta: float) -> None:
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, target: float) -> int:
+        """누적합이 target 을 처음 넘는 위치 (0-based, 범위를 벗어나면 size)"""
+        pos = 0
+        step = self.top_bit
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+
+class ProxySelector:
+    """성능 점수 가중치 기반 프록시 선택기
+
+    - 프록시별 가중치(사용 불가면 0)를 Fenwick 트리에 유지: 가중치 변경/선택 모두 O(log P)
+    - 사용 가능한 프록시 수도 별도 트리로 관리하여, 가중치 합이 0 이면 균등 선택
+    - 부동소수 누적 오차를 막기 위해 갱신이 일정 횟수 쌓이면 O(P) 로 재구성
+    """
+
+    def __init__(self, proxies: List[str]) -> None:
+        self.proxies = list(proxies)
+        self.index: Dict[str, int] = {proxy: i for i, proxy in enumerate(self.proxies)}
+        size = len(self.proxies)
+
+        self.weights = [0.0] * size
+        self.available = [0] * size
+        self.weight_tree = FenwickTree(size)
+        self.count_tree = FenwickTree(size)
+        self.total_weight = 0.0
+        self.available_count = 0
+
+        self._updates = 0
+        self._rebuild_every = max(1024, size * 4)
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def update(self, proxy: str, weight: float, available: bool) -> None:
+        """프록시의 선택 가중치/사용 가능 여부 갱신"""
+        i = self.index.get(proxy)
+        if i is None:
+            return
+
+        weight = max(0.0, float(weight)) if available else 0.0
+        delta = weight - self.weights[i]
+        if delta:
+            self.weights[i] = weight
+            self.weight_tree.add(i, delta)
+            self.total_weight += delta
+
+        flag = 1 if available else 0
+        if flag != self.available[i]:
+            self.available[i] = flag
+            self.count_tree.add(i, flag - (1 - flag))
+            self.available_count += flag - (1 - flag)
+
+        self._updates += 1
+        if self._updates >= self._rebuild_every:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """누적 오차 제거를 위한 전체 재구성"""
+        self.weight_tree.build(self.weights)
+        self.count_tree.build(self.available)
+        self.total_weight = sum(self.weights)
+        self.available_count = sum(self.available)
+        self._updates = 0
+
+    def pick(self, rng=random) -> Optional[str]:
+        """가중치 비례 랜덤 선택 (가중치 합이 0 이면 사용 가능한 프록시 중 균등 선택)"""
+        if self.available_count <= 0:
+            return None
+
+        if self.total_weight > 1e-9:
+            i = self.weight_tree.find(rng.random() * self.total_weight)
+            if i < len(self.proxies) and self.weights[i] > 0:
+                return self.proxies[i]
+
+        i = self.count_tree.find(rng.randrange(self.available_count))
+        if i < len(self.proxies) and self.available[i]:
+            return self.proxies[i]
+        return None
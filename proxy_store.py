@@ -0,0 +1,166 @@
+import os
+import re
+import struct
+from array import array
+
+# ip:port:username:password (username/password 에는 ':' 불가)
+PROXY_LINE_RE = re.compile(r"(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3}):(\d{1,5}):([^:]*):([^:]*)")
+
+CACHE_SUFFIX = ".cache"
+CACHE_MAGIC = b"PXC1"
+# mtime_ns, size, 프록시 수, 인증정보 수, 인증정보 blob 길이, 잘못된 라인 수
+CACHE_HEADER = struct.Struct("<qqIIII")
+
+
+class ProxyStore:
+    """프록시 목록 압축 저장소
+
+    - IPv4 는 32bit 정수, 포트는 16bit 정수 배열로 저장
+    - username:password 는 중복 제거 후 인덱스로 참조 (대부분의 프록시가 같은 계정을 공유)
+    - 텍스트 파일 옆에 mtime/크기 기준 바이너리 캐시를 두어 재시작 시 파싱 생략
+    """
+
+    def __init__(self) -> None:
+        self.ips = array("I")
+        self.ports = array("H")
+        self.cred_index = array("I")
+        self.credentials = []  # "username:password"
+        self.invalid_count = 0
+        self.from_cache = False
+
+    def __len__(self) -> int:
+        return len(self.ips)
+
+    @staticmethod
+    def format_ip(ip: int) -> str:
+        return f"{ip >> 24}.{(ip >> 16) & 255}.{(ip >> 8) & 255}.{ip & 255}"
+
+    def __getitem__(self, i: int) -> str:
+        return f"{self.format_ip(self.ips[i])}:{self.ports[i]}:{self.credentials[self.cred_index[i]]}"
+
+    def __iter__(self):
+        credentials = self.credentials
+        format_ip = self.format_ip
+        for ip, port, cred in zip(self.ips, self.ports, self.cred_index):
+            yield f"{format_ip(ip)}:{port}:{credentials[cred]}"
+
+    def to_list(self) -> list:
+        """기존 코드와 호환되는 "ip:port:username:password" 문자열 리스트"""
+        return list(self)
+
+    @classmethod
+    def parse(cls, text: str, max_samples: int = 5):
+        """텍스트 파싱. (저장소, 잘못된 라인 예시 [(라인 번호, 내용)]) 반환"""
+        store = cls()
+        cred_ids = {}
+        samples = []
+        ips_append = store.ips.append
+        ports_append = store.ports.append
+        cred_append = store.cred_index.append
+        match = PROXY_LINE_RE.fullmatch
+
+        for line_num, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            # 빈 줄이나 주석(#으로 시작) 건너뛰기
+            if not line or line[0] == '#':
+                continue
+
+            m = match(line)
+            if m:
+                a, b, c, d, port = (int(x) for x in m.group(1, 2, 3, 4, 5))
+                if a <= 255 and b <= 255 and c <= 255 and d <= 255 and 1 <= port <= 65535:
+                    cred = line[m.end(5) + 1:]
+                    cred_id = cred_ids.get(cred)
+                    if cred_id is None:
+                        cred_id = cred_ids[cred] = len(store.credentials)
+                        store.credentials.append(cred)
+                    ips_append((a << 24) | (b << 16) | (c << 8) | d)
+                    ports_append(port)
+                    cred_append(cred_id)
+                    continue
+
+            store.invalid_count += 1
+            if len(samples) < max_samples:
+                samples.append((line_num, line))
+
+        return store, samples
+
+    @staticmethod
+    def cache_path(file_path: str) -> str:
+        return file_path + CACHE_SUFFIX
+
+    @classmethod
+    def read_cache(cls, file_path: str):
+        """mtime/크기가 일치하는 캐시가 있으면 저장소 반환 (없거나 손상되면 None)"""
+        cache_path = cls.cache_path(file_path)
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            stat = os.stat(file_path)
+            with open(cache_path, 'rb') as f:
+                if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                    return None
+                mtime_ns, size, count, cred_count, cred_len, invalid_count = \
+                    CACHE_HEADER.unpack(f.read(CACHE_HEADER.size))
+                if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+                    return None
+
+                store = cls()
+                store.ips.fromfile(f, count)
+                store.ports.fromfile(f, count)
+                store.cred_index.fromfile(f, count)
+                blob = f.read(cred_len)
+        except (OSError, EOFError, struct.error):
+            return None
+
+        store.credentials = blob.decode('utf-8').split('\n') if cred_count else []
+        if len(store.credentials) != cred_count:
+            return None
+        store.invalid_count = invalid_count
+        store.from_cache = True
+        return store
+
+    def write_cache(self, file_path: str) -> None:
+        """캐시 파일 저장 (임시 파일 기록 후 교체)"""
+        stat = os.stat(file_path)
+        blob = '\n'.join(self.credentials).encode('utf-8')
+        cache_path = self.cache_path(file_path)
+        tmp_path = cache_path + ".tmp"
+
+        with open(tmp_path, 'wb') as f:
+            f.write(CACHE_MAGIC)
+            f.write(CACHE_HEADER.pack(stat.st_mtime_ns, stat.st_size, len(self),
+                                      len(self.credentials), len(blob), self.invalid_count))
+            self.ips.tofile(f)
+            self.ports.tofile(f)
+            self.cred_index.tofile(f)
+            f.write(blob)
+        os.replace(tmp_path, cache_path)
+
+    @classmethod
+    def load(cls, file_path: str, use_cache: bool = True):
+        """프록시 파일 로드 (캐시 우선, 잘못된 라인은 요약해서 출력)"""
+        if use_cache:
+            store = cls.read_cache(file_path)
+            if store is not None:
+                print(f"[INFO] 프록시 캐시 사용: {cls.cache_path(file_path)}")
+                if store.invalid_count:
+                    print(f"[WARNING] 잘못된 형식의 라인 {store.invalid_count}개는 제외되었습니다.")
+                return store
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            store, samples = cls.parse(f.read())
+
+        if store.invalid_count:
+            print(f"[WARNING] 잘못된 형식의 라인 {store.invalid_count}개를 제외했습니다. "
+                  f"(올바른 형식: ip:port:username:password)")
+            for line_num, line in samples:
+                print(f"         라인 {line_num}: {line}")
+
+        if use_cache:
+            try:
+                store.write_cache(file_path)
+            except OSError as e:
+                print(f"[WARNING] 프록시 캐시 저장 실패: {e}")
+        return store
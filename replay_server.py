@@ -0,0 +1,154 @@
+"""
+리뷰 API 오프라인 재생 서버
+캡처한 리뷰 페이지(html.txt 등)를 /vp/product/reviews 로 재생하여 실제 사이트 없이 크롤러를 실행/측정
+
+- latency: 응답 지연 범위 (초)
+- error_rate: 503 응답 비율
+- block_rate: 403 (차단 페이지) 응답 비율
+- review_count: 상품당 리뷰 수 (페이지의 전체 리뷰 수 값을 덮어쓰고, 이후 페이지는 빈 페이지로 응답)
+
+사용법: python replay_server.py [포트] [html 파일 ...]
+        크롤러의 base_review_url 을 http://127.0.0.1:<포트>/vp/product/reviews 로 지정
+"""
+
+import asyncio
+import multiprocessing
+import random
+import re
+import sys
+import time
+from collections import Counter
+from typing import Dict, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+REVIEW_PATH = "/vp/product/reviews"
+STATS_PATH = "/__stats"
+
+TOTAL_COUNT_RE = re.compile(r'data-review-total-count="[^"]*"')
+REVIEW_ARTICLE_RE = re.compile(r'<article class="sdp-review__article__list[ "].*?</article>', re.S)
+
+BLOCKED_HTML = "<html><head><title>Access Denied</title></head><body>Access Denied</body></html>"
+
+
+class ReplayServer:
+    """캡처한 리뷰 페이지를 재생하는 aiohttp 서버
+
+    페이지 번호에 따라 캡처 파일을 순환하여 응답하며, 요청 수/상태 코드별 응답 수를 기록한다.
+    """
+
+    def __init__(self, pages: Sequence[str] = ("html.txt",), host: str = "127.0.0.1", port: int = 0,
+                 latency: Tuple[float, float] = (0.0, 0.0), error_rate: float = 0.0,
+                 block_rate: float = 0.0, review_count: Optional[int] = None, page_size: int = 5) -> None:
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.block_rate = block_rate
+        self.review_count = review_count
+        self.page_size = page_size
+
+        self.pages = []
+        for path in pages:
+            with open(path, 'r', encoding='utf-8') as f:
+                html = f.read()
+            if review_count is not None:
+                html = TOTAL_COUNT_RE.sub(f'data-review-total-count="{review_count}"', html)
+            self.pages.append(html.encode('utf-8'))
+        # 리뷰 수를 넘어선 페이지용 (리뷰 article 만 제거한 빈 페이지)
+        self.empty_page = REVIEW_ARTICLE_RE.sub("", self.pages[0].decode('utf-8')).encode('utf-8')
+
+        self.stats = Counter()
+        self.started_at = time.time()
+        self.runner = None
+
+    async def handle_reviews(self, request: web.Request) -> web.Response:
+        if self.latency[1] > 0:
+            await asyncio.sleep(random.uniform(*self.latency))
+
+        self.stats['requests'] += 1
+        roll = random.random()
+        if roll < self.block_rate:
+            self.stats['403'] += 1
+            return web.Response(status=403, text=BLOCKED_HTML, content_type="text/html")
+        if roll < self.block_rate + self.error_rate:
+            self.stats['503'] += 1
+            return web.Response(status=503, text="unavailable")
+
+        try:
+            page = max(1, int(request.query.get("page", 1)))
+        except ValueError:
+            page = 1
+
+        if self.review_count is not None and (page - 1) * self.page_size >= self.review_count:
+            body = self.empty_page
+            self.stats['empty'] += 1
+        else:
+            body = self.pages[(page - 1) % len(self.pages)]
+        self.stats['200'] += 1
+        return web.Response(body=body, content_type="text/html", charset="utf-8")
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.stats, 'uptime': time.time() - self.started_at})
+
+    async def handle_other(self, request: web.Request) -> web.Response:
+        # 메인/상품 페이지 등 세션 예열 요청용
+        return web.Response(text="<html><body>ok</body></html>", content_type="text/html")
+
+    async def start(self) -> str:
+        """서버 시작 후 기본 URL 반환"""
+        app = web.Application()
+        app.router.add_get(REVIEW_PATH, self.handle_reviews)
+        app.router.add_get(STATS_PATH, self.handle_stats)
+        app.router.add_route("*", "/{tail:.*}", self.handle_other)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return f"http://{self.host}:{self.port}"
+
+    async def stop(self) -> None:
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def serve_forever(self, ready=None) -> None:
+        base_url = await self.start()
+        if ready is not None:
+            ready.send(base_url)
+            ready.close()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+
+def _serve(ready, kwargs: Dict) -> None:
+    try:
+        asyncio.run(ReplayServer(**kwargs).serve_forever(ready))
+    except KeyboardInterrupt:
+        pass
+
+
+def start_in_process(**kwargs) -> Tuple[multiprocessing.Process, str]:
+    """별도 프로세스에서 서버 실행 (측정 대상 프로세스의 CPU 사용량과 분리). (프로세스, 기본 URL) 반환"""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_serve, args=(sender, kwargs), daemon=True)
+    process.start()
+    sender.close()
+    if not receiver.poll(30):
+        process.terminate()
+        raise RuntimeError("재생 서버 시작 실패")
+    return process, receiver.recv()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
+    pages = sys.argv[2:] or ["html.txt"]
+    server = ReplayServer(pages, port=port)
+    print(f"[INFO] 재생 서버: http://127.0.0.1:{port}{REVIEW_PATH} (캡처 페이지 {len(pages)}개)")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,174 @@
+import re
+
+import lxml.html
+from lxml import etree
+
+# 리뷰 article 선택용 XPath (모듈 로드 시 1회 컴파일)
+ARTICLE_XPATH = etree.XPath(
+    "//article[contains(concat(' ', normalize-space(@class), ' '), ' sdp-review__article__list ')]"
+)
+
+# 리뷰 총 개수 (ratingSummary 영역의 hidden 값)
+TOTAL_COUNT_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' js_reviewArticleTotalCountHiddenValue ')]"
+    "/@data-review-total-count"
+)
+
+# (태그, 클래스) -> 필드명. article 내부를 한 번만 순회하며 매칭한다
+# select_one 과 동일하게 문서 순서상 첫 번째 요소만 사용
+FIELD_SELECTORS = {
+    ("div", "sdp-review__article__list__info__product-info__reg-date"): "review_date",
+    ("span", "sdp-review__article__list__info__user__name"): "user_name",
+    ("div", "sdp-review__article__list__info__product-info__star-orange"): "rating",
+    ("div", "sdp-review__article__list__info__product-info__name"): "prod_name",
+    ("div", "sdp-review__article__list__headline"): "headline",
+    ("span", "sdp-review__article__list__survey__row__answer"): "answer",
+    ("div", "sdp-review__article__list__info__product-info__seller_name"): "seller_name",
+    ("span", "js_reviewArticleHelpfulCount"): "helpful_count",
+}
+REVIEW_CONTENT_CLASSES = {"sdp-review__article__list__review__content", "js_reviewArticleContent"}
+REVIEW_CONTAINER_CLASS = "sdp-review__article__list__review"
+ATTACHMENT_LIST_CLASS = "sdp-review__article__list__attachment__list"
+
+NEWLINE_TAB_RE = re.compile("[\n\t]")
+
+_parsers = {}
+
+
+def _get_parser(encoding: str) -> lxml.html.HTMLParser:
+    """인코딩별 lxml HTML 파서 (재사용)"""
+    parser = _parsers.get(encoding)
+    if parser is None:
+        parser = lxml.html.HTMLParser(encoding=encoding)
+        _parsers[encoding] = parser
+    return parser
+
+
+def _text(elem) -> str:
+    """BeautifulSoup 의 .text.strip() 과 동일한 텍스트 추출"""
+    return "".join(elem.itertext()).strip()
+
+
+def parse_document(html, encoding: str = "utf-8"):
+    """HTML 문자열 또는 bytes 를 lxml 문서로 파싱 (빈 문서면 None)"""
+    if not html:
+        return None
+    try:
+        if isinstance(html, bytes):
+            return lxml.html.document_fromstring(html, parser=_get_parser(encoding))
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def extract_article(article, empty_headline: str = "등록된 헤드라인이 없습니다",
+                    empty_content: str = "등록된 리뷰내용이 없습니다") -> dict:
+    """단일 리뷰 article 에서 데이터 추출 (한 번의 순회)"""
+    found = {}
+    content_elem = None
+    fallback_content_elem = None
+    images = set()
+
+    for elem in article.iter(etree.Element):
+        class_attr = elem.get("class")
+        if not class_attr:
+            continue
+        tag = elem.tag
+        classes = class_attr.split()
+
+        for cls in classes:
+            field = FIELD_SELECTORS.get((tag, cls))
+            if field and field not in found:
+                found[field] = elem
+
+        if tag != "div":
+            continue
+        if content_elem is None and REVIEW_CONTENT_CLASSES.issubset(classes):
+            content_elem = elem
+        elif fallback_content_elem is None and REVIEW_CONTAINER_CLASS in classes:
+            fallback_content_elem = elem.find("div")
+        if ATTACHMENT_LIST_CLASS in classes:
+            images.update(elem.iter("img"))
+
+    rating = 0
+    rating_elem = found.get("rating")
+    if rating_elem is not None and rating_elem.get("data-rating"):
+        try:
+            rating = int(rating_elem.get("data-rating"))
+        except (ValueError, TypeError):
+            rating = 0
+
+    if content_elem is None:
+        content_elem = fallback_content_elem
+    if content_elem is not None:
+        review_content = NEWLINE_TAB_RE.sub("", _text(content_elem))
+    else:
+        review_content = empty_content
+
+    def text_of(field, default):
+        elem = found.get(field)
+        return _text(elem) if elem is not None else default
+
+    seller_elem = found.get("seller_name")
+    if seller_elem is not None:
+        seller_name = _text(seller_elem).replace("판매자: ", "").strip()
+    else:
+        seller_name = "-"
+
+    return {
+        "prod_name": text_of("prod_name", "-"),
+        "review_date": text_of("review_date", "-"),
+        "user_name": text_of("user_name", "-"),
+        "rating": rating,
+        "headline": text_of("headline", empty_headline),
+        "review_content": review_content,
+        "answer": text_of("answer", "맛 평가 없음"),
+        "helpful_count": text_of("helpful_count", "0"),
+        "seller_name": seller_name,
+        "image_count": len(images),
+    }
+
+
+def extract_total_count(doc):
+    """리뷰 페이지 문서에서 전체 리뷰 수 추출 (없으면 None)"""
+    for value in TOTAL_COUNT_XPATH(doc):
+        try:
+            return int(str(value).replace(",", ""))
+        except ValueError:
+            continue
+    return None
+
+
+def parse_reviews(html, title=None, encoding: str = "utf-8",
+                  empty_headline: str = "등록된 헤드라인이 없습니다",
+                  empty_content: str = "등록된 리뷰내용이 없습니다") -> list:
+    """리뷰 페이지 HTML 에서 리뷰 목록 추출
+
+    Args:
+        html: 리뷰 페이지 HTML (str 또는 bytes)
+        title: 각 리뷰의 "title" 값 (None 이면 title 키를 넣지 않음)
+        encoding: bytes 입력일 때 사용할 인코딩
+        empty_headline / empty_content: 헤드라인/리뷰내용이 없을 때 기본값
+
+    Returns:
+        리뷰 dict 리스트 (기존 Coupang.fetch / extract_review_data 와 동일한 키)
+    """
+    reviews, _ = parse_reviews_with_total(html, title, encoding, empty_headline, empty_content)
+    return reviews
+
+
+def parse_reviews_with_total(html, title=None, encoding: str = "utf-8",
+                             empty_headline: str = "등록된 헤드라인이 없습니다",
+                             empty_content: str = "등록된 리뷰내용이 없습니다") -> tuple:
+    """parse_reviews 와 동일하되 (리뷰 목록, 전체 리뷰 수 또는 None) 반환"""
+    doc = parse_document(html, encoding=encoding)
+    if doc is None:
+        return [], None
+
+    reviews = []
+    for article in ARTICLE_XPATH(doc):
+        review = extract_article(article, empty_headline, empty_content)
+        if title is not None:
+            review = {"title": title, **review}
+        reviews.append(review)
+    return reviews, extract_total_count(doc)
@@ -0,0 +1,152 @@
+import json
+import os
+import re
+import threading
+import time
+
+from openpyxl import Workbook
+
+
+class StreamingReviewWriter:
+    """리뷰를 JSONL 저널에 append 하고, 상품 완료 시 xlsx 를 한 번만 생성하는 writer
+
+    - 리뷰 1건마다 워크북 전체를 저장하던 방식(O(N²))을 대체
+    - flush_rows 건 또는 flush_interval 초마다 저널을 디스크에 fsync (크래시 대비)
+    - finalize() 호출 시 openpyxl write-only 모드로 xlsx 생성
+    """
+
+    def __init__(self, dir_name: str, headers: list, keys: list,
+                 flush_rows: int = 50, flush_interval: float = 5.0, file_suffix: str = "",
+                 resume: bool = False, resume_rows=None) -> None:
+        self.dir_name = dir_name
+        self.file_suffix = file_suffix  # 파일명 뒤에 붙는 접미사 (증분 수집 결과 분리용)
+        self.resume = resume  # True 면 기존 저널에 이어서 기록 (체크포인트 재개용)
+        self.resume_rows = resume_rows  # 재개 시 남길 리뷰 수 (체크포인트 이후 기록은 다시 수집하므로 제거)
+        self.headers = headers
+        self.keys = keys
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+
+        self.journal_path = None
+        self.xlsx_path = None
+        self.row_count = 0
+
+        self._fp = None
+        self._pending = 0
+        self._last_flush = time.time()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def safe_file_name(title: str) -> str:
+        """파일명으로 사용할 수 없는 문자 치환"""
+        return re.sub(r'[<>:"/\\|?*]', '_', str(title))
+
+    def open(self, title: str) -> None:
+        """상품명 기준으로 저널 파일 열기 (resume 이 아니면 기존 저널은 덮어씀)"""
+        safe_title = self.safe_file_name(str(title) + self.file_suffix)
+        self.journal_path = os.path.join(self.dir_name, safe_title + ".jsonl")
+        self.xlsx_path = os.path.join(self.dir_name, safe_title + ".xlsx")
+
+        if self.resume and os.path.exists(self.journal_path):
+            self.row_count = self._repair_journal()
+            self._fp = open(self.journal_path, 'a', encoding='utf-8')
+            print(f"[INFO] 기존 저널에 이어서 기록: {self.journal_path} ({self.row_count}개 리뷰)")
+        else:
+            self._fp = open(self.journal_path, 'w', encoding='utf-8')
+        self._last_flush = time.time()
+
+    def _repair_journal(self) -> int:
+        """중단 시 잘린 마지막 줄과 resume_rows 이후의 리뷰를 제거하고 저장된 리뷰 수 반환"""
+        with open(self.journal_path, 'rb+') as f:
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            rows = data[:end].count(b"\n")
+            if self.resume_rows is not None and rows > self.resume_rows:
+                end = 0
+                for _ in range(self.resume_rows):
+                    end = data.index(b"\n", end) + 1
+                print(f"[INFO] 체크포인트 이후 기록된 리뷰 {rows - self.resume_rows}개 제거 (다시 수집)")
+                rows = self.resume_rows
+            if end != len(data):
+                f.truncate(end)
+        return rows
+
+    def append(self, datas: dict) -> None:
+        """리뷰 1건을 저널에 추가"""
+        with self._lock:
+            if self._fp is None:
+                self.open(datas["title"])
+
+            self._fp.write(json.dumps(datas, ensure_ascii=False) + "\n")
+            self.row_count += 1
+            self._pending += 1
+
+            if (self._pending >= self.flush_rows or
+                    time.time() - self._last_flush >= self.flush_interval):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """버퍼링된 저널 내용을 디스크에 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._fp is None:
+            return
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+        self._pending = 0
+        self._last_flush = time.time()
+
+    def iter_rows(self):
+        """저널에 기록된 리뷰를 순서대로 반환 (손상된 마지막 줄은 무시)"""
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"[WARNING] 손상된 저널 라인 무시: {self.journal_path}")
+
+    def finalize(self, keep_journal: bool = False):
+        """저널을 닫고 write-only 워크북으로 xlsx 를 한 번에 생성
+
+        Returns:
+            생성된 xlsx 경로 (저장된 리뷰가 없으면 None)
+        """
+        with self._lock:
+            if self._fp is None:
+                return None
+            self._flush_locked()
+            self._fp.close()
+            self._fp = None
+
+            if self.row_count == 0:
+                os.remove(self.journal_path)
+                return None
+
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.append(self.headers)
+            for datas in self.iter_rows():
+                ws.append([datas.get(key) for key in self.keys])
+            wb.save(filename=self.xlsx_path)
+            wb.close()
+
+            if not keep_journal:
+                os.remove(self.journal_path)
+
+            print(f"[INFO] 엑셀 파일 생성 완료: {self.xlsx_path} ({self.row_count}개 리뷰)")
+            return self.xlsx_path
+
+    def close(self) -> None:
+        """finalize 없이 저널만 닫기 (비정상 종료 시 저널 보존)"""
+        with self._lock:
+            if self._fp is not None:
+                self._flush_locked()
+                self._fp.close()
+                self._fp = None
@@ -0,0 +1,100 @@
+import time
+from collections import OrderedDict
+
+import requests as rq
+from requests.adapters import HTTPAdapter
+
+
+class ProxySessionPool:
+    """프록시별 requests.Session LRU 풀
+
+    - 같은 프록시로 가는 요청은 같은 Session 을 재사용 (커넥션 풀/TLS 재사용)
+    - 최대 max_sessions 개까지 유지, 초과 시 가장 오래 사용하지 않은 세션부터 종료
+    - idle_timeout 초 이상 사용하지 않은 세션은 정리
+    - 쿠키 jar 는 모든 세션이 참조로 공유 (요청마다 복사하지 않음)
+    """
+
+    def __init__(self, cookies=None, max_sessions: int = 32, idle_timeout: float = 300.0,
+                 pool_connections: int = 2, pool_maxsize: int = 4) -> None:
+        self.cookies = cookies if cookies is not None else rq.cookies.RequestsCookieJar()
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+
+        # proxy 문자열(None = 직접 연결) -> [session, last_used]
+        self.sessions = OrderedDict()
+
+    def _create_session(self, proxy_dict=None) -> rq.Session:
+        session = rq.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.cookies = self.cookies
+        if proxy_dict:
+            session.proxies.update(proxy_dict)
+        return session
+
+    def get(self, proxy=None, proxy_dict=None, headers=None) -> rq.Session:
+        """프록시에 해당하는 세션 반환 (없으면 생성)
+
+        headers 가 주어지면 세션 헤더를 해당 값으로 교체한다.
+        """
+        self.evict_idle()
+
+        entry = self.sessions.get(proxy)
+        if entry is None:
+            session = self._create_session(proxy_dict)
+            self.sessions[proxy] = [session, time.time()]
+            self._evict_overflow()
+        else:
+            session = entry[0]
+            entry[1] = time.time()
+            self.sessions.move_to_end(proxy)
+
+        if headers is not None:
+            session.headers.clear()
+            session.headers.update(headers)
+
+        return session
+
+    def _evict_overflow(self) -> None:
+        while len(self.sessions) > self.max_sessions:
+            proxy, (session, _) = self.sessions.popitem(last=False)
+            self._close_session(session)
+
+    def evict_idle(self) -> None:
+        """idle_timeout 이상 사용되지 않은 세션 종료"""
+        now = time.time()
+        # OrderedDict 는 사용 순서대로 정렬되어 있으므로 앞쪽부터 확인
+        while self.sessions:
+            proxy, (session, last_used) = next(iter(self.sessions.items()))
+            if now - last_used < self.idle_timeout:
+                break
+            del self.sessions[proxy]
+            self._close_session(session)
+
+    def discard(self, proxy) -> None:
+        """특정 프록시의 세션 제거 (프록시 차단/실패 시)"""
+        entry = self.sessions.pop(proxy, None)
+        if entry:
+            self._close_session(entry[0])
+
+    @staticmethod
+    def _close_session(session: rq.Session) -> None:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+    def close_all(self) -> None:
+        """모든 세션 종료"""
+        while self.sessions:
+            _, (session, _) = self.sessions.popitem()
+            self._close_session(session)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
@@ -0,0 +1,185 @@
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from crawl_state import atomic_write_json, load_json
+
+UA_POOL_CACHE = "ua_pool.json"
+UA_POOL_MAX_AGE = 7 * 24 * 3600
+
+# Windows 관련 키워드들 (소문자)
+WINDOWS_KEYWORDS = (
+    'windows nt', 'win32', 'win64', 'wow64', 'windows 10', 'windows 11',
+    'windows 7', 'windows 8', 'microsoft windows',
+)
+
+# fake_useragent 브라우저 이름 -> 분류
+BROWSER_GROUPS = {
+    'chrome': ('Chrome', 'Chrome Mobile', 'Chrome Mobile iOS', 'Google'),
+    'firefox': ('Firefox', 'Firefox Mobile', 'Firefox iOS'),
+    'safari': ('Safari', 'Mobile Safari', 'Mobile Safari UI/WKWebView'),
+}
+
+DEFAULT_MAC_UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+DEFAULT_MAC_SAFARI_UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15"
+DEFAULT_ANDROID_UA = "Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+
+# (User-Agent, sec-ch-ua-platform, sec-ch-ua-mobile)
+UAEntry = Tuple[str, str, str]
+
+
+def is_windows_ua(user_agent: str) -> bool:
+    """User-Agent가 Windows인지 확인"""
+    if not user_agent:
+        return True
+    user_agent_lower = user_agent.lower()
+    return any(keyword in user_agent_lower for keyword in WINDOWS_KEYWORDS)
+
+
+def client_hints(user_agent: str) -> Tuple[str, str]:
+    """User-Agent에 맞는 (sec-ch-ua-platform, sec-ch-ua-mobile) 값"""
+    if 'iPhone' in user_agent or 'iPad' in user_agent:
+        return '"iOS"', "?1" if 'iPhone' in user_agent else "?0"
+    if 'Android' in user_agent:
+        return '"Android"', "?1"
+    if 'Macintosh' in user_agent or 'Mac OS X' in user_agent:
+        return '"macOS"', "?0"
+    if 'Linux' in user_agent:
+        return '"Linux"', "?0"
+    # 기본값은 macOS로 설정 (Windows 방지)
+    return '"macOS"', "?0"
+
+
+def browser_group(browser: str, user_agent: str) -> str:
+    """브라우저 분류 (chrome / firefox / safari / other)"""
+    for group, names in BROWSER_GROUPS.items():
+        if browser in names:
+            return group
+    # 브라우저 이름이 없는 경우(랜덤 샘플링 결과) UA 문자열로 판단
+    if not browser:
+        if 'Firefox/' in user_agent or 'FxiOS' in user_agent:
+            return 'firefox'
+        if 'Chrome/' in user_agent or 'CriOS' in user_agent:
+            return 'chrome'
+        if 'Safari/' in user_agent and 'Version/' in user_agent:
+            return 'safari'
+    return 'other'
+
+
+class UAPool:
+    """Windows를 제외한 User-Agent 풀 (시작 시 1회 구성, 요청마다 O(1) 랜덤 선택)
+
+    - fake_useragent 데이터 전체를 한 번에 필터링하여 분류별(전체/chrome/firefox/safari/모바일/Mac 데스크톱) 목록 구성
+    - UA 별 sec-ch-ua-platform / sec-ch-ua-mobile 값을 미리 계산
+    - 구성 결과는 ua_pool.json 에 캐시하여 fake_useragent 버전이 같고 max_age 이내면 재사용
+    """
+
+    _shared = None
+
+    def __init__(self, entries: List[Tuple[str, str]]) -> None:
+        """entries: [(User-Agent, 브라우저 분류)]"""
+        self.groups: Dict[str, List[UAEntry]] = {
+            'random': [], 'chrome': [], 'firefox': [], 'safari': [], 'mobile': [], 'desktop': [],
+        }
+        self.entries: List[Tuple[str, str]] = []  # 중복/Windows 제외 후 (User-Agent, 브라우저 분류)
+        seen = set()
+        for user_agent, group in entries:
+            if user_agent in seen or is_windows_ua(user_agent):
+                continue
+            seen.add(user_agent)
+            self.entries.append((user_agent, group))
+
+            entry = (user_agent, *client_hints(user_agent))
+            self.groups['random'].append(entry)
+            if group in self.groups:
+                self.groups[group].append(entry)
+            if any(keyword in user_agent for keyword in ('Mobile', 'Android', 'iPhone', 'iPad')):
+                self.groups['mobile'].append(entry)
+            elif 'Macintosh' in user_agent:
+                self.groups['desktop'].append(entry)
+
+    def __len__(self) -> int:
+        return len(self.groups['random'])
+
+    def pick(self, group: str = 'random') -> UAEntry:
+        """분류에서 랜덤 선택 (비어 있으면 기본 UA)"""
+        entries = self.groups.get(group) or self.groups['random']
+        if entries:
+            return random.choice(entries)
+        fallback = DEFAULT_ANDROID_UA if group == 'mobile' else DEFAULT_MAC_UA
+        return (fallback, *client_hints(fallback))
+
+    @staticmethod
+    def collect(sample_size: int = 300) -> List[Tuple[str, str]]:
+        """fake_useragent 에서 (User-Agent, 브라우저 분류) 목록 수집"""
+        from fake_useragent import UserAgent
+
+        ua = UserAgent()
+        data = getattr(ua, 'data_browsers', None)
+        if data:
+            # 전체 데이터를 기본 필터(브라우저/플랫폼)와 Windows 제외 조건으로 한 번에 거름
+            browsers = set(getattr(ua, 'browsers', []) or [])
+            platforms = set(getattr(ua, 'platforms', []) or [])
+            return [
+                (item['useragent'], browser_group(item.get('browser', ''), item['useragent']))
+                for item in data
+                if item.get('os') != 'Windows'
+                and (not browsers or item.get('browser') in browsers)
+                and (not platforms or item.get('type') in platforms)
+            ]
+
+        # 데이터 목록을 노출하지 않는 버전: 랜덤 샘플링으로 구성
+        entries = []
+        for _ in range(sample_size):
+            try:
+                user_agent = ua.random
+            except Exception as e:
+                print(f"[WARNING] User-Agent 생성 오류: {e}")
+                break
+            entries.append((user_agent, browser_group('', user_agent)))
+        return entries
+
+    @classmethod
+    def load(cls, cache_path: Optional[str] = UA_POOL_CACHE, max_age: float = UA_POOL_MAX_AGE):
+        """캐시 우선으로 풀 로드 (없거나 오래되었으면 새로 구성 후 저장)"""
+        try:
+            from importlib.metadata import version
+            source_version = version('fake-useragent')
+        except Exception:
+            source_version = ""
+
+        if cache_path:
+            cached = load_json(cache_path, None, "User-Agent 풀 캐시")
+            if (isinstance(cached, dict) and cached.get('source_version') == source_version
+                    and time.time() - cached.get('created_at', 0) < max_age and cached.get('entries')):
+                pool = cls([tuple(entry) for entry in cached['entries']])
+                print(f"[INFO] User-Agent 풀 캐시 사용: {len(pool)}개 ({cache_path})")
+                return pool
+
+        started = time.time()
+        try:
+            entries = cls.collect()
+        except Exception as e:
+            print(f"[WARNING] User-Agent 풀 구성 실패, 기본 UA 사용: {e}")
+            entries = [(DEFAULT_MAC_UA, 'chrome'), (DEFAULT_MAC_SAFARI_UA, 'safari'), (DEFAULT_ANDROID_UA, 'chrome')]
+
+        pool = cls(entries)
+        print(f"[INFO] User-Agent 풀 구성: {len(pool)}개 ({time.time() - started:.2f}초)")
+
+        if cache_path and len(pool) > 3:
+            try:
+                atomic_write_json(cache_path, {
+                    'source_version': source_version,
+                    'created_at': time.time(),
+                    'entries': [list(entry) for entry in pool.entries],
+                })
+            except OSError as e:
+                print(f"[WARNING] User-Agent 풀 캐시 저장 실패: {e}")
+        return pool
+
+    @classmethod
+    def shared(cls):
+        """프로세스 내 공유 풀 (처음 호출 시 1회 로드)"""
+        if cls._shared is None:
+            cls._shared = cls.load()
+        return cls._shared